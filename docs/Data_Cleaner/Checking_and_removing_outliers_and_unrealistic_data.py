@@ -5,18 +5,38 @@
 detect_and_remove_outliers.py
 
 This script detects and removes outliers from Parquet files in a given directory.
-It uses both Z-Score and IQR methods to identify outliers and saves clean and outlier data separately.
+It uses both Z-Score and IQR methods to identify outliers, flags physically unrealistic rows
+with the drilling_processor plausibility rules, and saves clean and outlier data separately.
 
 Author: mahdis
 Date: [1404-03-03]
 """
 
 import os
+import sys
 import glob
 import pandas as pd
 import numpy as np
 from scipy import stats
 
+# ایندکس زمان/عمق پکیج drilling_processor برای خواندن بازه‌ای (اختیاری)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             '..', 'oil_well_analytics', 'drilling_data_processor'))
+try:
+    from drilling_processor.storage.index import read_range
+except ImportError:
+    read_range = None
+try:
+    from drilling_processor.preprocessors.plausibility import PlausibilityChecker
+except ImportError:
+    PlausibilityChecker = None
+
+# Continuous sensor columns written by datasets/generator.py
+DEFAULT_COLUMNS_TO_CHECK = [
+    'Reservoir_Temperature', 'Pressure_Reservoir', 'Formation_Permeability', 'In_Rate_Flow_Mud',
+    'Depth_Measured', 'Chloride_Content', 'Mud_Weight_In'
+]
+
 def detect_and_remove_outliers(
     folder_path: str,
     output_clean_path: str,
@@ -24,7 +44,11 @@ def detect_and_remove_outliers(
     columns_to_check: list = None,
     z_threshold: float = 3,
     iqr_multiplier: float = 1.5,
-    verbose: bool = True
+    verbose: bool = True,
+    time_range: tuple = None,
+    depth_range: tuple = None,
+    well_id: int = None,
+    check_plausibility: bool = True
 ):
     """
     Detects and removes outliers from Parquet files in the specified folder.
@@ -34,16 +58,20 @@ def detect_and_remove_outliers(
         output_clean_path (str): Directory to save cleaned data files.
         output_outliers_path (str): Directory to save outlier data files.
         columns_to_check (list, optional): List of columns to check for outliers.
-                                           Defaults to common drilling data features.
+                                           Defaults to `DEFAULT_COLUMNS_TO_CHECK`; missing
+                                           columns are reported and skipped.
         z_threshold (float, optional): Z-Score threshold for outlier detection. Defaults to 3.
         iqr_multiplier (float, optional): Multiplier for IQR method. Defaults to 1.5.
         verbose (bool, optional): Whether to print progress information. Defaults to True.
+        time_range (tuple, optional): (start, end) on `DateTime`; only matching rows are read.
+        depth_range (tuple, optional): (min, max) on `Depth_Measured`; only matching rows are read.
+        well_id (int, optional): Only read rows of this `API_Well_ID`.
+        check_plausibility (bool, optional): Also treat rows violating physical limits,
+                                             cross-column or phase rules as outliers.
     """
     if columns_to_check is None:
-        columns_to_check = [
-            'temperature', 'pressure', 'permeability', 'flow_rate',
-            'depth', 'porosity', 'salinity', 'mud_weight'
-        ]
+        columns_to_check = DEFAULT_COLUMNS_TO_CHECK
+    checker = PlausibilityChecker() if check_plausibility and PlausibilityChecker is not None else None
 
     # Create output directories if they don't exist
     os.makedirs(output_clean_path, exist_ok=True)
@@ -61,22 +89,30 @@ def detect_and_remove_outliers(
             print(f"\n🔍 Processing file: {file_name}")
 
         try:
-            df = pd.read_parquet(file_path)
+            if time_range is None and depth_range is None and well_id is None:
+                df = pd.read_parquet(file_path)
+            elif read_range is not None:
+                # Uses the sidecar index to read only the row groups covering the range
+                df = read_range(file_path, time_range=time_range,
+                                depth_range=depth_range, well_id=well_id)
+            else:
+                raise ImportError("drilling_processor is required for range reads")
 
             # Check for missing columns
             missing_cols = [col for col in columns_to_check if col not in df.columns]
-            if missing_cols:
-                if verbose:
-                    print(f"⚠️ Missing columns in {file_name}: {missing_cols}")
+            if missing_cols and verbose:
+                print(f"⚠️ Missing columns in {file_name}: {missing_cols}")
+            present_cols = [col for col in columns_to_check if col in df.columns]
+            if not present_cols:
                 continue
 
             # Z-Score method
-            z_scores = np.abs(stats.zscore(df[columns_to_check], nan_policy='omit'))
+            z_scores = np.abs(stats.zscore(df[present_cols], nan_policy='omit'))
             outliers_zscore = (z_scores > z_threshold)
 
             # IQR method
-            outliers_iqr = pd.DataFrame(False, index=df.index, columns=columns_to_check)
-            for col in columns_to_check:
+            outliers_iqr = pd.DataFrame(False, index=df.index, columns=present_cols)
+            for col in present_cols:
                 Q1 = df[col].quantile(0.25)
                 Q3 = df[col].quantile(0.75)
                 IQR = Q3 - Q1
@@ -88,6 +124,13 @@ def detect_and_remove_outliers(
             outliers_combined = outliers_zscore | outliers_iqr
             any_outlier = outliers_combined.any(axis=1)
 
+            # Physically unrealistic rows (limits, cross-column and phase rules)
+            if checker is not None:
+                unrealistic = checker.mask(df)
+                any_outlier |= unrealistic
+                if verbose:
+                    print(f"🧪 {file_name}: {int(unrealistic.sum())} physically unrealistic rows.")
+
             # Separate clean and outlier data
             df_outliers = df[any_outlier]
             df_clean = df[~any_outlier]
@@ -0,0 +1,8 @@
+"""
+Performance Benchmarks
+
+Standalone scripts that time the processing and inference stack on synthetic
+well data. Run from the package root, e.g.:
+
+    python -m benchmarks.bench_onnx_inference
+"""
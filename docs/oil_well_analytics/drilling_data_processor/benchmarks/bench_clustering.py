@@ -0,0 +1,57 @@
+"""
+مقیاس‌پذیری خوشه‌بندی الگوهای آسیب با تعداد سطر (آموزش + خروجی هر چاه)
+
+ستون rows exponent شیب log(زمان) نسبت به log(تعداد سطر) است؛ مقدار نزدیک ۱ یعنی
+رشد خطی. در حالت density هزینه DBSCAN به اندازه نمونه وابسته است و با تعداد سطر
+ثابت می‌ماند.
+
+    python -m benchmarks.bench_clustering --rows 100000 1000000 4000000 --method kmeans density
+"""
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.common import synthetic_well_frame
+from drilling_processor.pipelines.clustering import DamagePatternClusterer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=lambda v: int(float(v)), nargs='+',
+                        default=[100_000, 400_000, 1_600_000])
+    parser.add_argument('--method', nargs='+', default=['kmeans', 'density'])
+    parser.add_argument('--wells', type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        print(f"{'method':>8} {'rows':>10} {'fit s':>8} {'export s':>9} {'rows/s':>11} {'clusters':>9}")
+        for method in args.method:
+            timings = []
+            for rows in args.rows:
+                input_dir = tmp / f'input_{rows}'
+                if not input_dir.exists():
+                    input_dir.mkdir()
+                    for well in range(args.wells):
+                        synthetic_well_frame(well, rows // args.wells, seed=well).to_parquet(
+                            input_dir / f'well_{well}.parquet', index=False
+                        )
+                clusterer = DamagePatternClusterer(method=method)
+                start = time.perf_counter()
+                clusterer.fit(input_dir)
+                fitted = time.perf_counter()
+                clusterer.export(input_dir, tmp / f'clusters_{method}_{rows}')
+                done = time.perf_counter()
+                timings.append(done - start)
+                print(f"{method:>8} {rows:>10} {fitted - start:>8.2f} {done - fitted:>9.2f} "
+                      f"{rows / (done - start):>11.0f} {len(clusterer.centroids_):>9}")
+            if len(args.rows) > 1:
+                exponent = np.polyfit(np.log(args.rows), np.log(timings), 1)[0]
+                print(f"{method:>8} rows exponent: {exponent:.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+هزینه پایش رانش در مسیر پردازش: زمان `DriftMonitor.update` برای هر دسته و `check`
+
+    python -m benchmarks.bench_drift --batch-rows 100 10000 100000 --wells 10
+"""
+import argparse
+import time
+
+from benchmarks.common import time_call
+from drilling_processor.monitoring.drift import DriftMonitor, ReferenceProfile
+from drilling_processor.schema import WELL_ID_COLUMN
+from drilling_processor.synthetic.generator import SyntheticWellGenerator
+from drilling_processor.utils.loggers import ProcessingLogger
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--batch-rows', type=int, nargs='+', default=[100, 10000, 100000])
+    parser.add_argument('--wells', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    wells = [(40100000 + i, -94.8, 32.2) for i in range(args.wells)]
+    rows = max(args.batch_rows) // args.wells + 1
+    train = SyntheticWellGenerator(wells=wells, records_per_well=rows, seed=1).to_pandas()
+    live = SyntheticWellGenerator(wells=wells, records_per_well=rows, seed=2).to_pandas()
+    live = live.sample(frac=1.0, random_state=0, ignore_index=True)
+
+    start = time.perf_counter()
+    profile = ReferenceProfile.from_frame(train)
+    print(f"profile: {len(profile.features)} features from {len(train)} rows in {time.perf_counter() - start:.3f}s")
+
+    logger = ProcessingLogger()
+    print(f"\n{'batch rows':>10} {'group':>6} {'update ms':>10} {'rows/s':>12} {'check ms':>9} {'state KB':>9}")
+    for batch_rows in args.batch_rows:
+        batch = live.iloc[:batch_rows]
+        for group in (None, WELL_ID_COLUMN):
+            monitor = DriftMonitor(profile, min_rows=1, group_column=group, logger=logger)
+            update = time_call(lambda: monitor.update(batch), args.repeat)
+            check = time_call(monitor.check, args.repeat)
+            state = sum(counts.nbytes for features in monitor._counts.values() for counts, _ in features.values())
+            print(f"{batch_rows:>10} {'well' if group else 'none':>6} {update * 1e3:>10.2f} "
+                  f"{batch_rows / update:>12.0f} {check * 1e3:>9.2f} {state / 1024:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+اعتبارسنجی متقاطع گروهی: cross_val_score ساده در برابر `WellGroupedEvaluator`
+
+حالت ساده برای هر (کاندید، fold) کل پایپ‌لاین (شامل `ColumnTransformer`) را
+دوباره برازش می‌کند؛ ارزیابی‌گر ماتریس‌های هر fold را یک بار می‌سازد و در
+اجرای دوم (کش گرم) فقط مدل‌ها را آموزش می‌دهد.
+
+    python -m benchmarks.bench_evaluation --wells 6 --rows-per-well 20000 --workers 1 4
+"""
+import argparse
+import tempfile
+import time
+
+from sklearn.model_selection import GroupKFold, ParameterGrid, cross_val_score
+
+from drilling_processor.pipelines.evaluation import WellGroupedEvaluator
+from drilling_processor.pipelines.ml_pipeline import build_ml_pipeline
+from drilling_processor.schema import NUMERIC_FEATURES, CATEGORICAL_FEATURES, TARGET_COLUMN, WELL_ID_COLUMN
+from drilling_processor.synthetic.generator import SyntheticWellGenerator
+
+
+def naive_cv(df, grid, n_splits: int, workers: int) -> float:
+    start = time.perf_counter()
+    for params in ParameterGrid(grid):
+        model = build_ml_pipeline(NUMERIC_FEATURES, CATEGORICAL_FEATURES)
+        model.set_params(**{f'classifier__{k}': v for k, v in params.items()})
+        cross_val_score(model, df, df[TARGET_COLUMN], groups=df[WELL_ID_COLUMN],
+                        cv=GroupKFold(n_splits), scoring='f1_macro', n_jobs=workers)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--wells', type=int, default=6)
+    parser.add_argument('--rows-per-well', type=int, default=20000)
+    parser.add_argument('--n-splits', type=int, default=3)
+    parser.add_argument('--n-estimators', type=int, nargs='+', default=[10, 30])
+    parser.add_argument('--workers', type=int, nargs='+', default=[1])
+    args = parser.parse_args()
+
+    wells = [(40100000 + i, -94.8, 32.2) for i in range(args.wells)]
+    df = SyntheticWellGenerator(wells=wells, records_per_well=args.rows_per_well).to_pandas()
+    grid = {'n_estimators': args.n_estimators, 'max_depth': [12]}
+
+    print(f"{'workers':>7} {'naive s':>9} {'cold s':>9} {'warm s':>9} {'prepare s':>10}")
+    for workers in args.workers:
+        naive = naive_cv(df, grid, args.n_splits, workers)
+        with tempfile.TemporaryDirectory() as cache:
+            timings = []
+            for _ in range(2):
+                evaluator = WellGroupedEvaluator(n_splits=args.n_splits, workers=workers, cache_dir=cache)
+                start = time.perf_counter()
+                report = evaluator.evaluate(df, grid)
+                timings.append(time.perf_counter() - start)
+            prepare = sum(f['prepare_seconds'] for f in evaluator.meta_['folds'])
+        print(f"{workers:>7} {naive:>9.2f} {timings[0]:>9.2f} {timings[1]:>9.2f} {prepare:>10.2f}")
+    print(report['summary'].to_string(index=False))
+
+
+if __name__ == '__main__':
+    main()
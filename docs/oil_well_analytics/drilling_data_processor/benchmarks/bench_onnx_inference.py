@@ -0,0 +1,52 @@
+"""
+مقایسه تأخیر و توان عملیاتی پیش‌بینی sklearn و ONNX Runtime روی CPU
+
+    python -m benchmarks.bench_onnx_inference --train-rows 20000 --threads 1
+"""
+import argparse
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.common import synthetic_feature_frame, time_call
+from drilling_processor.schema import NUMERIC_FEATURES, CATEGORICAL_FEATURES, TARGET_COLUMN
+from drilling_processor.pipelines.ml_pipeline import build_ml_pipeline
+from drilling_processor.pipelines.onnx_export import (
+    export_pipeline_to_onnx,
+    OnnxDamagePredictor
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--train-rows', type=int, default=20_000)
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 100, 10_000, 100_000])
+    parser.add_argument('--threads', type=int, default=None, help='intra-op threads for ORT')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    train = synthetic_feature_frame(args.train_rows, seed=0)
+    pipeline = build_ml_pipeline(NUMERIC_FEATURES, CATEGORICAL_FEATURES)
+    pipeline.fit(train, train[TARGET_COLUMN])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = export_pipeline_to_onnx(
+            pipeline, NUMERIC_FEATURES, CATEGORICAL_FEATURES, Path(tmp) / 'damage.onnx'
+        )
+        predictor = OnnxDamagePredictor(model_path, intra_op_threads=args.threads)
+
+        print(f"{'batch':>8} {'sklearn ms':>12} {'onnx ms':>10} {'sklearn rows/s':>15} "
+              f"{'onnx rows/s':>12} {'speedup':>8} {'parity':>7}")
+        for batch_size in args.batch_sizes:
+            batch = synthetic_feature_frame(batch_size, seed=1)
+            sk_time = time_call(lambda: pipeline.predict_proba(batch), args.repeat)
+            ort_time = time_call(lambda: predictor.predict_proba(batch), args.repeat)
+            parity = np.mean(predictor.predict(batch) == pipeline.predict(batch))
+            print(f"{batch_size:>8} {sk_time * 1e3:>12.2f} {ort_time * 1e3:>10.2f} "
+                  f"{batch_size / sk_time:>15.0f} {batch_size / ort_time:>12.0f} "
+                  f"{sk_time / ort_time:>7.1f}x {parity:>7.3f}")
+
+
+if __name__ == '__main__':
+    main()
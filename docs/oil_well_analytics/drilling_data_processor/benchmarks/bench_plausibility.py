@@ -0,0 +1,60 @@
+"""
+غربالگری امکان‌پذیری فیزیکی: ارزیابی قاعده به قاعده با pandas در برابر گذر
+برداری `PlausibilityChecker` و اجرای موازی آن بین چاه‌ها
+
+    python -m benchmarks.bench_plausibility --wells 8 --rows-per-well 250000 --workers 1 4
+"""
+import argparse
+
+import pandas as pd
+
+from benchmarks.common import time_call
+from drilling_processor.preprocessors.plausibility import (
+    CONSISTENCY_RULES, PHASE_LIMITS, PHYSICAL_LIMITS, PlausibilityChecker
+)
+from drilling_processor.schema import PHASE_COLUMN, WELL_ID_COLUMN
+from drilling_processor.synthetic.generator import SyntheticWellGenerator
+
+
+def pandas_rules(df):
+    """مسیر مرسوم: یک سری بولی pandas برای هر قاعده و هر چاه"""
+    counts = {}
+    for well, group in df.groupby(WELL_ID_COLUMN, sort=False, observed=True):
+        well_counts = {}
+        for col, (min_val, max_val) in PHYSICAL_LIMITS.items():
+            well_counts[f'{col} min'] = int((group[col] < min_val).sum())
+            well_counts[f'{col} max'] = int((group[col] > max_val).sum())
+        for left, op, right in CONSISTENCY_RULES:
+            bad = group[left] >= group[right] if op == '<' else group[left] > group[right]
+            well_counts[f'{left} {op} {right}'] = int(bad.sum())
+        for phase, limits in PHASE_LIMITS.items():
+            in_phase = group[PHASE_COLUMN] == phase
+            for col, (min_val, max_val) in limits.items():
+                well_counts[f'{col} {phase}'] = int((in_phase & ((group[col] < min_val) | (group[col] > max_val))).sum())
+        counts[well] = well_counts
+    return pd.DataFrame.from_dict(counts, orient='index')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--wells', type=int, default=8)
+    parser.add_argument('--rows-per-well', type=int, default=250_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    wells = [(40100000 + i, -94.8, 32.2) for i in range(args.wells)]
+    df = SyntheticWellGenerator(wells=wells, records_per_well=args.rows_per_well, seed=1).to_pandas()
+    checker = PlausibilityChecker()
+    print(f"{len(df)} rows, {len(checker.compile(list(df.columns)).rules)} rules, {args.wells} wells")
+
+    baseline = time_call(lambda: pandas_rules(df), args.repeat)
+    print(f"\n{'path':>16} {'seconds':>9} {'rows/s':>12} {'speedup':>8}")
+    print(f"{'pandas per rule':>16} {baseline:>9.3f} {len(df) / baseline:>12.0f} {1.0:>8.1f}")
+    for workers in args.workers:
+        seconds = time_call(lambda: checker.screen(df, workers=workers), args.repeat)
+        print(f"{f'compiled x{workers}':>16} {seconds:>9.3f} {len(df) / seconds:>12.0f} {baseline / seconds:>8.1f}")
+
+
+if __name__ == '__main__':
+    main()
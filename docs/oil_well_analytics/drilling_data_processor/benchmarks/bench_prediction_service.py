@@ -0,0 +1,118 @@
+"""
+بنچمارک بار محلی سرویس پیش‌بینی با و بدون micro-batching
+
+سرور در یک پردازه جداگانه اجرا می‌شود و مولد بار با N اتصال keep-alive
+هم‌زمان رکوردهای تکی ارسال می‌کند.
+
+    python -m benchmarks.bench_prediction_service --concurrency 1 16 64 --duration 5
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing as mp
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.common import synthetic_feature_frame
+from drilling_processor.schema import NUMERIC_FEATURES, CATEGORICAL_FEATURES, TARGET_COLUMN
+from drilling_processor.pipelines.ml_pipeline import build_ml_pipeline
+
+
+def _serve(model_path, max_batch_size, max_latency_ms, port_queue):
+    from drilling_processor.serving import MicroBatcher, PredictionServer, load_model, make_predict_fn, make_record_validator
+
+    async def run():
+        model = load_model(model_path)
+        batcher = MicroBatcher(make_predict_fn(model), max_batch_size, max_latency_ms,
+                               validate_fn=make_record_validator(model))
+        server = PredictionServer(batcher, port=0)
+        await server.start()
+        port_queue.put(server.port)
+        await asyncio.Event().wait()
+
+    asyncio.run(run())
+
+
+async def _client(port, records, deadline, latencies):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    i = 0
+    while time.perf_counter() < deadline:
+        body = json.dumps(records[i % len(records)]).encode()
+        start = time.perf_counter()
+        writer.write(
+            f"POST /predict HTTP/1.1\r\nHost: bench\r\nContent-Length: {len(body)}\r\n\r\n".encode()
+            + body
+        )
+        head = await reader.readuntil(b'\r\n\r\n')
+        length = int(head.lower().split(b'content-length:')[1].split(b'\r\n')[0])
+        await reader.readexactly(length)
+        latencies.append(time.perf_counter() - start)
+        i += 1
+    writer.close()
+
+
+async def _load(port, records, concurrency, duration):
+    latencies = []
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(_client(port, records, deadline, latencies) for _ in range(concurrency)))
+    return latencies
+
+
+def _run_case(model_path, records, max_batch_size, max_latency_ms, concurrency, duration):
+    port_queue = mp.Queue()
+    proc = mp.Process(target=_serve, args=(model_path, max_batch_size, max_latency_ms, port_queue))
+    proc.start()
+    try:
+        port = port_queue.get(timeout=60)
+        latencies = asyncio.run(_load(port, records, concurrency, duration))
+    finally:
+        proc.terminate()
+        proc.join()
+    lat = np.array(latencies) * 1e3
+    return len(lat) / duration, np.percentile(lat, 50), np.percentile(lat, 99)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--train-rows', type=int, default=20_000)
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 16, 64])
+    parser.add_argument('--duration', type=float, default=5.0)
+    parser.add_argument('--max-batch-size', type=int, default=64)
+    parser.add_argument('--max-latency-ms', type=float, default=5.0)
+    parser.add_argument('--onnx', action='store_true', help='serve the ONNX export')
+    args = parser.parse_args()
+
+    train = synthetic_feature_frame(args.train_rows, seed=0)
+    pipeline = build_ml_pipeline(NUMERIC_FEATURES, CATEGORICAL_FEATURES)
+    pipeline.fit(train, train[TARGET_COLUMN])
+    records = json.loads(
+        synthetic_feature_frame(1000, seed=1)[NUMERIC_FEATURES + CATEGORICAL_FEATURES]
+        .to_json(orient='records')
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.onnx:
+            from drilling_processor.pipelines.onnx_export import export_pipeline_to_onnx
+            model_path = export_pipeline_to_onnx(
+                pipeline, NUMERIC_FEATURES, CATEGORICAL_FEATURES, Path(tmp) / 'damage.onnx'
+            )
+        else:
+            import joblib
+            model_path = Path(tmp) / 'damage.joblib'
+            joblib.dump(pipeline, model_path)
+
+        print(f"{'mode':>10} {'clients':>8} {'req/s':>10} {'p50 ms':>9} {'p99 ms':>9}")
+        for concurrency in args.concurrency:
+            for mode, batch_size in (('single', 1), ('batched', args.max_batch_size)):
+                rps, p50, p99 = _run_case(
+                    model_path, records, batch_size, args.max_latency_ms,
+                    concurrency, args.duration
+                )
+                print(f"{mode:>10} {concurrency:>8} {rps:>10.0f} {p50:>9.2f} {p99:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""
+انتقال داده به workerها: pickle کردن دیتافریم هر چاه در برابر دستگیره حافظه مشترک
+
+در حالت pickle هر کار کل سطرهای چاه را با خود می‌برد؛ در حالت shared داده یک
+بار روی /dev/shm نوشته می‌شود و هر کار فقط یک `SharedFrame` دریافت می‌کند.
+
+    python -m benchmarks.bench_shared_memory --wells 8 --rows 1e5 1e6 --workers 4
+"""
+import argparse
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+import pyarrow as pa
+
+from benchmarks.common import synthetic_well_frame, time_call
+from drilling_processor.schema import WELL_ID_COLUMN
+from drilling_processor.storage.shared import SharedStore, map_wells, well_slices
+
+
+def well_mean(df: pd.DataFrame) -> float:
+    """کار سبک هر چاه تا هزینه انتقال داده غالب باشد"""
+    return float(df['Fluid_Loss_API'].mean())
+
+
+def run_pickled(df: pd.DataFrame, workers: int) -> dict:
+    with ProcessPoolExecutor(workers) as pool:
+        futures = {well: pool.submit(well_mean, group) for well, group in df.groupby(WELL_ID_COLUMN)}
+        return {well: future.result() for well, future in futures.items()}
+
+
+def task_bytes(df: pd.DataFrame) -> tuple:
+    """اندازه pickle یک کار در هر دو حالت (بایت)"""
+    well = df[WELL_ID_COLUMN].iloc[0]
+    pickled = len(pickle.dumps(df[df[WELL_ID_COLUMN] == well]))
+    _, slices = well_slices(pa.Table.from_pandas(df, preserve_index=False))
+    with SharedStore() as store:
+        handle = store.put_frame(df)
+        shared = len(pickle.dumps(handle.slice(*slices[0][1:])))
+    return pickled, shared
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--wells', type=int, default=8)
+    parser.add_argument('--rows', type=float, nargs='+', default=[1e5, 1e6])
+    parser.add_argument('--workers', type=int, default=4)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'pickle s':>9} {'shared s':>9} {'speedup':>8} {'task KB (pickle/shared)':>26}")
+    for rows in (int(r) for r in args.rows):
+        per_well = rows // args.wells
+        df = pd.concat(
+            [synthetic_well_frame(40100000 + i, per_well, seed=i) for i in range(args.wells)],
+            ignore_index=True
+        )
+        pickled = time_call(lambda: run_pickled(df, args.workers), args.repeat)
+        shared = time_call(lambda: map_wells(well_mean, df, workers=args.workers), args.repeat)
+        pickled_bytes, shared_bytes = task_bytes(df)
+        print(f"{rows:>10} {pickled:>9.3f} {shared:>9.3f} {pickled / shared:>7.1f}x "
+              f"{pickled_bytes / 1024:>14.1f} / {shared_bytes / 1024:.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+زمان راه‌اندازی: import پکیج در پردازه تازه و آماده‌شدن worker‌های spawn
+
+حالت lazy رفتار فعلی است (زیرماژول‌ها و scikit-learn در اولین استفاده import
+می‌شوند)؛ حالت eager همه نام‌های عمومی و همه imputerها را مثل نسخه قبلی
+پکیج در ابتدا بارگذاری می‌کند.
+
+    python -m benchmarks.bench_startup --repeat 5 --workers 1 4
+"""
+import argparse
+import multiprocessing
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[1]
+
+SCENARIOS = {
+    'import (lazy)': "import drilling_processor",
+    'processor ready (lazy)': (
+        "from drilling_processor import DrillingDataProcessor; "
+        "DrillingDataProcessor('well.parquet')"
+    ),
+    'import + init (eager)': (
+        "import drilling_processor as d; [getattr(d, n) for n in d.__all__]; "
+        "c = d.DataCleaner(); [c._get_imputer(s) for s in ('median', 'mean', 'knn', 'iterative')]; "
+        "d.DrillingDataProcessor('well.parquet')"
+    )
+}
+
+
+def _load_everything():
+    import drilling_processor
+    for name in drilling_processor.__all__:
+        getattr(drilling_processor, name)
+    cleaner = drilling_processor.DataCleaner()
+    for strategy in ('median', 'mean', 'knn', 'iterative'):
+        cleaner._get_imputer(strategy)
+
+
+def _warm_worker(mode: str) -> int:
+    """کار هر worker: آماده‌سازی پاک‌ساز و لاگر (در حالت eager همه چیز)"""
+    if mode == 'eager':
+        _load_everything()
+    import drilling_processor
+    drilling_processor.DataCleaner()
+    drilling_processor.ProcessingLogger()
+    return os.getpid()
+
+
+def time_subprocess(code: str, cwd: str, repeat: int) -> float:
+    """میانه زمان اجرای `python -c code` در پردازه تازه (ثانیه)"""
+    env = dict(os.environ, PYTHONPATH=str(PACKAGE_ROOT))
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], cwd=cwd, env=env, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def time_worker_pool(mode: str, workers: int) -> float:
+    """زمان ساخت pool با روش spawn تا پایان یک کار روی هر worker (ثانیه)"""
+    ctx = multiprocessing.get_context('spawn')
+    start = time.perf_counter()
+    with ctx.Pool(workers) as pool:
+        pool.map(_warm_worker, [mode] * workers, chunksize=1)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 4])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'scenario':<26} {'median s':>10}")
+        for name, code in SCENARIOS.items():
+            print(f"{name:<26} {time_subprocess(code, tmp, args.repeat):>10.3f}")
+
+        # logs/ ساخته‌شده توسط ProcessingLogger در پوشه موقت می‌ماند
+        cwd = os.getcwd()
+        os.chdir(tmp)
+        try:
+            print(f"\n{'workers':>7} {'lazy s':>9} {'eager s':>9} {'speedup':>8}")
+            for workers in args.workers:
+                lazy = min(time_worker_pool('lazy', workers) for _ in range(args.repeat))
+                eager = min(time_worker_pool('eager', workers) for _ in range(args.repeat))
+                print(f"{workers:>7} {lazy:>9.3f} {eager:>9.3f} {eager / lazy:>7.1f}x")
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+بنچمارک موتور جریانی: بازپخش هم‌زمان چند چاه با سرعت N برابر زمان واقعی
+
+نرخ لازم برای هر اجرا `wells × speed` رکورد در ثانیه است؛ اگر نرخ پردازش
+به آن برسد و تأخیر p99 محدود بماند، موتور بار را تحمل کرده است.
+
+    python -m benchmarks.bench_streaming --wells 10 --speed 1 60 600 --duration 10
+"""
+import argparse
+import asyncio
+import tempfile
+from pathlib import Path
+
+from benchmarks.common import synthetic_feature_frame, synthetic_well_frame
+from drilling_processor.schema import NUMERIC_FEATURES, CATEGORICAL_FEATURES, TARGET_COLUMN
+from drilling_processor.pipelines.ml_pipeline import build_ml_pipeline
+from drilling_processor.streaming import StreamingEngine, replay_directory
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--wells', type=int, default=10)
+    parser.add_argument('--rows-per-well', type=int, default=20_000)
+    parser.add_argument('--speed', type=float, nargs='+', default=[1, 60, 600])
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--train-rows', type=int, default=20_000)
+    parser.add_argument('--onnx', action='store_true', help='score with the ONNX export')
+    args = parser.parse_args()
+
+    train = synthetic_feature_frame(args.train_rows, seed=0)
+    model = build_ml_pipeline(NUMERIC_FEATURES, CATEGORICAL_FEATURES)
+    model.fit(train, train[TARGET_COLUMN])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        if args.onnx:
+            from drilling_processor.pipelines.onnx_export import (
+                export_pipeline_to_onnx,
+                OnnxDamagePredictor
+            )
+            model = OnnxDamagePredictor(export_pipeline_to_onnx(
+                model, NUMERIC_FEATURES, CATEGORICAL_FEATURES, tmp / 'damage.onnx'
+            ))
+        for well in range(args.wells):
+            synthetic_well_frame(well, args.rows_per_well, seed=well + 1).to_parquet(
+                tmp / f'well_{well}.parquet'
+            )
+
+        print(f"{'speed':>7} {'required/s':>11} {'achieved/s':>11} {'p50 ms':>9} "
+              f"{'p99 ms':>9} {'alerts':>7} {'sustained':>10}")
+        for speed in args.speed:
+            engine = StreamingEngine(model)
+            summary = asyncio.run(engine.run(replay_directory(tmp, speed), args.duration))
+            required = args.wells * speed
+            # در سرعت‌های بالا ممکن است فایل زودتر از duration تمام شود
+            sustained = summary['records_per_s'] >= 0.95 * min(
+                required, args.wells * args.rows_per_well / summary['elapsed_s']
+            )
+            print(f"{speed:>7.0f} {required:>11.0f} {summary['records_per_s']:>11.0f} "
+                  f"{summary['latency_p50_ms']:>9.1f} {summary['latency_p99_ms']:>9.1f} "
+                  f"{summary['alerts']:>7} {str(sustained):>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+ساخت دسته‌های پنجره لغزان برای مدل‌های توالی: برش پنجره‌ها از دیتافریم pandas
+در برابر `WindowDataset` روی فروشگاه memory-map
+
+    python -m benchmarks.bench_tensor_store --wells 4 --rows-per-well 250000 --window 128
+"""
+import argparse
+import tempfile
+import time
+
+import numpy as np
+
+from drilling_processor.schema import NUMERIC_FEATURES, WELL_ID_COLUMN
+from drilling_processor.storage.tensor_store import TensorStore, WindowDataset
+from drilling_processor.synthetic.generator import SyntheticWellGenerator
+
+
+def pandas_batches(df, window, batch_size, batches, seed):
+    """مسیر مرسوم: نرمال‌سازی و پرکردن در pandas و برش `iloc` برای هر پنجره"""
+    rng = np.random.default_rng(seed)
+    features = df[NUMERIC_FEATURES]
+    features = ((features - features.mean()) / features.std()).groupby(df[WELL_ID_COLUMN]).ffill().fillna(0)
+    starts = np.flatnonzero(df[WELL_ID_COLUMN].shift(-(window - 1)).eq(df[WELL_ID_COLUMN]))
+    for _ in range(batches):
+        picked = rng.choice(starts, batch_size)
+        X = np.stack([features.iloc[s:s + window].to_numpy(dtype=np.float32) for s in picked])
+        y = df['Type_Damage'].iloc[picked + window - 1].to_numpy()
+        yield X, y
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--wells', type=int, default=4)
+    parser.add_argument('--rows-per-well', type=int, default=250_000)
+    parser.add_argument('--window', type=int, default=128)
+    parser.add_argument('--batch-size', type=int, default=256)
+    parser.add_argument('--batches', type=int, default=50)
+    args = parser.parse_args()
+
+    wells = [(40100000 + i, -94.8, 32.2) for i in range(args.wells)]
+    generator = SyntheticWellGenerator(wells=wells, records_per_well=args.rows_per_well, seed=1)
+    df = generator.to_pandas()
+    samples = args.batch_size * args.batches
+    print(f"{len(df)} rows, {len(NUMERIC_FEATURES)} features, window {args.window}, {samples} windows")
+
+    start = time.perf_counter()
+    for _ in pandas_batches(df, args.window, args.batch_size, args.batches, seed=0):
+        pass
+    pandas_seconds = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        store = TensorStore.build(generator, directory)
+        build_seconds = time.perf_counter() - start
+
+        dataset = WindowDataset(store, window=args.window, batch_size=args.batch_size, seed=0)
+        batches = iter(dataset)
+        start = time.perf_counter()
+        for _ in range(args.batches):
+            next(batches)
+        store_seconds = time.perf_counter() - start
+        batches.close()
+
+    print(f"\n{'path':>12} {'seconds':>9} {'windows/s':>12}")
+    print(f"{'pandas':>12} {pandas_seconds:>9.3f} {samples / pandas_seconds:>12.0f}")
+    print(f"{'tensor store':>12} {store_seconds:>9.3f} {samples / store_seconds:>12.0f}")
+    print(f"\nstore build (one-off): {build_seconds:.3f}s, speedup {pandas_seconds / store_seconds:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
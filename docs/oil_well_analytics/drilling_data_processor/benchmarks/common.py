@@ -0,0 +1,58 @@
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# اجرای اسکریپت‌ها از ریشه پکیج بدون نیاز به نصب
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from drilling_processor.schema import (  # noqa: E402
+    NUMERIC_FEATURES,
+    CATEGORICAL_FEATURES,
+    TARGET_COLUMN,
+    NO_DAMAGE_LABEL,
+    WELL_ID_COLUMN,
+    TIME_COLUMN
+)
+
+CATEGORY_LEVELS = {
+    'Phase_Operation': ['Drilling', 'Completion', 'Production'],
+    'Formation_Type': ['Shale', 'Limestone', 'Sandstone'],
+    'Clay_Mineralogy_Type': ['Kaolinite', 'Illite', 'Montmorillonite'],
+    'Completion_Type': ['Cased', 'Open Hole', 'Liner'],
+    'Mud_Type': ['Water-based', 'Oil-based', 'Synthetic']
+}
+
+
+def synthetic_feature_frame(n_rows: int, seed: int = 42) -> pd.DataFrame:
+    """دیتافریم تصادفی با ستون‌های ویژگی مدل آسیب و برچسب ساده"""
+    rng = np.random.default_rng(seed)
+    data = {col: rng.normal(size=n_rows) for col in NUMERIC_FEATURES}
+    for col in CATEGORICAL_FEATURES:
+        data[col] = rng.choice(CATEGORY_LEVELS[col], size=n_rows)
+    df = pd.DataFrame(data)
+    df[TARGET_COLUMN] = np.where(
+        df['Fluid_Loss_API'] > 1.0, 'Fluid Loss',
+        np.where(df['Clay_Content_Percent'] > 1.0, 'Clay & Iron Control', NO_DAMAGE_LABEL)
+    )
+    return df
+
+
+def synthetic_well_frame(well_id: int, n_rows: int, seed: int = 42) -> pd.DataFrame:
+    """دیتافریم یک چاه با شناسه چاه و برچسب زمانی ۱ ثانیه‌ای"""
+    df = synthetic_feature_frame(n_rows, seed)
+    df.insert(0, WELL_ID_COLUMN, well_id)
+    df.insert(1, TIME_COLUMN, pd.date_range('2023-01-01', periods=n_rows, freq='s'))
+    return df
+
+
+def time_call(func, repeat: int = 5) -> float:
+    """کمترین زمان اجرای `func` در `repeat` تکرار (ثانیه)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
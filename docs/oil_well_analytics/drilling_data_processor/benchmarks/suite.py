@@ -0,0 +1,321 @@
+"""
+مجموعه بنچمارک تکرارپذیر پشته پردازش داده‌های حفاری
+
+برای هر تعداد سطر، داده یک چاه با `SyntheticWellGenerator` (منطق `datasets/generator.py`)
+در حافظه ساخته می‌شود و این مراحل زمان‌سنجی می‌شوند:
+    generation, add_missing_and_noise, detect_and_remove_outliers,
+    processor.<stage>[<backend>] (load/clean/outliers/features/quality),
+    model.train, model.predict
+
+مراحل موازی (آشکارساز داده پرت و مدل) برای هر تعداد worker تکرار می‌شوند.
+اوج حافظه هر مرحله در یک اجرای جداگانه با tracemalloc اندازه‌گیری می‌شود
+(حافظه بافرهای Arrow را شامل نمی‌شود).
+
+    python -m benchmarks.suite --rows 10000 100000 --workers 1 2 4 --output results.json
+    python -m benchmarks.suite --rows 10000 --save-baseline benchmarks/baseline.json
+    python -m benchmarks.suite --rows 10000 --baseline benchmarks/baseline.json --tolerance 0.25
+"""
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+import sklearn
+
+from benchmarks.common import time_call
+from drilling_processor.core import DrillingDataProcessor
+from drilling_processor.schema import (
+    NUMERIC_FEATURES,
+    CATEGORICAL_FEATURES,
+    TARGET_COLUMN,
+    PROCESSOR_COLUMN_ALIASES
+)
+from drilling_processor.pipelines.ml_pipeline import build_ml_pipeline
+from drilling_processor.synthetic.generator import SyntheticWellGenerator
+
+REPO_ROOT = Path(__file__).resolve().parents[4]
+PROCESSOR_STAGES = [
+    ('clean', '_clean_data', '_clean_table'),
+    ('outliers', '_handle_outliers', '_handle_table_outliers'),
+    ('features', '_engineer_features', '_engineer_table_features'),
+    ('quality', '_check_quality', '_check_table_quality')
+]
+# ستون‌های بررسی‌شده در `detect_and_remove_outliers` (پیش‌فرض اسکریپت در خروجی generator وجود ندارد)
+OUTLIER_SCRIPT_COLUMNS = [
+    'Reservoir_Temperature', 'Pressure_Reservoir', 'Formation_Permeability',
+    'In_Rate_Flow_Mud', 'Depth_Measured', 'Mud_Weight_In'
+]
+
+
+def load_script(relative_path: str):
+    """بارگذاری اسکریپت‌های خارج از پکیج (datasets/ و docs/Data_Cleaner/) به صورت ماژول"""
+    path = REPO_ROOT / relative_path
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def peak_memory(func: Callable) -> int:
+    """اوج حافظه تخصیص‌یافته پایتون/numpy در یک اجرای `func` (بایت)"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def measure(stage: str, rows: int, workers: int, func: Callable, repeat: int,
+            track_memory: bool) -> Dict[str, Any]:
+    seconds = time_call(func, repeat)
+    record = {
+        'stage': stage,
+        'rows': rows,
+        'workers': workers,
+        'seconds': seconds,
+        'rows_per_s': rows / seconds if seconds > 0 else None,
+        'peak_mb': peak_memory(func) / 2 ** 20 if track_memory else None
+    }
+    peak = '' if record['peak_mb'] is None else f"{record['peak_mb']:.1f}"
+    print(f"{stage:<34} {rows:>10} {workers:>7} {seconds:>10.4f} "
+          f"{record['rows_per_s'] or 0:>13.0f} {peak:>9}", flush=True)
+    return record
+
+
+def processor_frame(df: pd.DataFrame, seed: int) -> pd.DataFrame:
+    """
+    تبدیل خروجی generator به نام ستون‌های `DrillingDataProcessor`
+
+    `Flow_Rate_bbl_day` و `Porosity_pct` در generator وجود ندارند؛ برای اجرای
+    مرحله ساخت ویژگی از دبی خروجی گل و تخلخل تصادفی استفاده می‌شود.
+    """
+    rng = np.random.default_rng(seed)
+    frame = df.rename(columns=PROCESSOR_COLUMN_ALIASES)
+    frame['Flow_Rate_bbl_day'] = frame['Out_Rate_Flow_Mud']
+    frame['Porosity_pct'] = rng.uniform(5, 30, len(frame))
+    return frame
+
+
+def processor_stages(path: Path, backend: str, workers: int, seed: int) -> List[tuple]:
+    """
+    مراحل `DrillingDataProcessor` به صورت فراخوانی‌های مستقل
+
+    وضعیت ورودی هر مرحله یک بار با اجرای مراحل قبلی ساخته می‌شود و پیش از هر
+    تکرار بازگردانده می‌شود تا هر مرحله جداگانه زمان‌سنجی شود.
+    """
+    config = {'backend': backend, 'n_jobs': workers, 'random_state': seed}
+    attribute = '_table' if backend == 'arrow' else '_data'
+
+    def load():
+        DrillingDataProcessor(str(path), config).load_data()
+
+    stages = [('load', load)]
+    processor = DrillingDataProcessor(str(path), config)
+    processor.load_data()
+    for name, pandas_step, arrow_step in PROCESSOR_STAGES:
+        step = getattr(processor, arrow_step if backend == 'arrow' else pandas_step)
+        state = getattr(processor, attribute)
+
+        def run(step=step, state=state):
+            setattr(processor, attribute, state)
+            step()
+
+        stages.append((name, run))
+        step()
+    return stages
+
+
+def run_suite(args) -> List[Dict[str, Any]]:
+    add_missing = load_script('datasets/add_missing.py')
+    outlier_script = load_script(
+        'docs/Data_Cleaner/Checking_and_removing_outliers_and_unrealistic_data.py'
+    )
+    well_id = SyntheticWellGenerator().scenario.well_ids[0]
+    results = []
+
+    print(f"{'stage':<34} {'rows':>10} {'workers':>7} {'seconds':>10} {'rows/s':>13} {'peak MB':>9}")
+    for rows in args.rows:
+        def bench(stage, func, workers=1, repeat=args.repeat):
+            results.append(measure(stage, rows, workers, func, repeat, not args.no_memory))
+
+        generator = SyntheticWellGenerator(records_per_well=rows, seed=args.seed)
+        bench('generation', lambda: generator.to_pandas(wells=[well_id]), repeat=1)
+        df = generator.to_pandas(wells=[well_id])
+        bench('add_missing_and_noise', lambda: add_missing.add_missing_and_noise(df), repeat=1)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            (tmp / 'input').mkdir()
+            df.to_parquet(tmp / 'input' / f'well_{well_id}.parquet', index=False)
+            bench('detect_and_remove_outliers', lambda: outlier_script.detect_and_remove_outliers(
+                str(tmp / 'input'), str(tmp / 'clean'), str(tmp / 'outliers'),
+                columns_to_check=OUTLIER_SCRIPT_COLUMNS, verbose=False
+            ))
+
+            processor_path = tmp / 'processor.parquet'
+            processor_frame(df, args.seed).to_parquet(processor_path, index=False)
+            for workers in args.workers:
+                for backend in args.backends:
+                    for name, func in processor_stages(processor_path, backend, workers, args.seed):
+                        # فقط مرحله داده پرت از n_jobs استفاده می‌کند
+                        if name != 'outliers' and workers != args.workers[0]:
+                            continue
+                        bench(f'processor.{name}[{backend}]', func,
+                              workers if name == 'outliers' else 1)
+
+        train = df.iloc[:args.train_rows] if args.train_rows else df
+        for workers in args.workers:
+            model = build_ml_pipeline(NUMERIC_FEATURES, CATEGORICAL_FEATURES)
+            model.set_params(classifier__n_jobs=workers, classifier__random_state=args.seed)
+            bench('model.train', lambda: model.fit(train, train[TARGET_COLUMN]), workers, repeat=1)
+            bench('model.predict', lambda: model.predict(df), workers)
+    return results
+
+
+def scaling_curves(results: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    منحنی‌های مقیاس‌پذیری هر مرحله
+
+    rows_exponent: شیب log(زمان) نسبت به log(تعداد سطر) با کمترین worker (۱ یعنی خطی)
+    speedup: نسبت زمان با کمترین worker به زمان با هر تعداد worker در بزرگ‌ترین اندازه
+    """
+    curves = {}
+    frame = pd.DataFrame(results)
+    for stage, group in frame.groupby('stage', sort=False):
+        base_workers = group['workers'].min()
+        by_rows = group[group['workers'] == base_workers].sort_values('rows')
+        curve = {'rows': by_rows['rows'].tolist(), 'seconds': by_rows['seconds'].tolist()}
+        if len(by_rows) > 1 and (by_rows['seconds'] > 0).all():
+            curve['rows_exponent'] = float(np.polyfit(
+                np.log(by_rows['rows']), np.log(by_rows['seconds']), 1
+            )[0])
+        largest = group[group['rows'] == group['rows'].max()].sort_values('workers')
+        if len(largest) > 1:
+            base = largest['seconds'].iloc[0]
+            curve['speedup'] = {
+                int(w): float(base / s) for w, s in zip(largest['workers'], largest['seconds'])
+            }
+        curves[stage] = curve
+    return curves
+
+
+def compare_to_baseline(
+    results: List[Dict[str, Any]],
+    baseline: List[Dict[str, Any]],
+    tolerance: float = 0.25,
+    min_seconds: float = 0.005
+) -> List[Dict[str, Any]]:
+    """
+    مقایسه با نتایج ذخیره‌شده؛ مراحلی که بیش از `tolerance` (نسبی) و `min_seconds`
+    (مطلق، برای حذف نویز مراحل خیلی کوتاه) کندتر شده‌اند برگردانده می‌شوند
+    """
+    reference = {(r['stage'], r['rows'], r['workers']): r['seconds'] for r in baseline}
+    regressions = []
+    for record in results:
+        before = reference.get((record['stage'], record['rows'], record['workers']))
+        if before is None:
+            continue
+        now = record['seconds']
+        if now > before * (1 + tolerance) and now - before > min_seconds:
+            regressions.append({
+                'stage': record['stage'],
+                'rows': record['rows'],
+                'workers': record['workers'],
+                'baseline_s': before,
+                'current_s': now,
+                'ratio': now / before
+            })
+    return regressions
+
+
+def environment() -> Dict[str, Any]:
+    import pyarrow
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'pyarrow': pyarrow.__version__,
+        'scikit-learn': sklearn.__version__
+    }
+
+
+def plot_curves(curves: Dict[str, Dict[str, Any]], file_path: str):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    fig, ax = plt.subplots(figsize=(9, 6))
+    for stage, curve in curves.items():
+        ax.loglog(curve['rows'], curve['seconds'], marker='o', label=stage)
+    ax.set_xlabel('rows')
+    ax.set_ylabel('seconds')
+    ax.legend(fontsize='small')
+    fig.tight_layout()
+    fig.savefig(file_path)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=lambda v: int(float(v)), nargs='+',
+                        default=[10_000, 100_000], help='e.g. 1e4 1e5 1e6 1e7')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1])
+    parser.add_argument('--backends', nargs='+', default=['pandas', 'arrow'],
+                        choices=['pandas', 'arrow'])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--train-rows', type=int, default=200_000,
+                        help='cap on training rows (0 = all rows)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--no-memory', action='store_true', help='skip the tracemalloc pass')
+    parser.add_argument('--output', help='write results and scaling curves as JSON')
+    parser.add_argument('--plot', help='write a log-log scaling plot (needs matplotlib)')
+    parser.add_argument('--baseline', help='baseline JSON to compare against')
+    parser.add_argument('--save-baseline', help='write these results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    args = parser.parse_args(argv)
+    args.workers = sorted(set(args.workers))
+
+    results = run_suite(args)
+    curves = scaling_curves(results)
+    report = {'environment': environment(), 'args': vars(args), 'results': results,
+              'curves': curves}
+
+    print(f"\n{'stage':<34} {'rows exponent':>14} {'speedup':>30}")
+    for stage, curve in curves.items():
+        exponent = curve.get('rows_exponent')
+        speedup = ' '.join(f'{w}:{s:.2f}x' for w, s in curve.get('speedup', {}).items())
+        print(f"{stage:<34} {'' if exponent is None else f'{exponent:.2f}':>14} {speedup:>30}")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2))
+    if args.plot:
+        plot_curves(curves, args.plot)
+    if args.save_baseline:
+        Path(args.save_baseline).write_text(json.dumps(report, indent=2))
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare_to_baseline(results, baseline['results'], args.tolerance)
+        if regressions:
+            print(f"\n⚠️ {len(regressions)} regression(s) against {args.baseline}:")
+            for r in regressions:
+                print(f"  {r['stage']} rows={r['rows']} workers={r['workers']}: "
+                      f"{r['baseline_s']:.4f}s -> {r['current_s']:.4f}s ({r['ratio']:.2f}x)")
+            return 1
+        print(f"\n✅ No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,25 +2,29 @@
 Drilling Data Processor Package
 
 A comprehensive toolkit for oilfield drilling data preprocessing and feature engineering.
+
+Public names are resolved lazily: `import drilling_processor` does not import
+scikit-learn or the ML pipeline modules until one of their names is used.
 """
 
-from .core import DrillingDataProcessor
-from .preprocessors.cleaners import DataCleaner
-from .preprocessors.outliers import OutlierDetector
-from .preprocessors.feature_engine import FeatureEngineer
-from .preprocessors.quality import QualityChecker
-from .pipelines.ml_pipeline import build_ml_pipeline
-from .utils.validators import DataValidator
-from .utils.loggers import ProcessingLogger
+from ._lazy import lazy_exports
 
 __version__ = "0.1.0"
-__all__ = [
-    'DrillingDataProcessor',
-    'DataCleaner',
-    'OutlierDetector',
-    'FeatureEngineer',
-    'QualityChecker',
-    'build_ml_pipeline',
-    'DataValidator',
-    'ProcessingLogger'
-]
\ No newline at end of file
+
+_EXPORTS = {
+    'DrillingDataProcessor': '.core',
+    'DataCleaner': '.preprocessors.cleaners',
+    'OutlierDetector': '.preprocessors.outliers',
+    'FeatureEngineer': '.preprocessors.feature_engine',
+    'QualityChecker': '.preprocessors.quality',
+    'PlausibilityChecker': '.preprocessors.plausibility',
+    'build_ml_pipeline': '.pipelines.ml_pipeline',
+    'export_pipeline_to_onnx': '.pipelines.onnx_export',
+    'OnnxDamagePredictor': '.pipelines.onnx_export',
+    'SyntheticWellGenerator': '.synthetic.generator',
+    'DataValidator': '.utils.validators',
+    'ProcessingLogger': '.utils.loggers'
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,29 @@
+import importlib
+import sys
+from typing import Callable, Dict, Tuple
+
+
+def lazy_exports(package: str, exports: Dict[str, str]) -> Tuple[Callable, Callable]:
+    """
+    ساخت `__getattr__` و `__dir__` یک پکیج برای import زیرماژول‌ها در اولین دسترسی (PEP 562)
+
+    پارامترها:
+        package: نام پکیج (`__name__`)
+        exports: نام صادرشده → زیرماژول نسبی (مثلاً {'DataCleaner': '.preprocessors.cleaners'})
+
+    مثال:
+        __getattr__, __dir__ = lazy_exports(__name__, {'DataCleaner': '.cleaners'})
+    """
+    def __getattr__(name: str):
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        # دسترسی‌های بعدی مستقیماً از دیکشنری پکیج خوانده می‌شوند
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
@@ -0,0 +1,15 @@
+"""
+Execution Backends
+
+Contains:
+- arrow_backend: DrillingDataProcessor steps on pyarrow.Table with Arrow compute kernels
+"""
+
+from .._lazy import lazy_exports
+
+_EXPORTS = {
+    'ArrowBackend': '.arrow_backend'
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
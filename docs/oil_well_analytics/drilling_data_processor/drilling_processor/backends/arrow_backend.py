@@ -0,0 +1,221 @@
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+_ROW_COLUMN = '__row'
+
+
+def _is_numeric(data_type: pa.DataType) -> bool:
+    return pa.types.is_integer(data_type) or pa.types.is_floating(data_type)
+
+
+def _is_categorical(data_type: pa.DataType) -> bool:
+    return (pa.types.is_string(data_type) or pa.types.is_large_string(data_type)
+            or pa.types.is_dictionary(data_type))
+
+
+class ArrowBackend:
+    def __init__(self):
+        """
+        اجرای مراحل `DrillingDataProcessor` مستقیماً روی `pyarrow.Table`
+
+        ستون‌هایی که تغییر نمی‌کنند بدون کپی در جدول خروجی باقی می‌مانند
+        (جدول‌های Arrow تغییرناپذیرند و فقط ستون‌های جدید جایگزین می‌شوند).
+        فیلتر سطرها، پرکردن مقادیر گم‌شده، ویژگی‌های نسبتی و شمارش null با
+        کرنل‌های `pyarrow.compute` انجام می‌شود و تبدیل به pandas فقط در لبه API
+        (`DrillingDataProcessor.run_pipeline`) رخ می‌دهد.
+        """
+        self.history = []
+
+    # ------------------------------------------------------------------ بارگذاری
+    def load(self, file_path: Union[str, Path], columns: Optional[List[str]] = None) -> pa.Table:
+        """خواندن فایل پارکت با memory map"""
+        return pq.read_table(file_path, columns=columns, memory_map=True)
+
+    def cast_types(self, table: pa.Table, dtypes: Dict[str, str]) -> pa.Table:
+        """تبدیل ستون‌ها به نوع‌های مورد انتظار `DataValidator` (float32 / category)"""
+        for col, dtype in dtypes.items():
+            if col not in table.column_names:
+                continue
+            index = table.column_names.index(col)
+            column = table[col]
+            if dtype == 'category' and not pa.types.is_dictionary(column.type):
+                table = table.set_column(index, col, pc.dictionary_encode(column))
+            elif dtype != 'category' and column.type != pa.from_numpy_dtype(np.dtype(dtype)):
+                table = table.set_column(index, col, column.cast(pa.from_numpy_dtype(np.dtype(dtype))))
+        return table
+
+    def validate(self, table: pa.Table, dtypes: Dict[str, str]):
+        """اعتبارسنجی معادل `DataValidator.validate_input_data` روی schema جدول"""
+        missing_cols = [col for col in dtypes if col not in table.column_names]
+        if missing_cols:
+            return False, f"Missing required columns: {missing_cols}"
+        type_errors = []
+        for col, dtype in dtypes.items():
+            column_type = table.schema.field(col).type
+            ok = (pa.types.is_dictionary(column_type) if dtype == 'category'
+                  else column_type == pa.from_numpy_dtype(np.dtype(dtype)))
+            if not ok:
+                type_errors.append(f"{col} should be {dtype} but found {column_type}")
+        if type_errors:
+            return False, "Type errors:\n" + "\n".join(type_errors)
+        return True, "Data validation passed"
+
+    # ------------------------------------------------------------------ پاک‌سازی
+    @staticmethod
+    def _nan_to_null(column: pa.ChunkedArray) -> pa.ChunkedArray:
+        """در ستون‌های اعشاری NaN مثل مقدار گم‌شده در نظر گرفته می‌شود"""
+        if pa.types.is_floating(column.type) and pc.any(pc.is_nan(column)).as_py():
+            return pc.if_else(pc.is_nan(column), pa.scalar(None, column.type), column)
+        return column
+
+    def handle_missing_values(self, table: pa.Table, strategy: str = 'median') -> pa.Table:
+        """
+        پرکردن مقادیر گم‌شده معادل `DataCleaner.handle_missing_values`
+
+        ستون‌های عددی با میانه/میانگین و ستون‌های متنی با رایج‌ترین مقدار پر
+        می‌شوند؛ ستون‌های بدون مقدار گم‌شده دست‌نخورده (بدون کپی) می‌مانند.
+        """
+        if strategy not in ('median', 'mean'):
+            raise ValueError(f"❌ خطا: استراتژی ایمپوت '{strategy}' در backend آرو پشتیبانی نمی‌شود!")
+
+        for index, field in enumerate(table.schema):
+            column = table.column(index)
+            if _is_numeric(field.type):
+                column = self._nan_to_null(column)
+                if column.null_count == 0:
+                    continue
+                if strategy == 'median':
+                    value = pc.quantile(column, q=0.5)[0].as_py()
+                else:
+                    value = pc.mean(column).as_py()
+                if value is None:
+                    continue  # ستون کاملاً خالی
+                filled = pc.fill_null(column, pa.scalar(value).cast(field.type, safe=False))
+                self.history.append(f"Column '{field.name}' imputed with {strategy}")
+            elif _is_categorical(field.type) and column.null_count > 0:
+                counts = pc.value_counts(column)
+                if len(counts) == 0:
+                    continue
+                mode = counts.field('values')[pc.index(counts.field('counts'),
+                                                       pc.max(counts.field('counts'))).as_py()]
+                filled = pc.fill_null(column, mode.as_py())
+                self.history.append(f"Categorical column '{field.name}' imputed with mode")
+            else:
+                continue
+            table = table.set_column(index, field.name, filled)
+        return table
+
+    def remove_duplicates(self, table: pa.Table) -> pa.Table:
+        """حذف سطرهای تکراری با حفظ اولین occurrence (group_by روی همه ستون‌ها)"""
+        if table.num_rows == 0:
+            return table
+        with_row = table.append_column(_ROW_COLUMN, pa.array(np.arange(table.num_rows)))
+        first = with_row.group_by(table.column_names, use_threads=False).aggregate(
+            [(_ROW_COLUMN, 'min')]
+        )[f'{_ROW_COLUMN}_min']
+        removed = table.num_rows - len(first)
+        self.history.append(f"Removed {removed} duplicate rows")
+        if removed == 0:
+            return table
+        return table.take(pc.take(first, pc.sort_indices(first)))
+
+    # ------------------------------------------------------------------ داده پرت
+    @staticmethod
+    def numeric_matrix(table: pa.Table) -> np.ndarray:
+        """ماتریس ستون‌های عددی برای آشکارسازهای sklearn (تنها نقطه کپی داده)"""
+        columns = [
+            table.column(i).to_numpy() for i, field in enumerate(table.schema)
+            if _is_numeric(field.type)
+        ]
+        return np.column_stack(columns) if columns else np.empty((table.num_rows, 0))
+
+    @staticmethod
+    def filter_rows(table: pa.Table, keep_mask: np.ndarray) -> pa.Table:
+        """نگه‌داشتن سطرهای `keep_mask`"""
+        return table.filter(pa.array(keep_mask, type=pa.bool_()))
+
+    # ------------------------------------------------------------------ ویژگی‌ها
+    @staticmethod
+    def _replace_or_append(table: pa.Table, name: str, values) -> pa.Table:
+        if name in table.column_names:
+            return table.set_column(table.column_names.index(name), name, values)
+        return table.append_column(name, values)
+
+    def add_pt_ratio(self, table: pa.Table) -> pa.Table:
+        """نسبت فشار به دما (معادل `FeatureEngineer.add_pt_ratio`)"""
+        temperature = table['Temperature_C']
+        ratio = pc.divide(table['Pressure_psi'], pc.add(temperature, pa.scalar(1e-6, temperature.type)))
+        return self._replace_or_append(table, 'PT_Ratio', ratio)
+
+    def add_flow_efficiency(self, table: pa.Table) -> pa.Table:
+        """بازدهی جریان (معادل `FeatureEngineer.add_flow_efficiency`)"""
+        flow = pc.multiply(table['Flow_Rate_bbl_day'], 100)
+        capacity = pc.add(pc.multiply(table['Permeability_mD'], table['Porosity_pct']), 1e-6)
+        return self._replace_or_append(table, 'Flow_Efficiency', pc.divide(flow, capacity))
+
+    def add_formation_metrics(self, table: pa.Table) -> pa.Table:
+        """پرچم‌های سازند به صورت int8 (معادل `FeatureEngineer.add_formation_metrics`)"""
+        formation = table['Formation']
+        if pa.types.is_dictionary(formation.type):
+            formation = formation.cast(formation.type.value_type)
+        for name, value in (('Carbonate_Flag', 'Carbonate'), ('Sandstone_Flag', 'Sandstone')):
+            flag = pc.fill_null(pc.equal(formation, value), False).cast(pa.int8())
+            table = self._replace_or_append(table, name, flag)
+        return table
+
+    # ------------------------------------------------------------------ کیفیت
+    @staticmethod
+    def null_counts(table: pa.Table) -> Dict[str, int]:
+        """تعداد مقادیر گم‌شده هر ستون (null و NaN)"""
+        counts = {}
+        for field in table.schema:
+            column = table[field.name]
+            n = column.null_count
+            if pa.types.is_floating(field.type):
+                n += int(pc.sum(pc.is_nan(column)).as_py() or 0)
+            counts[field.name] = n
+        return counts
+
+    def quality_report(self, table: pa.Table, ranges: Dict[str, tuple]) -> Dict[str, Any]:
+        """گزارش کیفیت با ساختار خروجی `QualityChecker.generate_report`"""
+        missing = self.null_counts(table)
+        report = {'missing_values': {'total': sum(missing.values()), 'by_column': missing}}
+
+        violations = {}
+        for col, (min_val, max_val) in ranges.items():
+            if col in table.column_names:
+                column = table[col]
+                violations[col] = {
+                    'below_min': int(pc.sum(pc.less(column, min_val)).as_py() or 0),
+                    'above_max': int(pc.sum(pc.greater(column, max_val)).as_py() or 0)
+                }
+        report['value_range_violations'] = violations
+
+        distribution = {}
+        skew = getattr(pc, 'skew', None)
+        for field in table.schema:
+            column = table[field.name]
+            if _is_numeric(field.type):
+                column = self._nan_to_null(column)
+                bounds = pc.min_max(column)
+                distribution[field.name] = {
+                    'mean': pc.mean(column).as_py(),
+                    'std': pc.stddev(column, ddof=1).as_py(),
+                    'min': bounds['min'].as_py(),
+                    'max': bounds['max'].as_py(),
+                    'skew': skew(column, biased=False).as_py() if skew else None
+                }
+            elif pa.types.is_dictionary(field.type):
+                counts = pc.value_counts(column)
+                distribution[field.name] = {
+                    str(v): int(n) for v, n in zip(counts.field('values').to_pylist(),
+                                                   counts.field('counts').to_pylist())
+                    if v is not None
+                }
+        report['distribution'] = distribution
+        return report
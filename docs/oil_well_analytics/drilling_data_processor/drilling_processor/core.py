@@ -1,5 +1,7 @@
+import os
 import pandas as pd
-from typing import Optional, Dict, Any
+import pyarrow as pa
+from typing import Optional, Dict, Any, Union
 from pathlib import Path
 from .preprocessors.cleaners import DataCleaner
 from .preprocessors.outliers import OutlierDetector
@@ -7,11 +9,16 @@ from .preprocessors.feature_engine import FeatureEngineer
 from .preprocessors.quality import QualityChecker
 from .utils.validators import DataValidator
 from .utils.loggers import ProcessingLogger
+from .utils.memory import MemoryOptimizer
+from .storage.index import read_range, filter_range
+from .schema import TIME_COLUMN, DEPTH_COLUMN, WELL_ID_COLUMN
+from .backends.arrow_backend import ArrowBackend
+from .monitoring.drift import DriftMonitor
 
 class DrillingDataProcessor:
     def __init__(
         self,
-        file_path: str,
+        file_path: Union[str, os.PathLike, Any],
         config: Optional[Dict[str, Any]] = None
     ):
         """
@@ -21,38 +28,94 @@ class DrillingDataProcessor:
         - سیستم لاگینگ یکپارچه
         
         پارامترها:
-            file_path: مسیر فایل داده
+            file_path: مسیر فایل داده یا منبع درون‌حافظه‌ای دارای `table()`/`to_pandas()`
+                (`SharedFrame` در حافظه مشترک یا `SyntheticWellGenerator`)
             config: دیکشنری پیکربندی (اختیاری)
+
+        کلیدهای بارگذاری بازه‌ای در config (با ایندکس کناری `storage.index`؛ برای منبع
+        درون‌حافظه‌ای به صورت فیلتر Arrow):
+            time_range: (شروع, پایان) روی `DateTime`
+            depth_range: (کمینه, بیشینه) روی `Depth_Measured`
+            well_id: شناسه چاه (`API_Well_ID`)
+            columns: لیست ستون‌های مورد نیاز
+
+        کلیدهای بهینه‌سازی حافظه در config:
+            optimize_memory: تبدیل نوع‌ها به نوع‌های فشرده هنگام بارگذاری (پیش‌فرض True)
+            memory_options: پارامترهای `MemoryOptimizer` (مثلاً default_tolerance، column_tolerances)
+
+        کلید موازی‌سازی در config:
+            n_jobs: تعداد پردازه‌های موازی آشکارساز داده پرت (پیش‌فرض None)
+            random_state: بذر تصادفی آشکارساز داده پرت برای نتایج تکرارپذیر (پیش‌فرض None)
+
+        کلیدهای پایش رانش در config:
+            drift_profile: `ReferenceProfile` یا مسیر JSON طرح مرجع داده آموزش؛ پس از
+            بارگذاری، داده با آن مقایسه و گزارش در `drift_report` ذخیره می‌شود
+            drift_group_column: پایش جداگانه برای هر مقدار این ستون (مثلاً `API_Well_ID`)
+
+        کلید backend در config:
+            backend: 'pandas' (پیش‌فرض) یا 'arrow'؛ در حالت 'arrow' همه مراحل روی
+            `pyarrow.Table` اجرا می‌شوند و تبدیل به pandas فقط در خروجی `run_pipeline` رخ می‌دهد
         """
-        self.file_path = Path(file_path)
+        self.source = file_path if hasattr(file_path, 'table') else None
+        self.file_path = Path(file_path) if isinstance(file_path, (str, os.PathLike)) else None
         self.config = config or {}
+        self.backend = self.config.get('backend', 'pandas')
+        if self.backend not in ('pandas', 'arrow'):
+            raise ValueError(f"❌ خطا: backend '{self.backend}' معتبر نیست!")
+        self.arrow_backend = ArrowBackend() if self.backend == 'arrow' else None
         self.logger = ProcessingLogger()
         self.cleaner = DataCleaner()
         self.outlier_detector = OutlierDetector()
         self.feature_engineer = FeatureEngineer()
         self.quality_checker = QualityChecker()
         self.validator = DataValidator()
+        memory_options = dict(self.config.get('memory_options', {}))
+        memory_options['dtype_overrides'] = {
+            **DataValidator.REQUIRED_COLUMNS,
+            **memory_options.get('dtype_overrides', {})
+        }
+        self.memory_optimizer = MemoryOptimizer(**memory_options)
         self._data = None
+        self._table = None
+        self.drift_report = None
 
     @property
     def data(self) -> pd.DataFrame:
         """دسترسی به داده‌ها با property"""
         if self._data is None:
-            self.load_data()
+            if self._table is None:
+                self.load_data()
+            if self._table is not None:
+                self._data = self._table.to_pandas()
         return self._data
 
-    def load_data(self) -> pd.DataFrame:
+    @property
+    def table(self) -> Optional[pa.Table]:
+        """جدول Arrow در حالت backend='arrow'"""
+        return self._table
+
+    def load_data(self) -> Union[pd.DataFrame, pa.Table]:
         """بارگذاری و اعتبارسنجی داده‌ها"""
+        if self.arrow_backend is not None:
+            return self._load_table()
         try:
             self.logger.log_processing_step(
-                f"Loading data from {self.file_path}", "info"
+                f"Loading data from {self.file_path or self.source}", "info"
             )
-            self._data = pd.read_parquet(self.file_path)
+            self._data = self._read_file()
             
             # بررسی مقدار `None` برای داده‌های اولیه
             if self._data is None or self._data.empty:
                 raise ValueError("❌ داده اولیه برای پردازش نامعتبر است!")
 
+            # ✅ تبدیل به نوع‌های فشرده (float32/category) پیش از اعتبارسنجی
+            if self.config.get('optimize_memory', True):
+                self._data = self.memory_optimizer.optimize(self._data)
+                self.logger.log_processing_step(
+                    f"Memory optimizer saved {self.memory_optimizer.total_saved()} bytes "
+                    f"in {len(self.memory_optimizer.report)} columns", "info"
+                )
+
             # اعتبارسنجی ساختار داده
             is_valid, msg = self.validator.validate_input_data(self._data)
             if not is_valid:
@@ -61,6 +124,7 @@ class DrillingDataProcessor:
             self.logger.log_processing_step(
                 f"Successfully loaded {len(self._data)} records", "info"
             )
+            self._check_drift(self._data)
             return self._data
             
         except Exception as e:
@@ -69,17 +133,100 @@ class DrillingDataProcessor:
             )
             raise
 
+    def _load_table(self) -> pa.Table:
+        """بارگذاری و اعتبارسنجی داده‌ها به صورت `pyarrow.Table` بدون عبور از pandas"""
+        try:
+            self.logger.log_processing_step(
+                f"Loading data from {self.file_path or self.source} (arrow backend)", "info"
+            )
+            self._data = None
+            self._table = self._read_file(as_table=True)
+            if self._table is None or self._table.num_rows == 0:
+                raise ValueError("❌ داده اولیه برای پردازش نامعتبر است!")
+
+            # در Arrow فقط نوع‌های مورد انتظار اعتبارسنج اعمال می‌شود (float32 / dictionary)
+            if self.config.get('optimize_memory', True):
+                self._table = self.arrow_backend.cast_types(
+                    self._table, self.memory_optimizer.dtype_overrides
+                )
+
+            is_valid, msg = self.arrow_backend.validate(self._table, DataValidator.REQUIRED_COLUMNS)
+            if not is_valid:
+                raise ValueError(f"Data validation failed: {msg}")
+
+            self.logger.log_processing_step(
+                f"Successfully loaded {self._table.num_rows} records", "info"
+            )
+            self._check_drift(self._table)
+            return self._table
+
+        except Exception as e:
+            self.logger.log_processing_step(
+                f"Data loading error: {str(e)}", "error"
+            )
+            raise
+
+    def _check_drift(self, data: Union[pd.DataFrame, pa.Table]):
+        """مقایسه داده بارگذاری‌شده با طرح مرجع آموزش؛ هشدارها از طریق لاگر ثبت می‌شوند"""
+        profile = self.config.get('drift_profile')
+        if profile is None:
+            return
+        monitor = DriftMonitor(
+            profile, group_column=self.config.get('drift_group_column'), logger=self.logger
+        )
+        monitor.update(data)
+        self.drift_report = monitor.check()
+
+    def _read_file(self, as_table: bool = False) -> Union[pd.DataFrame, pa.Table]:
+        """
+        خواندن فایل؛ در صورت تعیین بازه فقط بخش‌های لازم از دیسک خوانده می‌شود
+
+        برای منبع درون‌حافظه‌ای همان بازه‌ها با `filter_range` روی جدول Arrow اعمال می‌شوند.
+        """
+        ranges = {
+            key: self.config[key]
+            for key in ('time_range', 'depth_range', 'well_id')
+            if self.config.get(key) is not None
+        }
+        columns = self.config.get('columns')
+        if self.source is not None:
+            # منبع درون‌حافظه‌ای بدون عبور از دیسک؛ بازه‌ها به صورت فیلتر Arrow اعمال می‌شوند
+            if not ranges:
+                return self.source.table(columns) if as_table else self.source.to_pandas(columns)
+            read_columns = columns
+            if columns is not None:
+                range_columns = {'time_range': TIME_COLUMN, 'depth_range': DEPTH_COLUMN, 'well_id': WELL_ID_COLUMN}
+                read_columns = list(dict.fromkeys(list(columns) + [range_columns[key] for key in ranges]))
+            table = filter_range(self.source.table(read_columns), **ranges)
+            if columns is not None:
+                table = table.select(list(columns))
+            return table if as_table else table.to_pandas()
+        if ranges:
+            return read_range(self.file_path, columns=columns, as_table=as_table, **ranges)
+        if as_table:
+            return self.arrow_backend.load(self.file_path, columns=columns)
+        return pd.read_parquet(self.file_path, columns=columns)
+
     def run_pipeline(self) -> pd.DataFrame:
         """اجرای کامل پایتلاین پردازش داده"""
-        if self._data is None or self._data.empty:
-            raise ValueError("❌ خطا: داده‌ای برای پردازش موجود نیست!")
-
-        steps = [
-            ('Data Cleaning', self._clean_data),
-            ('Outlier Handling', self._handle_outliers),
-            ('Feature Engineering', self._engineer_features),
-            ('Quality Check', self._check_quality)
-        ]
+        if self.arrow_backend is not None:
+            if self._table is None or self._table.num_rows == 0:
+                raise ValueError("❌ خطا: داده‌ای برای پردازش موجود نیست!")
+            steps = [
+                ('Data Cleaning', self._clean_table),
+                ('Outlier Handling', self._handle_table_outliers),
+                ('Feature Engineering', self._engineer_table_features),
+                ('Quality Check', self._check_table_quality)
+            ]
+        else:
+            if self._data is None or self._data.empty:
+                raise ValueError("❌ خطا: داده‌ای برای پردازش موجود نیست!")
+            steps = [
+                ('Data Cleaning', self._clean_data),
+                ('Outlier Handling', self._handle_outliers),
+                ('Feature Engineering', self._engineer_features),
+                ('Quality Check', self._check_quality)
+            ]
         
         for step_name, step_func in steps:
             try:
@@ -92,7 +239,10 @@ class DrillingDataProcessor:
                     f"Error in {step_name}: {str(e)}", "error"
                 )
                 raise
-                
+
+        if self.arrow_backend is not None:
+            # تنها تبدیل به pandas در لبه API
+            self._data = self._table.to_pandas()
         return self._data
 
     def _clean_data(self):
@@ -114,7 +264,9 @@ class DrillingDataProcessor:
         if self.config.get('remove_outliers', True):
             outlier_mask = self.outlier_detector.detect(
                 self._data,
-                method=self.config.get('outlier_method', 'isolation_forest')
+                method=self.config.get('outlier_method', 'isolation_forest'),
+                n_jobs=self.config.get('n_jobs'),
+                random_state=self.config.get('random_state')
             )
             self._data = self._data[~outlier_mask]
 
@@ -137,3 +289,45 @@ class DrillingDataProcessor:
         self.logger.log_processing_step(
             "Quality check completed", "info"
         )
+
+    # ------------------------------------------------------------------ مراحل backend آرو
+    def _clean_table(self):
+        """پاک‌سازی روی جدول Arrow (پرکردن مقادیر گم‌شده و حذف تکراری‌ها)"""
+        self._table = self.arrow_backend.handle_missing_values(
+            self._table,
+            strategy=self.config.get('imputation_strategy', 'median')
+        )
+        self._table = self.arrow_backend.remove_duplicates(self._table)
+
+    def _handle_table_outliers(self):
+        """حذف داده‌های پرت با فیلتر Arrow؛ فقط ماتریس عددی به numpy داده می‌شود"""
+        if self.config.get('remove_outliers', True):
+            outlier_mask = self.outlier_detector.detect(
+                self.arrow_backend.numeric_matrix(self._table),
+                method=self.config.get('outlier_method', 'isolation_forest'),
+                n_jobs=self.config.get('n_jobs'),
+                random_state=self.config.get('random_state')
+            )
+            self._table = self.arrow_backend.filter_rows(self._table, ~outlier_mask)
+
+    def _engineer_table_features(self):
+        """مهندسی ویژگی‌ها با کرنل‌های `pyarrow.compute`"""
+        if self._table.num_rows == 0:
+            raise ValueError("❌ خطا: داده‌ای برای مهندسی ویژگی‌ها موجود نیست!")
+
+        self._table = self.arrow_backend.add_pt_ratio(self._table)
+        self._table = self.arrow_backend.add_flow_efficiency(self._table)
+        if self.config.get('add_formation_features', True):
+            self._table = self.arrow_backend.add_formation_metrics(self._table)
+
+    def _check_table_quality(self):
+        """کنترل کیفیت روی جدول Arrow با ساختار گزارش `QualityChecker`"""
+        self.quality_report = self.arrow_backend.quality_report(
+            self._table, QualityChecker.VALUE_RANGES
+        )
+        self.quality_report['plausibility_violations'] = (
+            self.quality_checker.plausibility.violation_counts(self._table)
+        )
+        self.logger.log_processing_step(
+            "Quality check completed", "info"
+        )
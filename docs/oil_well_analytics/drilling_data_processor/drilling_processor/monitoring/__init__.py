@@ -0,0 +1,18 @@
+"""
+Model Input Monitoring
+
+Contains:
+- drift: Reference sketches of the training distribution and incremental drift checks (PSI, KS)
+"""
+
+from .._lazy import lazy_exports
+
+_EXPORTS = {
+    'ReferenceProfile': '.drift',
+    'DriftMonitor': '.drift',
+    'population_stability_index': '.drift',
+    'ks_statistic': '.drift'
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
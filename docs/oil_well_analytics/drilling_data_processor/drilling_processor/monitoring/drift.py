@@ -0,0 +1,393 @@
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Optional, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from ..schema import (
+    NUMERIC_FEATURES,
+    CATEGORICAL_FEATURES,
+    PROCESSOR_COLUMN_ALIASES,
+    PHASE_COLUMN,
+    TREND_FEATURES
+)
+from ..utils.loggers import ProcessingLogger
+
+PROFILE_VERSION = 1
+# کف احتمال هر بازه در PSI تا بازه‌های خالی لگاریتم بی‌نهایت ندهند
+PSI_EPSILON = 1e-4
+
+Batch = Union[pd.DataFrame, pa.Table]
+
+
+class ReferenceProfile:
+    def __init__(
+        self,
+        numeric: Dict[str, Dict[str, Any]],
+        categorical: Dict[str, Dict[str, Any]],
+        rows: int,
+        phase_column: Optional[str] = None
+    ):
+        """
+        طرح فشرده توزیع داده آموزش برای پایش رانش
+
+        برای هر ویژگی عددی مرزهای بازه‌های هم‌احتمال (صدک‌ها)، سهم هر بازه و نرخ
+        مقادیر گم‌شده، و برای هر ویژگی دسته‌ای فراوانی نسبی `top_k` سطح پرتکرار
+        (بقیه در یک سطل «سایر») نگهداری می‌شود؛ اندازه طرح مستقل از تعداد سطرهاست.
+        با `phase_column` سهم بازه‌های عددی برای هر فاز عملیات جداگانه هم ذخیره
+        می‌شود (کلید 'phases') تا هر دسته با توزیع فاز خودش مقایسه شود.
+        """
+        self.numeric = numeric
+        self.categorical = categorical
+        self.rows = rows
+        self.phase_column = phase_column
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        numeric_features: Optional[List[str]] = None,
+        categorical_features: Optional[List[str]] = None,
+        n_bins: int = 20,
+        top_k: int = 20,
+        phase_column: Optional[str] = PHASE_COLUMN
+    ) -> 'ReferenceProfile':
+        """
+        ساخت طرح از داده آموزش (هم‌زمان با آموزش مدل)
+
+        پارامترها:
+            df: داده آموزش
+            numeric_features / categorical_features: پیش‌فرض ستون‌های `schema` موجود در df
+                به جز `TREND_FEATURES` (جریان محلی در زمان همیشه بخش کوچکی از بازه آموزش
+                آن‌ها را می‌بیند) و خود ستون فاز
+            n_bins: تعداد بازه‌های هم‌احتمال هر ویژگی عددی
+            top_k: حداکثر سطوح نگهداری‌شده هر ویژگی دسته‌ای
+            phase_column: ستون فاز برای طرح‌های عددی جداگانه هر فاز (None = فقط طرح کلی)
+        """
+        if n_bins < 2:
+            raise ValueError("❌ خطا: n_bins باید حداقل ۲ باشد!")
+        if phase_column is not None and phase_column not in df.columns:
+            phase_column = None
+        numeric_features = numeric_features or [
+            c for c in NUMERIC_FEATURES if c in df.columns and c not in TREND_FEATURES
+        ]
+        categorical_features = categorical_features or [
+            c for c in CATEGORICAL_FEATURES if c in df.columns and c != phase_column
+        ]
+        phases = df[phase_column].astype(str).to_numpy() if phase_column is not None else None
+
+        numeric = {}
+        for feature in numeric_features:
+            values = df[feature].to_numpy(dtype=np.float64)
+            missing = np.isnan(values)
+            present = values[~missing]
+            if len(present) == 0:
+                continue
+            # مرزهای تکراری (ستون‌های گسسته) حذف می‌شوند
+            edges = np.unique(np.quantile(present, np.linspace(0, 1, n_bins + 1)[1:-1]))
+            counts = np.bincount(np.searchsorted(edges, present), minlength=len(edges) + 1)
+            numeric[feature] = {
+                'edges': edges.tolist(),
+                'probs': (counts / counts.sum()).tolist(),
+                'null_rate': 1 - len(present) / len(values)
+            }
+            if phases is not None:
+                numeric[feature]['phases'] = {}
+                for phase in np.unique(phases):
+                    in_phase = phases == phase
+                    phase_values = values[in_phase & ~missing]
+                    if len(phase_values) == 0:
+                        continue
+                    counts = np.bincount(np.searchsorted(edges, phase_values), minlength=len(edges) + 1)
+                    numeric[feature]['phases'][phase] = {
+                        'probs': (counts / counts.sum()).tolist(),
+                        'null_rate': 1 - len(phase_values) / int(in_phase.sum())
+                    }
+
+        categorical = {}
+        for feature in categorical_features:
+            values = df[feature]
+            counts = values.astype(str)[values.notna()].value_counts()
+            if counts.empty:
+                continue
+            levels = counts.index[:top_k].tolist()
+            probs = (counts.iloc[:top_k] / counts.sum()).tolist()
+            categorical[feature] = {
+                'levels': levels,
+                'probs': probs + [max(0.0, 1 - sum(probs))],
+                'null_rate': float(values.isna().mean())
+            }
+        return cls(numeric, categorical, len(df), phase_column)
+
+    @property
+    def features(self) -> List[str]:
+        return list(self.numeric) + list(self.categorical)
+
+    def save(self, path: Union[str, Path]):
+        Path(path).write_text(json.dumps({
+            'version': PROFILE_VERSION,
+            'rows': self.rows,
+            'phase_column': self.phase_column,
+            'numeric': self.numeric,
+            'categorical': self.categorical
+        }, ensure_ascii=False))
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'ReferenceProfile':
+        payload = json.loads(Path(path).read_text())
+        if payload.get('version') != PROFILE_VERSION:
+            raise ValueError(f"❌ خطا: نسخه طرح مرجع {path} پشتیبانی نمی‌شود!")
+        return cls(payload['numeric'], payload['categorical'], payload['rows'], payload['phase_column'])
+
+
+def population_stability_index(expected: np.ndarray, actual: np.ndarray) -> float:
+    """PSI بین دو توزیع گسسته هم‌بازه: Σ (a - e)·ln(a / e)"""
+    expected = np.clip(expected, PSI_EPSILON, None)
+    actual = np.clip(actual, PSI_EPSILON, None)
+    return float(np.sum((actual - expected) * np.log(actual / expected)))
+
+
+def ks_statistic(expected: np.ndarray, actual: np.ndarray) -> float:
+    """تقریب آماره KS: بیشینه فاصله توزیع‌های تجمعی روی مرز بازه‌ها"""
+    return float(np.max(np.abs(np.cumsum(actual) - np.cumsum(expected))))
+
+
+class DriftMonitor:
+    def __init__(
+        self,
+        profile: Union[ReferenceProfile, str, Path],
+        psi_threshold: float = 0.2,
+        ks_threshold: float = 0.1,
+        null_rate_threshold: float = 0.1,
+        min_rows: int = 500,
+        check_every_rows: Optional[int] = None,
+        decay: float = 1.0,
+        group_column: Optional[str] = None,
+        logger: Optional[ProcessingLogger] = None
+    ):
+        """
+        پایش افزایشی رانش داده نسبت به توزیع آموزش
+
+        هر دسته ورودی فقط شمارنده‌های بازه‌های طرح مرجع را به‌روز می‌کند (حافظه
+        ثابت برای هر ویژگی، بدون نگهداری سطرها). اگر طرح مرجع طرح‌های هر فاز را
+        داشته باشد، شمارنده‌های عددی برای هر فاز جداگانه نگهداری و با توزیع همان
+        فاز مقایسه می‌شوند (فاز ناشناخته با طرح کلی). `check()` برای هر ویژگی PSI،
+        تقریب KS و تغییر نرخ مقادیر گم‌شده را حساب می‌کند و برای ویژگی‌هایی که
+        تازه از آستانه عبور کرده‌اند هشدار `ProcessingLogger` ثبت می‌کند.
+
+        پارامترها:
+            profile: `ReferenceProfile` یا مسیر فایل JSON آن
+            psi_threshold: آستانه PSI (۰.۱ تغییر متوسط، ۰.۲ تغییر جدی)
+            ks_threshold: آستانه تقریب KS برای ویژگی‌های عددی
+            null_rate_threshold: حداکثر تغییر مجاز نرخ مقادیر گم‌شده
+            min_rows: حداقل سطر یک ویژگی/گروه پیش از داوری
+            check_every_rows: اجرای خودکار `check()` پس از این تعداد سطر جدید در `update`
+            decay: ضریب فراموشی همه شمارنده‌ها (همه گروه‌ها و فازها) در هر `update`
+                (۱ = تجمعی از آخرین reset)
+            group_column: پایش جداگانه برای هر مقدار این ستون (مثلاً `API_Well_ID`)
+            logger: لاگر پردازش (پیش‌فرض یک `ProcessingLogger` جدید)
+
+        مثال:
+            ReferenceProfile.from_frame(train_df).save('drift_profile.json')
+            monitor = DriftMonitor('drift_profile.json', check_every_rows=50_000)
+            for batch in batches:
+                monitor.update(batch)
+        """
+        if not 0 < decay <= 1:
+            raise ValueError("❌ خطا: decay باید در بازه (0, 1] باشد!")
+        self.profile = profile if isinstance(profile, ReferenceProfile) else ReferenceProfile.load(profile)
+        self.psi_threshold = psi_threshold
+        self.ks_threshold = ks_threshold
+        self.null_rate_threshold = null_rate_threshold
+        self.min_rows = min_rows
+        self.check_every_rows = check_every_rows
+        self.decay = decay
+        self.group_column = group_column
+        self.logger = logger or ProcessingLogger()
+
+        self._edges = {f: np.asarray(s['edges']) for f, s in self.profile.numeric.items()}
+        self.phase_column = self.profile.phase_column
+        self._levels = {f: pd.Index(s['levels']) for f, s in self.profile.categorical.items()}
+        self._expected = {
+            f: np.asarray(s['probs'])
+            for f, s in {**self.profile.numeric, **self.profile.categorical}.items()
+        }
+        self.drifted = set()
+        self.reset()
+
+    def reset(self):
+        """صفر کردن شمارنده‌ها (مثلاً پس از آموزش مجدد مدل)"""
+        # {(گروه, فاز): {ویژگی: [شمارنده بازه‌ها, تعداد گم‌شده]}}؛ فاز ویژگی‌های دسته‌ای None است
+        self._counts: Dict[Hashable, Dict[str, List]] = {}
+        self.rows_seen = 0
+        self._rows_since_check = 0
+
+    @staticmethod
+    def _column(columns, feature: str) -> Optional[str]:
+        """نام ستون ویژگی در دسته؛ نام‌های `DrillingDataProcessor` هم پذیرفته می‌شوند"""
+        if feature in columns:
+            return feature
+        alias = PROCESSOR_COLUMN_ALIASES.get(feature)
+        return alias if alias in columns else None
+
+    def _bin(self, feature: str, values: pd.Series) -> np.ndarray:
+        """شماره بازه/سطح هر مقدار؛ -1 برای مقدار گم‌شده"""
+        if feature in self._edges:
+            numbers = pd.to_numeric(values, errors='coerce').to_numpy(dtype=np.float64)
+            index = np.searchsorted(self._edges[feature], numbers)
+            index[np.isnan(numbers)] = -1
+            return index
+        levels = self._levels[feature]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # فقط سطوح category نگاشت می‌شوند، نه تک‌تک سطرها
+            mapping = levels.get_indexer(values.cat.categories.astype(str))
+            mapping[mapping < 0] = len(levels)
+            codes = values.cat.codes.to_numpy()
+            return np.where(codes >= 0, mapping[codes], -1)
+        index = levels.get_indexer(values.astype(str))
+        index[index < 0] = len(levels)
+        index[values.isna().to_numpy()] = -1
+        return index
+
+    def update(self, batch: Batch) -> Optional[pd.DataFrame]:
+        """
+        افزودن یک دسته به شمارنده‌ها
+
+        خروجی: گزارش `check()` اگر `check_every_rows` سطر از بررسی قبلی گذشته باشد، وگرنه None
+        """
+        if isinstance(batch, pa.Table):
+            # فقط ستون‌های پایش‌شده به pandas تبدیل می‌شوند
+            names = set(batch.column_names)
+            wanted = [self._column(names, f) for f in self._expected] + [self.group_column, self.phase_column]
+            batch = batch.select([c for c in dict.fromkeys(wanted) if c in names]).to_pandas()
+        if len(batch) == 0:
+            return None
+        if self.group_column is not None:
+            group_codes, groups = pd.factorize(batch[self.group_column], use_na_sentinel=False)
+        else:
+            group_codes, groups = np.zeros(len(batch), dtype=np.int64), [None]
+        if self.decay < 1:
+            # فراموشی برای همه کلیدها، نه فقط کلیدهای حاضر در این دسته، تا وزن گروه‌ها هم‌خوان بماند
+            for features in self._counts.values():
+                for state in features.values():
+                    state[0] = state[0] * self.decay
+                    state[1] = state[1] * self.decay
+        by_group = (group_codes, [(group, None) for group in groups])
+        by_phase = by_group
+        if self.phase_column is not None and self.phase_column in batch.columns:
+            phase_codes, phases = pd.factorize(batch[self.phase_column].astype(str), use_na_sentinel=False)
+            by_phase = (group_codes * len(phases) + phase_codes,
+                        [(group, phase) for group in groups for phase in phases])
+
+        for feature, expected in self._expected.items():
+            column = self._column(batch.columns, feature)
+            if column is None:
+                continue
+            codes, keys = by_phase if feature in self._edges else by_group
+            n_bins = len(expected)
+            index = self._bin(feature, batch[column])
+            valid = index >= 0
+            # یک bincount برای همه کلیدها: شماره کلید × تعداد بازه + شماره بازه
+            counts = np.bincount(codes[valid] * n_bins + index[valid],
+                                 minlength=len(keys) * n_bins).reshape(len(keys), n_bins)
+            nulls = np.bincount(codes[~valid], minlength=len(keys))
+            for k in np.unique(codes):
+                state = self._counts.setdefault(keys[k], {}).setdefault(
+                    feature, [np.zeros(n_bins), 0.0]
+                )
+                state[0] = state[0] + counts[k]
+                state[1] = state[1] + nulls[k]
+
+        self.rows_seen += len(batch)
+        self._rows_since_check += len(batch)
+        if self.check_every_rows is not None and self._rows_since_check >= self.check_every_rows:
+            return self.check()
+        return None
+
+    def check(self) -> pd.DataFrame:
+        """
+        مقایسه شمارنده‌های فعلی با طرح مرجع و ثبت هشدار برای رانش‌های جدید
+
+        خروجی: دیتافریم با ستون‌های group، phase، feature، kind، rows، psi، ks، null_rate،
+        reference_null_rate و drifted
+        """
+        self._rows_since_check = 0
+        records = []
+        for (group, phase), features in self._counts.items():
+            for feature, (counts, nulls) in features.items():
+                total = counts.sum()
+                if total + nulls < self.min_rows:
+                    continue
+                kind = 'numeric' if feature in self._edges else 'categorical'
+                reference = self.profile.numeric.get(feature) or self.profile.categorical[feature]
+                reference = reference.get('phases', {}).get(phase, reference)
+                expected = np.asarray(reference['probs'])
+                psi = ks = np.nan
+                # ستونی که همه مقادیرش گم‌شده است فقط با نرخ مقادیر گم‌شده سنجیده می‌شود
+                if total > 0:
+                    psi = population_stability_index(expected, counts / total)
+                    if kind == 'numeric':
+                        ks = ks_statistic(expected, counts / total)
+                null_rate = nulls / (total + nulls)
+                drifted = (
+                    psi > self.psi_threshold
+                    or (kind == 'numeric' and ks > self.ks_threshold)
+                    or abs(null_rate - reference['null_rate']) > self.null_rate_threshold
+                )
+                records.append({
+                    'group': group, 'phase': phase, 'feature': feature, 'kind': kind, 'rows': int(total + nulls),
+                    'psi': psi, 'ks': ks, 'null_rate': null_rate,
+                    'reference_null_rate': reference['null_rate'], 'drifted': drifted
+                })
+                self._alert(group, phase, feature, drifted, psi, ks, null_rate)
+        return pd.DataFrame(records, columns=[
+            'group', 'phase', 'feature', 'kind', 'rows', 'psi', 'ks', 'null_rate', 'reference_null_rate', 'drifted'
+        ])
+
+    def _alert(self, group, phase, feature: str, drifted: bool, psi: float, ks: float, null_rate: float):
+        """هشدار فقط هنگام ورود به حالت رانش و پیام بازگشت هنگام خروج از آن"""
+        key = (group, phase, feature)
+        where = f" group={group}" if group is not None else ""
+        where += f" phase={phase}" if phase is not None else ""
+        if drifted and key not in self.drifted:
+            self.drifted.add(key)
+            self.logger.log_processing_step(
+                f"Data drift{where} feature={feature} PSI={psi:.3f} KS={ks:.3f} "
+                f"null_rate={null_rate:.3f}", "warning"
+            )
+        elif not drifted and key in self.drifted:
+            self.drifted.discard(key)
+            self.logger.log_processing_step(f"Drift cleared{where} feature={feature}", "info")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build a drift reference profile or check well files against one")
+    parser.add_argument('--profile', required=True, help='reference profile JSON')
+    parser.add_argument('--build-from', nargs='+', help='training parquet files to build the profile from')
+    parser.add_argument('--check', nargs='+', help='parquet files to compare with the profile')
+    parser.add_argument('--n-bins', type=int, default=20)
+    parser.add_argument('--group-column', default=None)
+    parser.add_argument('--batch-rows', type=int, default=65536)
+    args = parser.parse_args()
+
+    import pyarrow.parquet as pq
+
+    if args.build_from:
+        train = pd.concat([pd.read_parquet(p) for p in args.build_from], ignore_index=True)
+        ReferenceProfile.from_frame(train, n_bins=args.n_bins).save(args.profile)
+    if args.check:
+        monitor = DriftMonitor(args.profile, group_column=args.group_column)
+        for path in args.check:
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=args.batch_rows):
+                monitor.update(batch.to_pandas())
+        report = monitor.check()
+        monitor.logger.log_processing_step(
+            f"Drift check: {int(report['drifted'].sum())} of {len(report)} features drifted", "info"
+        )
+
+
+if __name__ == '__main__':
+    main()
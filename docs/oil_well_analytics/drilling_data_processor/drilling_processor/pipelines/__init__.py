@@ -1,25 +1,22 @@
 """
-Drilling Data Processor Package
+Machine Learning Pipelines
 
-A comprehensive toolkit for oilfield drilling data preprocessing and feature engineering.
+Contains:
+- ml_pipeline: Damage classification pipeline (scikit-learn)
+- onnx_export: ONNX export and ONNX Runtime predictor
+- clustering: Streaming KMeans / sample-then-assign density clustering of damage patterns
+- evaluation: Parallel well-grouped cross-validation with cached fold matrices
 """
-from drilling_processor.core import DrillingDataProcessor
-from drilling_processor.preprocessors.cleaners import DataCleaner
-from drilling_processor.preprocessors.outliers import OutlierDetector
-from drilling_processor.preprocessors.feature_engine import FeatureEngineer
-from drilling_processor.preprocessors.quality import QualityChecker
-from drilling_processor.pipelines.ml_pipeline import build_ml_pipeline
-from drilling_processor.utils.validators import DataValidator
-from drilling_processor.utils.loggers import ProcessingLogger
 
-__version__ = "0.1.0"
-__all__ = [
-    'DrillingDataProcessor',
-    'DataCleaner',
-    'OutlierDetector',
-    'FeatureEngineer',
-    'QualityChecker',
-    'build_ml_pipeline',
-    'DataValidator',
-    'ProcessingLogger'
-]
\ No newline at end of file
+from .._lazy import lazy_exports
+
+_EXPORTS = {
+    'build_ml_pipeline': '.ml_pipeline',
+    'export_pipeline_to_onnx': '.onnx_export',
+    'OnnxDamagePredictor': '.onnx_export',
+    'DamagePatternClusterer': '.clustering',
+    'WellGroupedEvaluator': '.evaluation'
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
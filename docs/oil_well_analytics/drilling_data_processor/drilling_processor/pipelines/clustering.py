@@ -0,0 +1,375 @@
+import argparse
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sklearn.cluster import DBSCAN, MiniBatchKMeans
+from sklearn.decomposition import PCA
+from sklearn.neighbors import KDTree, NearestNeighbors
+from sklearn.preprocessing import StandardScaler
+
+from ..preprocessors.feature_engine import FeatureEngineer
+from ..schema import (
+    NUMERIC_FEATURES,
+    PROCESSOR_COLUMN_ALIASES,
+    TREND_FEATURES,
+    WELL_ID_COLUMN,
+    TIME_COLUMN,
+    DEPTH_COLUMN
+)
+
+CLUSTER_COLUMN = 'Cluster'
+COUNT_COLUMN = 'Row_Count'
+NOISE_LABEL = -1
+METHODS = ('kmeans', 'density')
+LABELS_FILE = 'labels.parquet'
+CENTROIDS_FILE = 'centroids.parquet'
+
+Source = Union[str, Path, pd.DataFrame, Sequence[Union[str, Path]]]
+
+
+class DamagePatternClusterer:
+    def __init__(
+        self,
+        method: str = 'kmeans',
+        n_clusters: int = 8,
+        features: Optional[List[str]] = None,
+        batch_rows: int = 65536,
+        n_epochs: int = 1,
+        eps: Optional[float] = None,
+        min_samples: int = 10,
+        sample_size: int = 50_000,
+        n_components: Optional[int] = 3,
+        random_state: int = 42
+    ):
+        """
+        خوشه‌بندی مقیاس‌پذیر برای کشف الگوهای پنهان آسیب سازند
+
+        داده به صورت دسته‌ای از فایل‌های پارکت (یا یک دیتافریم) خوانده می‌شود و
+        هیچ مرحله‌ای کل داده را در حافظه نگه نمی‌دارد:
+        - گذر اول: میانگین و انحراف معیار ویژگی‌ها (`StandardScaler.partial_fit`)
+        - `kmeans`: آموزش `MiniBatchKMeans` با `partial_fit` روی دسته‌ها
+        - `density`: اجرای DBSCAN روی نمونه تصادفی (حداکثر `sample_size` سطر) در
+          فضای `n_components` مؤلفه اصلی (PCA روی نمونه) و نسبت‌دادن همه سطرها به
+          خوشه نزدیک‌ترین نقطه هسته با ایندکس KD-tree؛ سطرهای دورتر از `eps`
+          نویز (-1) هستند. ایندکس‌های درختی فقط در ابعاد کم کارآمدند، به همین
+          دلیل خوشه‌بندی چگالی در فضای کاهش‌یافته انجام می‌شود
+
+        زمان اجرا در هر دو حالت با تعداد سطر تقریباً خطی است.
+
+        پارامترها:
+            method: 'kmeans' یا 'density'
+            n_clusters: تعداد خوشه‌ها در حالت kmeans
+            features: ستون‌های ویژگی؛ پیش‌فرض ستون‌های `NUMERIC_FEATURES` موجود به جز
+                      `TREND_FEATURES` به همراه ویژگی‌های مهندسی‌شده (`PT_Ratio`، پرچم‌های سازند و ...)
+                      که `FeatureEngineer` روی هر دسته می‌سازد. ستون‌هایی که در داده خام نیستند
+                      (مثل `PT_Ratio`) هم با ساخت ویژگی روی هر دسته تأمین می‌شوند
+            batch_rows: اندازه دسته‌های خواندن
+            n_epochs: تعداد گذرهای آموزش kmeans روی داده
+            eps: شعاع همسایگی DBSCAN (پیش‌فرض: صدک ۹۰ فاصله `min_samples`-امین
+                 همسایه در نمونه)
+            min_samples: حداقل همسایه‌های نقطه هسته
+            sample_size: اندازه نمونه DBSCAN
+            n_components: تعداد مؤلفه‌های اصلی فضای خوشه‌بندی چگالی (None: بدون کاهش بعد)
+
+        مثال:
+            clusterer = DamagePatternClusterer(method='kmeans', n_clusters=6)
+            clusterer.fit('well_outputs')
+            clusterer.export('well_outputs', 'well_clusters')
+        """
+        if method not in METHODS:
+            raise ValueError(f"❌ خطا: روش خوشه‌بندی '{method}' معتبر نیست!")
+        if batch_rows <= 0 or n_clusters <= 0:
+            raise ValueError("❌ خطا: batch_rows و n_clusters باید مثبت باشند!")
+        self.method = method
+        self.n_clusters = n_clusters
+        self._features = list(features) if features else None
+        self.features = self._features
+        self.batch_rows = batch_rows
+        self.n_epochs = n_epochs
+        self.eps = eps
+        self.min_samples = min_samples
+        self.sample_size = sample_size
+        self.n_components = n_components
+        self.random_state = random_state
+
+        self.feature_engineer = FeatureEngineer()
+        self.scaler = None
+        self.model = None
+        self.centroids_ = None
+        self.eps_ = None
+        self.n_rows_ = 0
+        self.projection = None
+        self._core_tree = None
+        self._core_labels = None
+
+    # ------------------------------------------------------------------ ورودی
+    @staticmethod
+    def _paths(source: Source) -> List[Path]:
+        if isinstance(source, (str, Path)):
+            source = Path(source)
+            return sorted(source.glob('*.parquet')) if source.is_dir() else [source]
+        return [Path(p) for p in source]
+
+    def _needs_engineering(self, columns) -> bool:
+        return self.features is None or any(c not in columns for c in self.features)
+
+    def _read_columns(self, columns, extra_columns: Sequence[str]) -> List[str]:
+        """ستون‌های لازم هر فایل: ویژگی‌ها، ستون‌های اضافه و ورودی‌های ساخت ویژگی در صورت نیاز"""
+        features = self.features
+        if features is None:
+            features = [c for c in NUMERIC_FEATURES if c not in TREND_FEATURES]
+        wanted = list(extra_columns) + features
+        if self._needs_engineering(columns):
+            inputs = [c for required in FeatureEngineer.REQUIRED_COLUMNS.values() for c in required]
+            wanted += inputs + [src for src, dst in PROCESSOR_COLUMN_ALIASES.items() if dst in inputs]
+        return [c for c in dict.fromkeys(wanted) if c in columns]
+
+    def _engineer(self, df: pd.DataFrame) -> pd.DataFrame:
+        """ساخت ویژگی‌های مهندسی‌شده روی یک دسته (با نام ستون‌های پردازشگر برای خروجی ژنراتور)"""
+        df = df.copy()
+        for src, dst in PROCESSOR_COLUMN_ALIASES.items():
+            if src in df.columns and dst not in df.columns:
+                df[dst] = df[src]
+        return self.feature_engineer.apply_available(df)
+
+    def _prepare(self, df: pd.DataFrame, name: str) -> pd.DataFrame:
+        """ساخت ویژگی در صورت نیاز، تعیین ویژگی‌های پیش‌فرض در اولین دسته و بررسی ستون‌ها"""
+        if self._needs_engineering(df.columns):
+            df = self._engineer(df)
+        if self.features is None:
+            self.features = [
+                c for c in NUMERIC_FEATURES if c in df.columns and c not in TREND_FEATURES
+            ] + self.feature_engineer.feature_list
+        self._check_features(df.columns, name)
+        return df
+
+    def _iter_batches(self, source: Source, extra_columns: Sequence[str] = ()) -> Iterator[pd.DataFrame]:
+        """خواندن دسته‌ای ویژگی‌ها (و ستون‌های اضافه در صورت وجود)"""
+        if isinstance(source, pd.DataFrame):
+            columns = self._read_columns(source.columns, extra_columns)
+            for start in range(0, len(source), self.batch_rows):
+                yield self._prepare(source.iloc[start:start + self.batch_rows][columns], 'DataFrame')
+            return
+        for path in self._paths(source):
+            pf = pq.ParquetFile(path)
+            columns = self._read_columns(pf.schema_arrow.names, extra_columns)
+            for batch in pf.iter_batches(batch_size=self.batch_rows, columns=columns):
+                yield self._prepare(batch.to_pandas(), path.name)
+
+    def _check_features(self, columns, name: str):
+        missing = [c for c in self.features if c not in columns]
+        if missing:
+            raise ValueError(f"❌ خطا: ستون‌های {missing} در {name} وجود ندارند!")
+
+    def _transform(self, df: pd.DataFrame) -> np.ndarray:
+        """استانداردسازی؛ مقادیر گم‌شده برابر میانگین (صفر پس از استانداردسازی) می‌شوند"""
+        values = (df[self.features].to_numpy(dtype=np.float64) - self.scaler.mean_) / self.scaler.scale_
+        values[np.isnan(values)] = 0.0
+        return values
+
+    # ------------------------------------------------------------------ آموزش
+    def fit(self, source: Source) -> 'DamagePatternClusterer':
+        """آموزش مدل روی یک دیتافریم، فایل پارکت، پوشه یا لیست فایل‌ها"""
+        self.features = self._features
+        self.feature_engineer = FeatureEngineer()
+        self.scaler = StandardScaler()
+        self.n_rows_ = 0
+        for df in self._iter_batches(source):
+            if len(df):
+                self.scaler.partial_fit(df[self.features].to_numpy(dtype=np.float64))
+                self.n_rows_ += len(df)
+        if self.n_rows_ == 0:
+            raise ValueError("❌ خطا: داده‌ای برای خوشه‌بندی موجود نیست!")
+        # ستون‌های ثابت یا کاملاً خالی
+        self.scaler.scale_ = np.where(np.isfinite(self.scaler.scale_), self.scaler.scale_, 1.0)
+        self.scaler.mean_ = np.nan_to_num(self.scaler.mean_)
+
+        if self.method == 'kmeans':
+            self._fit_kmeans(source)
+        else:
+            self._fit_density(source)
+        return self
+
+    def _fit_kmeans(self, source: Source):
+        self.model = MiniBatchKMeans(
+            n_clusters=self.n_clusters, batch_size=min(self.batch_rows, 4096),
+            random_state=self.random_state, n_init=3
+        )
+        pending = []
+        for _ in range(self.n_epochs):
+            for df in self._iter_batches(source):
+                pending.append(self._transform(df))
+                # اولین partial_fit حداقل n_clusters سطر لازم دارد
+                if sum(len(x) for x in pending) >= self.n_clusters:
+                    self.model.partial_fit(np.vstack(pending))
+                    pending = []
+        if pending and hasattr(self.model, 'cluster_centers_'):
+            self.model.partial_fit(np.vstack(pending))
+        if not hasattr(self.model, 'cluster_centers_'):
+            raise ValueError("❌ خطا: تعداد سطرها از تعداد خوشه‌ها کمتر است!")
+        self.centroids_ = self._centroid_frame(
+            np.arange(self.n_clusters), self.scaler.inverse_transform(self.model.cluster_centers_)
+        )
+
+    def _sample(self, source: Source) -> np.ndarray:
+        """نمونه تصادفی یکنواخت از کل داده در یک گذر"""
+        rng = np.random.default_rng(self.random_state)
+        rate = min(1.0, self.sample_size / self.n_rows_)
+        parts = [x[rng.random(len(x)) < rate]
+                 for x in (self._transform(df) for df in self._iter_batches(source))]
+        sample = np.vstack(parts)
+        if len(sample) > self.sample_size:
+            sample = sample[rng.choice(len(sample), self.sample_size, replace=False)]
+        return sample
+
+    def _estimate_eps(self, sample: np.ndarray) -> float:
+        """صدک ۹۰ فاصله تا `min_samples`-امین همسایه روی حداکثر ۵۰۰۰ نقطه"""
+        rng = np.random.default_rng(self.random_state)
+        probe = sample[rng.choice(len(sample), min(len(sample), 5000), replace=False)]
+        k = min(self.min_samples, len(probe))
+        distances, _ = NearestNeighbors(n_neighbors=k).fit(probe).kneighbors(probe)
+        return float(np.quantile(distances[:, -1], 0.9))
+
+    def _fit_density(self, source: Source):
+        sample = self._sample(source)
+        if self.n_components is not None and self.n_components < sample.shape[1]:
+            self.projection = PCA(n_components=self.n_components,
+                                  random_state=self.random_state).fit(sample)
+        points = self._project(sample)
+        # eps تعیین‌شده کاربر دست نمی‌خورد تا fit دوباره روی داده دیگر از نو تخمین بزند
+        self.eps_ = self.eps if self.eps is not None else self._estimate_eps(points)
+        self.model = DBSCAN(eps=self.eps_, min_samples=self.min_samples, algorithm='kd_tree')
+        labels = self.model.fit_predict(points)
+
+        core = self.model.core_sample_indices_
+        self._core_labels = labels[core]
+        self._core_tree = KDTree(points[core]) if len(core) else None
+        clusters = np.unique(labels[labels != NOISE_LABEL])
+        if len(clusters):
+            centers = self.scaler.inverse_transform(
+                np.array([sample[labels == c].mean(axis=0) for c in clusters])
+            )
+        else:
+            centers = np.empty((0, len(self.features)))
+        self.centroids_ = self._centroid_frame(clusters, centers)
+
+    def _project(self, values: np.ndarray) -> np.ndarray:
+        return values if self.projection is None else self.projection.transform(values)
+
+    def _centroid_frame(self, clusters: np.ndarray, centers: np.ndarray) -> pd.DataFrame:
+        frame = pd.DataFrame(centers, columns=self.features)
+        frame.insert(0, CLUSTER_COLUMN, clusters.astype('int32'))
+        return frame
+
+    # ------------------------------------------------------------------ پیش‌بینی
+    def predict(self, df: pd.DataFrame) -> np.ndarray:
+        """برچسب خوشه هر سطر (در حالت density، -1 برای نویز)"""
+        if self.model is None:
+            raise ValueError("❌ خطا: مدل خوشه‌بندی هنوز آموزش ندیده است!")
+        if self._needs_engineering(df.columns):
+            df = self._engineer(df)
+        values = self._transform(df)
+        if self.method == 'kmeans':
+            return self.model.predict(values).astype('int32')
+        labels = np.full(len(values), NOISE_LABEL, dtype='int32')
+        if self._core_tree is not None and len(values):
+            distances, indices = self._core_tree.query(self._project(values), k=1)
+            near = distances[:, 0] <= self.eps_
+            labels[near] = self._core_labels[indices[near, 0]]
+        return labels
+
+    def export(self, source: Source, output_dir: Union[str, Path]) -> Dict[object, int]:
+        """
+        نوشتن برچسب‌ها و مراکز خوشه‌ها برای هر چاه
+
+        ساختار پوشه:
+            output_dir/centroids.parquet                  مراکز سراسری مدل
+            output_dir/well=<API_Well_ID>/labels.parquet   شناسه چاه، زمان، عمق و خوشه هر سطر
+            output_dir/well=<API_Well_ID>/centroids.parquet  تعداد و میانگین ویژگی‌های هر خوشه در آن چاه
+
+        خروجی: تعداد سطرهای برچسب‌خورده هر چاه
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        self.centroids_.to_parquet(output_dir / CENTROIDS_FILE, index=False)
+
+        keys = [WELL_ID_COLUMN, TIME_COLUMN, DEPTH_COLUMN]
+        writers, sums, counts, sizes = {}, [], [], []
+        try:
+            for df in self._iter_batches(source, extra_columns=keys):
+                if WELL_ID_COLUMN not in df.columns:
+                    raise ValueError(f"❌ خطا: ستون {WELL_ID_COLUMN} برای خروجی هر چاه لازم است!")
+                labels = self.predict(df)
+                out = df[[c for c in keys if c in df.columns]].reset_index(drop=True)
+                out[CLUSTER_COLUMN] = labels
+                table = pa.Table.from_pandas(out, preserve_index=False)
+                for well, rows in out.groupby(WELL_ID_COLUMN, sort=False).indices.items():
+                    if well not in writers:
+                        directory = output_dir / f'well={well}'
+                        directory.mkdir(parents=True, exist_ok=True)
+                        writers[well] = pq.ParquetWriter(directory / LABELS_FILE, table.schema)
+                    writers[well].write_table(table.take(rows))
+
+                grouped = df[self.features].groupby(
+                    [df[WELL_ID_COLUMN].to_numpy(), labels], sort=False
+                )
+                sums.append(grouped.sum())
+                counts.append(grouped.count())
+                sizes.append(grouped.size())
+        finally:
+            for writer in writers.values():
+                writer.close()
+
+        if not sizes:
+            return {}
+        # ادغام آمار دسته‌ها (خوشه‌های مرزی بین دسته‌ها)
+        sums = pd.concat(sums).groupby(level=[0, 1]).sum()
+        counts = pd.concat(counts).groupby(level=[0, 1]).sum()
+        sizes = pd.concat(sizes).groupby(level=[0, 1]).sum()
+        means = sums / counts.where(counts > 0)
+        means.insert(0, COUNT_COLUMN, sizes.astype('int64'))
+        means.index.names = [WELL_ID_COLUMN, CLUSTER_COLUMN]
+
+        rows = {}
+        for well, frame in means.groupby(level=0, sort=False):
+            frame = frame.droplevel(0).reset_index().sort_values(CLUSTER_COLUMN)
+            frame.to_parquet(output_dir / f'well={well}' / CENTROIDS_FILE, index=False)
+            rows[well] = int(frame[COUNT_COLUMN].sum())
+        return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Discover damage patterns by clustering well data")
+    parser.add_argument('--input-dir', default='well_outputs')
+    parser.add_argument('--output-dir', default='well_clusters')
+    parser.add_argument('--method', choices=METHODS, default='kmeans')
+    parser.add_argument('--n-clusters', type=int, default=8)
+    parser.add_argument('--eps', type=float, default=None)
+    parser.add_argument('--min-samples', type=int, default=10)
+    parser.add_argument('--sample-size', type=int, default=50_000)
+    parser.add_argument('--n-components', type=int, default=3)
+    parser.add_argument('--features', nargs='+', default=None)
+    args = parser.parse_args()
+
+    from ..utils.loggers import ProcessingLogger
+    logger = ProcessingLogger()
+    clusterer = DamagePatternClusterer(
+        method=args.method, n_clusters=args.n_clusters, features=args.features,
+        eps=args.eps, min_samples=args.min_samples, sample_size=args.sample_size,
+        n_components=args.n_components
+    )
+    clusterer.fit(args.input_dir)
+    logger.log_processing_step(
+        f"Fitted {args.method} clustering on {clusterer.n_rows_} rows: "
+        f"{len(clusterer.centroids_)} clusters", "info"
+    )
+    for well, rows in clusterer.export(args.input_dir, args.output_dir).items():
+        logger.log_processing_step(f"Cluster labels for well {well}: {rows} rows", "info")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,325 @@
+import argparse
+import hashlib
+import json
+import multiprocessing
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+from sklearn.base import clone
+from sklearn.metrics import accuracy_score, precision_recall_fscore_support
+from sklearn.model_selection import GroupKFold, ParameterGrid
+
+from ..schema import NUMERIC_FEATURES, CATEGORICAL_FEATURES, TARGET_COLUMN, WELL_ID_COLUMN
+from ..storage.shared import SharedArray, SharedFrame, SharedStore
+from .ml_pipeline import build_ml_pipeline
+
+META_FILE = 'meta.json'
+MATRIX_FILES = ('X_train.npy', 'y_train.npy', 'X_test.npy', 'y_test.npy')
+
+Candidates = Union[None, Dict[str, Sequence[Any]], Sequence[Dict[str, Any]]]
+
+
+def _fold_dir(cache_dir: Path, fold: int) -> Path:
+    return cache_dir / f'fold={fold}'
+
+
+def _prepare_fold(
+    frame: SharedFrame,
+    assignment: SharedArray,
+    codes: SharedArray,
+    fold: int,
+    numeric_features: List[str],
+    categorical_features: List[str],
+    cache_dir: str
+) -> Dict[str, Any]:
+    """
+    کار worker: برازش `ColumnTransformer` روی چاه‌های آموزش یک fold و ذخیره ماتریس‌ها
+
+    ماتریس‌ها به صورت .npy (float32) نوشته می‌شوند تا کارهای آموزش آن‌ها را memory-map کنند.
+    """
+    start = time.perf_counter()
+    df = frame.to_pandas(numeric_features + categorical_features)
+    folds = assignment.array()
+    y = codes.array()
+    test = folds == fold
+    preprocessor = build_ml_pipeline(numeric_features, categorical_features).named_steps['preprocessor']
+    X_train = preprocessor.fit_transform(df[~test])
+    X_test = preprocessor.transform(df[test])
+
+    out = _fold_dir(Path(cache_dir), fold)
+    out.mkdir(parents=True, exist_ok=True)
+    for name, values in zip(MATRIX_FILES, (X_train, y[~test], X_test, y[test])):
+        if hasattr(values, 'toarray'):
+            values = values.toarray()
+        dtype = np.float32 if name.startswith('X') else values.dtype
+        np.save(out / name, np.ascontiguousarray(values, dtype=dtype))
+    return {
+        'fold': fold,
+        'train_rows': int((~test).sum()),
+        'test_rows': int(test.sum()),
+        'n_features': int(X_train.shape[1]),
+        'prepare_seconds': time.perf_counter() - start
+    }
+
+
+def _fit_fold(
+    classifier,
+    params: Dict[str, Any],
+    candidate: int,
+    fold: int,
+    classes: List[str],
+    cache_dir: str
+) -> Dict[str, Any]:
+    """کار worker: آموزش یک کاندید روی ماتریس‌های کش‌شده یک fold و محاسبه معیارها"""
+    start = time.perf_counter()
+    X_train, y_train, X_test, y_test = (
+        np.load(_fold_dir(Path(cache_dir), fold) / name, mmap_mode='r') for name in MATRIX_FILES
+    )
+    model = clone(classifier).set_params(**params)
+    model.fit(X_train, y_train)
+    fit_seconds = time.perf_counter() - start
+    predicted = model.predict(X_test)
+    precision, recall, f1, support = precision_recall_fscore_support(
+        y_test, predicted, labels=np.arange(len(classes)), zero_division=0
+    )
+    per_class = [
+        {'candidate': candidate, 'fold': fold, 'damage_type': label,
+         'precision': p, 'recall': r, 'f1': f, 'support': int(s)}
+        for label, p, r, f, s in zip(classes, precision, recall, f1, support)
+    ]
+    present = support > 0
+    return {
+        'candidate': candidate,
+        'fold': fold,
+        'params': json.dumps(params, sort_keys=True, default=str),
+        'accuracy': accuracy_score(y_test, predicted),
+        'macro_f1': float(f1[present].mean()) if present.any() else 0.0,
+        'fit_seconds': fit_seconds,
+        'wall_seconds': time.perf_counter() - start,
+        'per_class': per_class
+    }
+
+
+class WellGroupedEvaluator:
+    def __init__(
+        self,
+        numeric_features: Optional[List[str]] = None,
+        categorical_features: Optional[List[str]] = None,
+        target: str = TARGET_COLUMN,
+        group_column: str = WELL_ID_COLUMN,
+        n_splits: int = 5,
+        cache_dir: Optional[Union[str, Path]] = None,
+        workers: Optional[int] = None,
+        mp_context: Optional[str] = None
+    ):
+        """
+        ارزیابی پایپ‌لاین `build_ml_pipeline` با اعتبارسنجی متقاطع گروهی بر اساس چاه
+
+        سطرهای یک چاه (همسایه‌های ۱ ثانیه‌ای) هیچ‌گاه هم در آموزش و هم در آزمون
+        نیستند (`GroupKFold` روی `API_Well_ID`). `ColumnTransformer` برای هر fold
+        فقط یک بار روی چاه‌های آموزش برازش می‌شود و ماتریس‌های تبدیل‌شده در
+        `cache_dir` ذخیره می‌شوند؛ همه کاندیدهای ابرپارامتر از همین ماتریس‌ها
+        (memory-map) استفاده می‌کنند و اجرای بعدی روی همان داده از کش می‌خواند.
+
+        آماده‌سازی foldها و آموزش (کاندید × fold) در یک process pool اجرا می‌شوند؛
+        داده فقط یک بار از طریق حافظه مشترک (`storage.shared`) به workerها می‌رسد.
+
+        پارامترها:
+            numeric_features / categorical_features: ستون‌های ورودی (پیش‌فرض `schema`)
+            target: ستون برچسب نوع آسیب
+            group_column: ستون گروه‌بندی foldها
+            n_splits: تعداد foldها (حداکثر برابر تعداد چاه‌ها)
+            cache_dir: پوشه کش ماتریس‌ها (پیش‌فرض پوشه موقت سیستم)
+            workers: تعداد پردازه‌ها (۱ = اجرای درون‌پردازه‌ای)
+            mp_context: روش ساخت پردازه ('spawn'، 'fork'، ...)
+
+        مثال:
+            evaluator = WellGroupedEvaluator(n_splits=5, workers=4, cache_dir='cv_cache')
+            report = evaluator.evaluate(df, {'n_estimators': [100, 300], 'max_depth': [None, 20]})
+            report['summary']
+        """
+        if n_splits < 2:
+            raise ValueError("❌ خطا: n_splits باید حداقل ۲ باشد!")
+        self.numeric_features = list(numeric_features or NUMERIC_FEATURES)
+        self.categorical_features = list(categorical_features or CATEGORICAL_FEATURES)
+        self.target = target
+        self.group_column = group_column
+        self.n_splits = n_splits
+        self.cache_root = Path(cache_dir or Path(tempfile.gettempdir()) / 'drilling_cv_cache')
+        self.workers = workers
+        self.mp_context = mp_context
+        self.classifier = build_ml_pipeline(
+            self.numeric_features, self.categorical_features
+        ).named_steps['classifier']
+        self.cache_dir_ = None
+        self.meta_ = None
+
+    # ------------------------------------------------------------------ foldها
+    def assign_folds(self, df: pd.DataFrame) -> np.ndarray:
+        """شماره fold آزمون هر سطر؛ همه سطرهای یک چاه در یک fold هستند"""
+        groups = df[self.group_column].to_numpy()
+        n_groups = len(pd.unique(groups))
+        if n_groups < self.n_splits:
+            raise ValueError(
+                f"❌ خطا: تعداد چاه‌ها ({n_groups}) کمتر از n_splits ({self.n_splits}) است!"
+            )
+        folds = np.empty(len(df), dtype=np.int16)
+        splitter = GroupKFold(n_splits=self.n_splits)
+        for fold, (_, test) in enumerate(splitter.split(np.empty((len(df), 1)), groups=groups)):
+            folds[test] = fold
+        return folds
+
+    def _cache_key(self, df: pd.DataFrame, folds: np.ndarray) -> str:
+        """اثر انگشت داده، ویژگی‌ها و تقسیم foldها؛ هر تغییری کش جدیدی می‌سازد"""
+        columns = self.numeric_features + self.categorical_features + [self.target]
+        digest = hashlib.sha1()
+        digest.update(json.dumps(columns).encode())
+        digest.update(pd.util.hash_pandas_object(df[columns], index=False).to_numpy().tobytes())
+        digest.update(folds.tobytes())
+        return digest.hexdigest()[:16]
+
+    def _pool(self) -> ProcessPoolExecutor:
+        context = multiprocessing.get_context(self.mp_context) if self.mp_context else None
+        return ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+
+    def _run(self, func, tasks: List[tuple]) -> List[Any]:
+        if self.workers == 1:
+            return [func(*task) for task in tasks]
+        with self._pool() as pool:
+            return [future.result() for future in [pool.submit(func, *task) for task in tasks]]
+
+    def prepare(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        ساخت (یا بارگذاری از کش) ماتریس‌های تبدیل‌شده همه foldها
+
+        خروجی: متادیتای کش شامل کلاس‌ها، اندازه foldها، چاه‌های آزمون و زمان آماده‌سازی
+        """
+        missing = [c for c in self.numeric_features + self.categorical_features + [self.target, self.group_column]
+                   if c not in df.columns]
+        if missing:
+            raise ValueError(f"❌ خطا: ستون‌های {missing} در داده وجود ندارند!")
+        folds = self.assign_folds(df)
+        cache_dir = self.cache_root / self._cache_key(df, folds)
+        meta_path = cache_dir / META_FILE
+        if meta_path.exists():
+            self.cache_dir_ = cache_dir
+            self.meta_ = {**json.loads(meta_path.read_text()), 'cached': True}
+            return self.meta_
+
+        labels = df[self.target].astype(str).to_numpy()
+        classes = np.unique(labels)
+        codes = np.searchsorted(classes, labels).astype(np.int16)
+        features = self.numeric_features + self.categorical_features
+        groups = df[self.group_column].to_numpy()
+
+        with SharedStore() as store:
+            frame = store.put_frame(df[features])
+            shared_folds, shared_codes = store.put_array(folds), store.put_array(codes)
+            tasks = [
+                (frame, shared_folds, shared_codes, fold,
+                 self.numeric_features, self.categorical_features, str(cache_dir))
+                for fold in range(self.n_splits)
+            ]
+            prepared = self._run(_prepare_fold, tasks)
+
+        self.meta_ = {
+            'classes': classes.tolist(),
+            'folds': [
+                {**info, 'test_wells': pd.unique(groups[folds == info['fold']]).tolist()}
+                for info in prepared
+            ]
+        }
+        # متادیتا آخر نوشته می‌شود تا کش نیمه‌کاره معتبر شناخته نشود
+        meta_path.write_text(json.dumps(self.meta_, default=str))
+        self.cache_dir_ = cache_dir
+        self.meta_['cached'] = False
+        return self.meta_
+
+    # ------------------------------------------------------------------ ارزیابی
+    @staticmethod
+    def _candidates(candidates: Candidates) -> List[Dict[str, Any]]:
+        if candidates is None:
+            return [{}]
+        if isinstance(candidates, dict):
+            return list(ParameterGrid(candidates))
+        return [dict(c) for c in candidates]
+
+    def evaluate(self, df: pd.DataFrame, candidates: Candidates = None) -> Dict[str, pd.DataFrame]:
+        """
+        اعتبارسنجی همه کاندیدها روی همه foldها
+
+        پارامترها:
+            df: داده شامل ویژگی‌ها، برچسب و شناسه چاه
+            candidates: None (پارامترهای پیش‌فرض)، شبکه پارامتر {'n_estimators': [..]} یا لیست دیکشنری‌ها
+                        (پارامترهای `RandomForestClassifier`)
+
+        خروجی: دیکشنری دیتافریم‌ها
+            folds: یک سطر برای هر (کاندید، fold) با accuracy، macro_f1 و زمان‌ها
+            per_class: precision/recall/f1/support هر نوع آسیب در هر (کاندید، fold)
+            summary: میانگین و انحراف معیار معیارهای هر کاندید روی foldها
+        """
+        meta = self.prepare(df)
+        candidates = self._candidates(candidates)
+        # موازی‌سازی در سطح کارها انجام می‌شود؛ هر مدل تک‌هسته‌ای آموزش می‌بیند
+        classifier = clone(self.classifier).set_params(n_jobs=1) if self.workers != 1 else self.classifier
+        tasks = [
+            (classifier, params, candidate, fold, meta['classes'], str(self.cache_dir_))
+            for candidate, params in enumerate(candidates)
+            for fold in range(self.n_splits)
+        ]
+        results = self._run(_fit_fold, tasks)
+
+        prepare_seconds = {f['fold']: f['prepare_seconds'] for f in meta['folds']}
+        per_class = pd.DataFrame([row for r in results for row in r.pop('per_class')])
+        folds = pd.DataFrame(results)
+        folds['prepare_seconds'] = folds['fold'].map(prepare_seconds)
+        summary = folds.groupby(['candidate', 'params']).agg(
+            accuracy_mean=('accuracy', 'mean'),
+            accuracy_std=('accuracy', 'std'),
+            macro_f1_mean=('macro_f1', 'mean'),
+            macro_f1_std=('macro_f1', 'std'),
+            fit_seconds=('fit_seconds', 'sum')
+        ).reset_index().sort_values('macro_f1_mean', ascending=False, ignore_index=True)
+        return {'folds': folds, 'per_class': per_class, 'summary': summary}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Well-grouped cross-validation of the damage model")
+    parser.add_argument('--input-dir', default='well_outputs')
+    parser.add_argument('--n-splits', type=int, default=5)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--cache-dir', default='cv_cache')
+    parser.add_argument('--n-estimators', type=int, nargs='+', default=[100])
+    parser.add_argument('--max-depth', type=int, nargs='+', default=None)
+    parser.add_argument('--output', default='cv_results.csv', help='per-damage-type metrics (CSV)')
+    args = parser.parse_args()
+
+    from ..utils.loggers import ProcessingLogger
+    logger = ProcessingLogger()
+    evaluator = WellGroupedEvaluator(n_splits=args.n_splits, workers=args.workers, cache_dir=args.cache_dir)
+    columns = evaluator.numeric_features + evaluator.categorical_features + [TARGET_COLUMN, WELL_ID_COLUMN]
+    df = pd.concat(
+        [pd.read_parquet(path, columns=columns) for path in sorted(Path(args.input_dir).glob('*.parquet'))],
+        ignore_index=True
+    )
+    grid = {'n_estimators': args.n_estimators}
+    if args.max_depth:
+        grid['max_depth'] = args.max_depth
+    report = evaluator.evaluate(df, grid)
+    report['per_class'].to_csv(args.output, index=False)
+    for row in report['folds'].itertuples():
+        logger.log_processing_step(
+            f"Candidate {row.candidate} fold {row.fold}: macro F1 {row.macro_f1:.3f}, "
+            f"{row.wall_seconds:.1f}s", "info"
+        )
+    best = report['summary'].iloc[0]
+    logger.log_processing_step(f"Best candidate {best['params']}: macro F1 {best['macro_f1_mean']:.3f}", "info")
+
+
+if __name__ == '__main__':
+    main()
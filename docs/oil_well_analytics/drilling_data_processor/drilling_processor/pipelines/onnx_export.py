@@ -0,0 +1,173 @@
+import copy
+import json
+from pathlib import Path
+from typing import List, Optional, Union
+
+import numpy as np
+import pandas as pd
+
+try:
+    import onnxruntime as ort
+    from skl2onnx import convert_sklearn
+    from skl2onnx.common.data_types import FloatTensorType, StringTensorType
+except ImportError:  # وابستگی اختیاری: pip install drilling_data_processor[onnx]
+    ort = None
+    convert_sklearn = None
+
+# مقداری که در مدل ONNX جایگزین NaN ستون‌های دسته‌ای می‌شود
+ONNX_MISSING_CATEGORY = ''
+
+
+def _require_onnx():
+    if convert_sklearn is None or ort is None:
+        raise ImportError(
+            "❌ خطا: برای خروجی ONNX بسته‌های `skl2onnx` و `onnxruntime` لازم است "
+            "(pip install drilling_data_processor[onnx])"
+        )
+
+
+def export_pipeline_to_onnx(
+    pipeline,
+    numeric_features: List[str],
+    categorical_features: List[str],
+    file_path: Union[str, Path],
+    target_opset: Optional[int] = None
+) -> Path:
+    """
+    تبدیل پایپ‌لاین آموزش‌دیده `build_ml_pipeline` به فرمت ONNX
+
+    هر ستون ورودی یک تنسور جداگانه با شکل `[None, 1]` است تا `ColumnTransformer`
+    بدون تغییر در گراف ONNX بازسازی شود. لیست ویژگی‌ها و کلاس‌ها در متادیتای
+    مدل ذخیره می‌شود تا `OnnxDamagePredictor` بدون پایپ‌لاین اصلی کار کند.
+
+    پارامترها:
+        pipeline: پایپ‌لاین fit شده
+        numeric_features: ستون‌های عددی (همان لیست ورودی `build_ml_pipeline`)
+        categorical_features: ستون‌های دسته‌ای
+        file_path: مسیر فایل خروجی `.onnx`
+        target_opset: نسخه opset (اختیاری)
+    """
+    _require_onnx()
+    if not hasattr(pipeline, 'classes_'):
+        raise ValueError("❌ خطا: پایپ‌لاین باید قبل از خروجی گرفتن fit شده باشد!")
+
+    # مبدل skl2onnx فقط ایمپیوتر رشته‌ای با missing_values متنی را پشتیبانی می‌کند؛
+    # در نسخه خروجی NaN با رشته خالی نمایش داده می‌شود و ورودی‌ها هم همین‌طور آماده می‌شوند.
+    export_pipeline = copy.deepcopy(pipeline)
+    cat_transformer = export_pipeline.named_steps['preprocessor'].named_transformers_.get('cat')
+    if cat_transformer is not None and categorical_features:
+        cat_transformer.named_steps['imputer'].missing_values = ONNX_MISSING_CATEGORY
+
+    initial_types = (
+        [(col, FloatTensorType([None, 1])) for col in numeric_features] +
+        [(col, StringTensorType([None, 1])) for col in categorical_features]
+    )
+    classifier = export_pipeline.named_steps['classifier']
+    onnx_model = convert_sklearn(
+        export_pipeline,
+        initial_types=initial_types,
+        options={id(classifier): {'zipmap': False}},
+        target_opset=target_opset
+    )
+
+    metadata = {
+        'numeric_features': json.dumps(list(numeric_features)),
+        'categorical_features': json.dumps(list(categorical_features)),
+        'classes': json.dumps([str(c) for c in pipeline.classes_])
+    }
+    for key, value in metadata.items():
+        prop = onnx_model.metadata_props.add()
+        prop.key = key
+        prop.value = value
+
+    file_path = Path(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(onnx_model.SerializeToString())
+    return file_path
+
+
+class OnnxDamagePredictor:
+    def __init__(
+        self,
+        model_path: Union[str, Path],
+        intra_op_threads: Optional[int] = None,
+        inter_op_threads: int = 1,
+        batch_size: int = 65536
+    ):
+        """
+        اجرای مدل ONNX آسیب سازند روی CPU با ONNX Runtime
+
+        نشست (`InferenceSession`) یک‌بار ساخته می‌شود و برای همه فراخوانی‌ها
+        دوباره استفاده می‌شود. ورودی‌های بزرگ در دسته‌های `batch_size` سطری
+        اجرا می‌شوند تا حافظه تنسورهای میانی محدود بماند.
+
+        پارامترها:
+            model_path: مسیر فایل `.onnx` ساخته‌شده با `export_pipeline_to_onnx`
+            intra_op_threads: تعداد threadهای داخل هر عملگر (None = پیش‌فرض ORT)
+            inter_op_threads: تعداد threadهای بین عملگرها
+            batch_size: حداکثر تعداد سطر در هر اجرای نشست
+        """
+        _require_onnx()
+        if batch_size <= 0:
+            raise ValueError("❌ خطا: batch_size باید مثبت باشد!")
+
+        self.model_path = Path(model_path)
+        self.batch_size = batch_size
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        if intra_op_threads is not None:
+            options.intra_op_num_threads = intra_op_threads
+        options.inter_op_num_threads = inter_op_threads
+
+        self.session = ort.InferenceSession(
+            str(self.model_path),
+            sess_options=options,
+            providers=['CPUExecutionProvider']
+        )
+        meta = self.session.get_modelmeta().custom_metadata_map
+        self.numeric_features = json.loads(meta['numeric_features'])
+        self.categorical_features = json.loads(meta['categorical_features'])
+        self.classes_ = np.array(json.loads(meta['classes']), dtype=object)
+        self._output_names = [out.name for out in self.session.get_outputs()]
+
+    def _to_feeds(self, df: pd.DataFrame) -> dict:
+        """آماده‌سازی دیکشنری ورودی نشست از ستون‌های دیتافریم"""
+        feeds = {}
+        for col in self.numeric_features:
+            feeds[col] = df[col].to_numpy(dtype=np.float32).reshape(-1, 1)
+        for col in self.categorical_features:
+            values = df[col].astype(object)
+            values = values.where(values.notna(), ONNX_MISSING_CATEGORY)
+            feeds[col] = values.astype(str).to_numpy(dtype=object).reshape(-1, 1)
+        return feeds
+
+    def _run(self, df: pd.DataFrame):
+        if df is None or not isinstance(df, pd.DataFrame):
+            raise ValueError("❌ خطا: ورودی باید یک DataFrame معتبر باشد!")
+        missing_cols = [
+            col for col in self.numeric_features + self.categorical_features
+            if col not in df.columns
+        ]
+        if missing_cols:
+            raise ValueError(f"Missing required columns: {missing_cols}")
+
+        labels, probabilities = [], []
+        for start in range(0, len(df), self.batch_size):
+            batch = df.iloc[start:start + self.batch_size]
+            label, proba = self.session.run(self._output_names, self._to_feeds(batch))
+            labels.append(label)
+            probabilities.append(proba)
+        if not labels:
+            return (np.empty(0, dtype=object),
+                    np.empty((0, len(self.classes_)), dtype=np.float32))
+        return np.concatenate(labels), np.concatenate(probabilities)
+
+    def predict(self, df: pd.DataFrame) -> np.ndarray:
+        """پیش‌بینی نوع آسیب برای هر سطر"""
+        return self._run(df)[0]
+
+    def predict_proba(self, df: pd.DataFrame) -> np.ndarray:
+        """احتمال هر کلاس به ترتیب `classes_`"""
+        return self._run(df)[1]
@@ -2,20 +2,24 @@
 Data Preprocessing Submodules
 
 Contains:
-- cleaners: Data cleaning and imputation
-- outliers: Outlier detection methods
+- cleaners: Data cleaning and imputation (lazy imputer strategy registry)
+- outliers: Outlier detection methods (lazy detector registry)
 - feature_engine: Feature engineering tools
+- plausibility: Vectorized physical-plausibility rule screening
 - quality: Data quality assessment
 """
 
-from .cleaners import DataCleaner
-from .outliers import OutlierDetector
-from .feature_engine import FeatureEngineer
-from .quality import QualityChecker
+from .._lazy import lazy_exports
 
-__all__ = [
-    'DataCleaner',
-    'OutlierDetector',
-    'FeatureEngineer',
-    'QualityChecker'
-]
\ No newline at end of file
+_EXPORTS = {
+    'DataCleaner': '.cleaners',
+    'register_imputation_strategy': '.cleaners',
+    'OutlierDetector': '.outliers',
+    'register_outlier_method': '.outliers',
+    'FeatureEngineer': '.feature_engine',
+    'PlausibilityChecker': '.plausibility',
+    'QualityChecker': '.quality'
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
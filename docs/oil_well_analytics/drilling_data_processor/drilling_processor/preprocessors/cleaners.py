@@ -1,19 +1,65 @@
 import pandas as pd
 import numpy as np
-from sklearn.impute import SimpleImputer, KNNImputer
-from sklearn.experimental import enable_iterative_imputer
-from sklearn.impute import IterativeImputer
-from typing import Dict
+from typing import Callable, Dict
+
+
+def _simple_imputer(strategy: str) -> Callable:
+    def factory():
+        from sklearn.impute import SimpleImputer
+        return SimpleImputer(strategy=strategy)
+    return factory
+
+
+def _knn_imputer():
+    from sklearn.impute import KNNImputer
+    return KNNImputer(n_neighbors=5)
+
+
+def _iterative_imputer():
+    from sklearn.experimental import enable_iterative_imputer  # noqa: F401
+    from sklearn.impute import IterativeImputer
+    return IterativeImputer(max_iter=10, random_state=42)
+
+
+# رجیستری استراتژی‌های ایمپوت: نام → سازنده بدون آرگومان
+# (scikit-learn فقط هنگام ساخت اولین imputer هر استراتژی import می‌شود)
+IMPUTATION_STRATEGIES: Dict[str, Callable] = {
+    'median': _simple_imputer('median'),
+    'mean': _simple_imputer('mean'),
+    'knn': _knn_imputer,
+    'iterative': _iterative_imputer
+}
+
+
+def register_imputation_strategy(name: str, factory: Callable):
+    """
+    افزودن استراتژی ایمپوت جدید
+
+    `factory` بدون آرگومان فراخوانی می‌شود و شیئی با متد `fit_transform` برمی‌گرداند.
+
+    مثال:
+        register_imputation_strategy('zero', lambda: SimpleImputer(strategy='constant', fill_value=0))
+    """
+    IMPUTATION_STRATEGIES[name] = factory
+
 
 class DataCleaner:
     def __init__(self):
-        self.imputation_strategies = {
-            'median': SimpleImputer(strategy='median'),
-            'mean': SimpleImputer(strategy='mean'),
-            'knn': KNNImputer(n_neighbors=5),
-            'iterative': IterativeImputer(max_iter=10, random_state=42)
-        }
+        # imputerها در اولین استفاده از روی `IMPUTATION_STRATEGIES` ساخته و نگه‌داری می‌شوند
+        self.imputation_strategies = {}
         self.imputation_history = []
+        # آمار تجمعی برای ایمپوت افزایشی (تعداد/مجموع هر ستون عددی و فراوانی مقادیر متنی)
+        self.running_statistics = {}
+        self.running_category_counts = {}
+
+    def _get_imputer(self, strategy: str):
+        """imputer ساخته‌شده برای استراتژی؛ برای استراتژی ناشناخته None"""
+        if strategy not in self.imputation_strategies:
+            factory = IMPUTATION_STRATEGIES.get(strategy)
+            if factory is None:
+                return None
+            self.imputation_strategies[strategy] = factory()
+        return self.imputation_strategies[strategy]
 
     def handle_missing_values(
         self,
@@ -46,9 +92,9 @@ class DataCleaner:
         if custom_strategy:
             for col, col_strategy in custom_strategy.items():
                 if col in numeric_cols:
-                    imputer = self.imputation_strategies.get(col_strategy)
+                    imputer = self._get_imputer(col_strategy)
                     if imputer:
-                        df[[col]] = imputer.fit_transform(df[[col]])
+                        df[col] = imputer.fit_transform(df[[col]])[:, 0].astype(df[col].dtype)
                         self.imputation_history.append(
                             f"Column '{col}' imputed with {col_strategy}"
                         )
@@ -58,9 +104,13 @@ class DataCleaner:
 
         # ✅ مدیریت ایمپوت عمومی برای ستون‌های عددی باقی‌مانده
         if numeric_cols:
-            imputer = self.imputation_strategies.get(strategy)
+            imputer = self._get_imputer(strategy)
             if imputer:
-                df[numeric_cols] = imputer.fit_transform(df[numeric_cols])
+                # ✅ خروجی imputer همیشه float64 است؛ نوع فشرده ستون‌ها (مثل float32) حفظ می‌شود
+                imputed = imputer.fit_transform(df[numeric_cols])
+                df[numeric_cols] = pd.DataFrame(
+                    imputed, columns=numeric_cols, index=df.index
+                ).astype(df[numeric_cols].dtypes.to_dict())
                 self.imputation_history.append(
                     f"Columns {numeric_cols} imputed with {strategy}"
                 )
@@ -68,14 +118,76 @@ class DataCleaner:
                 raise ValueError(f"❌ خطا: استراتژی ایمپوت '{strategy}' معتبر نیست!")
 
         # ✅ ایمپوت `NaN` در ستون‌های متنی با رایج‌ترین مقدار (`mode`)
-        categorical_cols = df.select_dtypes(include=['object']).columns.tolist()
+        categorical_cols = df.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
         for col in categorical_cols:
             if df[col].isna().sum() > 0:  # فقط اگر مقدار `NaN` دارد
-                df[col].fillna(df[col].mode()[0], inplace=True)
+                df[col] = df[col].fillna(df[col].mode()[0])
                 self.imputation_history.append(f"Categorical column '{col}' imputed with mode")
             
         return df
 
+    def handle_missing_values_incremental(
+        self,
+        df: pd.DataFrame,
+        group_column: str = None
+    ) -> pd.DataFrame:
+        """
+        ایمپوت افزایشی برای داده‌های جریانی (دسته‌های کوچک پشت‌سرهم):
+        - تعداد و مجموع مقادیر عددی و فراوانی مقادیر متنی با هر دسته به‌روز می‌شود
+        - `NaN` با میانگین/رایج‌ترین مقدار دیده‌شده تا این لحظه پر می‌شود
+        - برخلاف `handle_missing_values` نیازی به کل داده برای fit نیست
+
+        پارامترها:
+            df: دسته ورودی
+            group_column: ستون گروه‌بندی (مثلاً شناسه چاه) برای نگهداری آمار جداگانه هر گروه
+
+        مثال:
+            for batch in stream:
+                batch = cleaner.handle_missing_values_incremental(batch, 'API_Well_ID')
+        """
+        if df is None or not isinstance(df, pd.DataFrame):
+            raise ValueError("❌ خطا: ورودی باید یک DataFrame معتبر باشد!")
+
+        # ستون گروه موقتاً ثابت فرض می‌شود تا یک مسیر برای هر دو حالت کافی باشد
+        keys = df[group_column] if group_column else pd.Series(0, index=df.index)
+        numeric_cols = [
+            col for col in df.select_dtypes(include=[np.number]).columns if col != group_column
+        ]
+        categorical_cols = [
+            col for col in df.select_dtypes(include=['object', 'string', 'category']).columns
+            if col != group_column
+        ]
+
+        numeric = df[numeric_cols]
+        grouped = numeric.groupby(keys.to_numpy(), sort=False)
+        counts, sums = grouped.count(), grouped.sum()
+        if 'count' in self.running_statistics:
+            counts = counts.add(self.running_statistics['count'], fill_value=0)
+            sums = sums.add(self.running_statistics['sum'], fill_value=0)
+        self.running_statistics = {'count': counts, 'sum': sums}
+
+        result = df.copy()
+        missing = numeric.isna()
+        if missing.to_numpy().any():
+            means = (sums / counts.where(counts > 0)).reindex(keys.to_numpy())
+            means.index = df.index
+            result[numeric_cols] = numeric.fillna(means[numeric_cols])
+
+        for col in categorical_cols:
+            sizes = df.groupby([keys.to_numpy(), df[col].to_numpy()], sort=False).size()
+            previous = self.running_category_counts.get(col)
+            if previous is not None:
+                sizes = sizes.add(previous, fill_value=0)
+            self.running_category_counts[col] = sizes
+            if df[col].isna().any() and len(sizes):
+                # رایج‌ترین مقدار هر گروه
+                modes = sizes.groupby(level=0).idxmax().map(lambda key: key[1])
+                result[col] = result[col].fillna(
+                    pd.Series(keys.map(modes).to_numpy(), index=df.index)
+                )
+
+        return result
+
     def remove_duplicates(self, df: pd.DataFrame) -> pd.DataFrame:
         """حذف سطرهای تکراری با حفظ اولین occurrence"""
         if df is None or not isinstance(df, pd.DataFrame):
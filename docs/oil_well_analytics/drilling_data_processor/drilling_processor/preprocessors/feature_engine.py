@@ -1,26 +1,53 @@
 import pandas as pd
 import numpy as np
 
+def _operand(df, col):
+    """ستون عددی برای محاسبه؛ ستون‌های صحیح (مثلاً int16 پس از کوچک‌سازی) به float64 برده می‌شوند تا سرریز نکنند"""
+    values = df[col]
+    return values.astype('float64') if pd.api.types.is_integer_dtype(values) else values
+
+
 class FeatureEngineer:
+    # ستون‌های لازم برای هر مرحله ساخت ویژگی
+    REQUIRED_COLUMNS = {
+        'add_pt_ratio': ('Pressure_psi', 'Temperature_C'),
+        'add_flow_efficiency': ('Flow_Rate_bbl_day', 'Permeability_mD', 'Porosity_pct'),
+        'add_formation_metrics': ('Formation',)
+    }
+
     def __init__(self):
         self.feature_list = []
 
+    def _register(self, *features):
+        """ثبت ویژگی‌های ساخته‌شده بدون تکرار (برای فراخوانی‌های پی‌درپی روی دسته‌ها)"""
+        for feature in features:
+            if feature not in self.feature_list:
+                self.feature_list.append(feature)
+
     def add_pt_ratio(self, df):
         """نسبت فشار به دما (Pressure/Temperature Ratio)"""
-        df['PT_Ratio'] = df['Pressure_psi'] / (df['Temperature_C'] + 1e-6)  # جلوگیری از تقسیم بر صفر
-        self.feature_list.append('PT_Ratio')
+        df['PT_Ratio'] = _operand(df, 'Pressure_psi') / (_operand(df, 'Temperature_C') + 1e-6)  # جلوگیری از تقسیم بر صفر
+        self._register('PT_Ratio')
         return df
 
     def add_flow_efficiency(self, df):
         """بازدهی جریان (Flow Efficiency Metric)"""
-        df['Flow_Efficiency'] = (df['Flow_Rate_bbl_day'] * 100) / \
-                              (df['Permeability_mD'] * df['Porosity_pct'] + 1e-6)
-        self.feature_list.append('Flow_Efficiency')
+        df['Flow_Efficiency'] = (_operand(df, 'Flow_Rate_bbl_day') * 100) / \
+                              (_operand(df, 'Permeability_mD') * _operand(df, 'Porosity_pct') + 1e-6)
+        self._register('Flow_Efficiency')
         return df
 
     def add_formation_metrics(self, df):
         """ویژگی‌های مرتبط با سازند زمین‌شناسی"""
-        df['Carbonate_Flag'] = df['Formation'].apply(lambda x: 1 if x == 'Carbonate' else 0)
-        df['Sandstone_Flag'] = df['Formation'].apply(lambda x: 1 if x == 'Sandstone' else 0)
-        self.feature_list.extend(['Carbonate_Flag', 'Sandstone_Flag'])
-        return df
\ No newline at end of file
+        # مقایسه برداری روی ستون category بدون تبدیل به object؛ پرچم‌ها int8 هستند
+        df['Carbonate_Flag'] = (df['Formation'] == 'Carbonate').astype('int8')
+        df['Sandstone_Flag'] = (df['Formation'] == 'Sandstone').astype('int8')
+        self._register('Carbonate_Flag', 'Sandstone_Flag')
+        return df
+
+    def apply_available(self, df):
+        """اجرای مراحلی از ساخت ویژگی که ستون‌های ورودی آن‌ها در دیتافریم موجود است"""
+        for step, columns in self.REQUIRED_COLUMNS.items():
+            if all(col in df.columns for col in columns):
+                df = getattr(self, step)(df)
+        return df
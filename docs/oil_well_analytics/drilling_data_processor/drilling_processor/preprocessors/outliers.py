@@ -1,9 +1,46 @@
-from sklearn.ensemble import IsolationForest
-import numpy as np
+import pandas as pd
+from typing import Callable, Dict
+
+
+def _isolation_forest(contamination, n_jobs):
+    from sklearn.ensemble import IsolationForest
+    return IsolationForest(contamination=contamination, n_jobs=n_jobs)
+
+
+# رجیستری روش‌های تشخیص داده پرت: نام → سازنده (contamination, n_jobs)
+# (scikit-learn فقط هنگام اولین فراخوانی `detect` import می‌شود)
+OUTLIER_DETECTORS: Dict[str, Callable] = {
+    'isolation_forest': _isolation_forest
+}
+
+
+def register_outlier_method(name: str, factory: Callable):
+    """
+    افزودن روش جدید تشخیص داده پرت
+
+    `factory(contamination, n_jobs)` شیئی با متد `fit_predict` برمی‌گرداند که برای
+    داده‌های پرت مقدار -1 تولید می‌کند.
+    """
+    OUTLIER_DETECTORS[name] = factory
+
 
 class OutlierDetector:
-    def detect(self, df, contamination=0.05):
-        """شناسایی داده‌های پرت با Isolation Forest"""
-        clf = IsolationForest(contamination=contamination)
-        outliers = clf.fit_predict(df.select_dtypes(include=['number']))
-        return outliers == -1
\ No newline at end of file
+    def detect(self, data, contamination=0.05, method='isolation_forest', n_jobs=None, random_state=None):
+        """
+        شناسایی داده‌های پرت با روش ثبت‌شده در `OUTLIER_DETECTORS` (پیش‌فرض Isolation Forest)
+
+        ورودی می‌تواند دیتافریم (فقط ستون‌های عددی استفاده می‌شوند) یا ماتریس
+        عددی numpy باشد (مثلاً خروجی `ArrowBackend.numeric_matrix`).
+        `n_jobs` تعداد پردازه‌های موازی ساخت درخت‌ها است؛ `random_state` در صورت
+        تعیین روی آشکارسازهایی که این پارامتر sklearn را دارند تنظیم می‌شود.
+        """
+        factory = OUTLIER_DETECTORS.get(method)
+        if factory is None:
+            raise ValueError(f"❌ خطا: روش تشخیص داده پرت '{method}' معتبر نیست!")
+        if isinstance(data, pd.DataFrame):
+            data = data.select_dtypes(include=['number'])
+        clf = factory(contamination=contamination, n_jobs=n_jobs)
+        if random_state is not None and 'random_state' in getattr(clf, 'get_params', dict)():
+            clf.set_params(random_state=random_state)
+        outliers = clf.fit_predict(data)
+        return outliers == -1
@@ -0,0 +1,310 @@
+import argparse
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from ..schema import PHASE_COLUMN, PROCESSOR_COLUMN_ALIASES, WELL_ID_COLUMN
+
+# محدوده‌های فیزیکی هر ستون (کمینه، بیشینه)؛ inf یعنی بدون مرز
+PHYSICAL_LIMITS: Dict[str, Tuple[float, float]] = {
+    'Days_Age_Well': (0, np.inf),
+    'Fractures_Presence': (0, 1),
+    'Reservoir_Temperature': (0, 400),
+    'Formation_Permeability': (0, 10000),
+    'Clay_Content_Percent': (0, 100),
+    'Density_Perforation': (0, 60),
+    'Depth_Measured': (0, 40000),
+    'Depth_Bit': (0, 40000),
+    'Weight_on_Bit': (0, 100000),
+    'RPM': (0, 400),
+    'ROP': (0, 500),
+    'Torque': (0, 100000),
+    'Pressure_Standpipe': (0, 30000),
+    'Pressure_Annulus': (0, 30000),
+    'Pressure_Reservoir': (0, 30000),
+    'In_Rate_Flow_Mud': (0, 5000),
+    'Mud_Weight_In': (6, 22),
+    'Mud_Temperature_In': (-10, 200),
+    'Chloride_Content': (0, 200000),
+    'Solid_Content': (0, 100),
+    'Mud_pH': (0, 14),
+    'Out_Rate_Flow_Mud': (0, 5000),
+    'Volume_Pit': (0, 10000),
+    'Mud_Temperature_Out': (-10, 200),
+    'Viscosity': (0, 300),
+    'Fluid_Loss_API': (0, 100),
+    'Mud_Weight_Out': (6, 22)
+}
+
+# قواعد سازگاری بین ستون‌ها: (ستون چپ، عملگر، ستون راست) که باید برقرار باشد
+CONSISTENCY_RULES: List[Tuple[str, str, str]] = [
+    ('Depth_Bit', '<=', 'Depth_Measured'),
+    ('Out_Rate_Flow_Mud', '<=', 'In_Rate_Flow_Mud'),
+    ('Pressure_Annulus', '<', 'Pressure_Standpipe')
+]
+
+# محدوده‌های وابسته به فاز عملیات: فاز → {ستون: (کمینه، بیشینه)}
+PHASE_LIMITS: Dict[str, Dict[str, Tuple[float, float]]] = {
+    'Completion': {'ROP': (0, 0)},
+    'Production': {'ROP': (0, 0)}
+}
+
+_OPERATORS = ('<', '<=')
+
+
+def _resolve(name: str, columns: Sequence[str]) -> Optional[str]:
+    """نام ستون در داده (نام ژنراتور یا نام `PROCESSOR_COLUMN_ALIASES`)"""
+    if name in columns:
+        return name
+    alias = PROCESSOR_COLUMN_ALIASES.get(name)
+    return alias if alias in columns else None
+
+
+def _column_values(data: Union[pd.DataFrame, pa.Table], column: str) -> np.ndarray:
+    if isinstance(data, pa.Table):
+        return data[column].to_numpy().astype(np.float64, copy=False)
+    values = data[column]
+    if isinstance(values.dtype, np.dtype) and values.dtype == np.float64:
+        return values.to_numpy()
+    if not pd.api.types.is_numeric_dtype(values):
+        values = pd.to_numeric(values, errors='coerce')
+    return values.to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _phase_codes(data: Union[pd.DataFrame, pa.Table], column: str, phases: List[str]) -> np.ndarray:
+    """اندیس فاز هر سطر در `phases` (-1 برای سایر فازها)؛ ستون دسته‌ای فقط از روی کدها نگاشت می‌شود"""
+    values = data[column].to_pandas() if isinstance(data, pa.Table) else data[column]
+    lookup = pd.Index(phases)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        # کد -1 (مقدار گم‌شده) به آخرین عنصر یعنی -1 نگاشت می‌شود
+        mapping = np.append(lookup.get_indexer(values.cat.categories.astype(str)), -1)
+        return mapping[values.cat.codes.to_numpy()]
+    return lookup.get_indexer(values.astype(str))
+
+
+class _Plan:
+    def __init__(self, checker: 'PlausibilityChecker', columns: Sequence[str]):
+        """
+        ترجمه قواعد به عملیات‌های برداری روی اندیس ستون‌ها برای یک مجموعه ستون مشخص
+
+        قواعد ستون‌های غایب حذف می‌شوند؛ هر مرز یک قاعده جداگانه است تا شمارش
+        کمتر از کمینه و بیشتر از بیشینه جدا بماند.
+        """
+        self.columns: List[str] = []
+        self.rules: List[str] = []
+        self.bound_columns: Dict[str, Tuple[str, str]] = {}
+        # (ufunc تخطی، اندیس ستون، مرز یا اندیس ستون دوم، اندیس قاعده)
+        self.bound_ops: List[Tuple[np.ufunc, int, float, int]] = []
+        self.pair_ops: List[Tuple[np.ufunc, int, int, int]] = []
+        # (اندیس ستون، اندیس فاز، کمینه، بیشینه، اندیس قاعده)
+        self.phase_ops: List[Tuple[int, int, float, float, int]] = []
+
+        def index(name):
+            if name not in self.columns:
+                self.columns.append(name)
+            return self.columns.index(name)
+
+        def add_rule(name, column=None, side=None):
+            if column is not None:
+                self.bound_columns[name] = (column, side)
+            self.rules.append(name)
+            return len(self.rules) - 1
+
+        for name, (min_val, max_val) in checker.limits.items():
+            column = _resolve(name, columns)
+            if column is None:
+                continue
+            if np.isfinite(min_val):
+                rule = add_rule(f'{column} >= {min_val:g}', column, 'below_min')
+                self.bound_ops.append((np.less, index(column), min_val, rule))
+            if np.isfinite(max_val):
+                rule = add_rule(f'{column} <= {max_val:g}', column, 'above_max')
+                self.bound_ops.append((np.greater, index(column), max_val, rule))
+
+        for left, op, right in checker.consistency:
+            left_col, right_col = _resolve(left, columns), _resolve(right, columns)
+            if left_col is None or right_col is None:
+                continue
+            rule = add_rule(f'{left_col} {op} {right_col}')
+            ufunc = np.greater_equal if op == '<' else np.greater
+            self.pair_ops.append((ufunc, index(left_col), index(right_col), rule))
+
+        self.phase_column = checker.phase_column if checker.phase_column in columns else None
+        self.phases: List[str] = []
+        if self.phase_column is not None:
+            for phase, limits in checker.phase_limits.items():
+                for name, (min_val, max_val) in limits.items():
+                    column = _resolve(name, columns)
+                    if column is None:
+                        continue
+                    if phase not in self.phases:
+                        self.phases.append(phase)
+                    rule = add_rule(f'{min_val:g} <= {column} <= {max_val:g} when {self.phase_column} == {phase}')
+                    self.phase_ops.append((index(column), self.phases.index(phase), min_val, max_val, rule))
+
+    def evaluate(self, data: Union[pd.DataFrame, pa.Table]) -> np.ndarray:
+        """
+        ماتریس تخطی [قاعده، سطر] در یک گذر روی دسته (NaN تخطی محسوب نمی‌شود)
+
+        هر ستون یک بار به آرایه float64 تبدیل می‌شود و نتیجه هر قاعده با `out=`
+        مستقیم در سطر پیوسته خودش از ماتریس نوشته می‌شود؛ هیچ آرایه میانی
+        به اندازه [قاعده، سطر] ساخته نمی‌شود.
+        """
+        n = len(data)
+        values = [_column_values(data, column) for column in self.columns]
+        violations = np.zeros((len(self.rules), n), dtype=bool)
+
+        for ufunc, col, bound, rule in self.bound_ops:
+            ufunc(values[col], bound, out=violations[rule])
+        for ufunc, left, right, rule in self.pair_ops:
+            ufunc(values[left], values[right], out=violations[rule])
+
+        if self.phase_ops:
+            codes = _phase_codes(data, self.phase_column, self.phases)
+            in_phase = [codes == i for i in range(len(self.phases))]
+            for col, phase, min_val, max_val, rule in self.phase_ops:
+                row = violations[rule]
+                np.less(values[col], min_val, out=row)
+                row |= values[col] > max_val
+                row &= in_phase[phase]
+        return violations
+
+
+class PlausibilityChecker:
+    def __init__(
+        self,
+        limits: Optional[Dict[str, Tuple[float, float]]] = None,
+        consistency: Optional[List[Tuple[str, str, str]]] = None,
+        phase_limits: Optional[Dict[str, Dict[str, Tuple[float, float]]]] = None,
+        phase_column: str = PHASE_COLUMN
+    ):
+        """
+        غربالگری امکان‌پذیری فیزیکی داده‌های چاه با مجموعه قواعد کامپایل‌شده
+
+        سه نوع قاعده پشتیبانی می‌شود: محدوده فیزیکی هر ستون، سازگاری بین دو
+        ستون (مثل `Depth_Bit <= Depth_Measured`) و محدوده وابسته به فاز عملیات.
+        قواعد برای هر مجموعه ستون یک بار به آرایه‌های اندیس/مرز ترجمه و کش
+        می‌شوند و همه آن‌ها در یک گذر برداری روی دسته ارزیابی می‌شوند. نام‌های
+        ستون هم به شکل خروجی ژنراتور و هم به شکل `PROCESSOR_COLUMN_ALIASES`
+        شناخته می‌شوند و قواعد ستون‌های غایب نادیده گرفته می‌شوند.
+
+        پارامترها:
+            limits: محدوده‌های فیزیکی (پیش‌فرض `PHYSICAL_LIMITS`)
+            consistency: قواعد بین‌ستونی با عملگر '<' یا '<=' (پیش‌فرض `CONSISTENCY_RULES`)
+            phase_limits: محدوده‌های وابسته به فاز (پیش‌فرض `PHASE_LIMITS`)
+            phase_column: ستون فاز عملیات
+        """
+        self.limits = dict(PHYSICAL_LIMITS if limits is None else limits)
+        self.consistency = list(CONSISTENCY_RULES if consistency is None else consistency)
+        self.phase_limits = {
+            phase: dict(bounds) for phase, bounds in (PHASE_LIMITS if phase_limits is None else phase_limits).items()
+        }
+        self.phase_column = phase_column
+        invalid = [op for _, op, _ in self.consistency if op not in _OPERATORS]
+        if invalid:
+            raise ValueError(f"❌ خطا: عملگرهای {invalid} معتبر نیستند؛ فقط {_OPERATORS} پشتیبانی می‌شوند!")
+        self._plans: Dict[Tuple[str, ...], _Plan] = {}
+
+    def compile(self, columns: Sequence[str]) -> _Plan:
+        """برنامه ارزیابی قواعد برای یک مجموعه ستون (کش‌شده)"""
+        key = tuple(columns)
+        if key not in self._plans:
+            self._plans[key] = _Plan(self, key)
+        return self._plans[key]
+
+    def evaluate(self, data: Union[pd.DataFrame, pa.Table]) -> pd.DataFrame:
+        """ماتریس بولی تخطی هر سطر از هر قاعده (ستون‌ها = نام قواعد)"""
+        plan = self.compile(data.column_names if isinstance(data, pa.Table) else list(data.columns))
+        return pd.DataFrame(plan.evaluate(data).T, columns=plan.rules)
+
+    def mask(self, data: Union[pd.DataFrame, pa.Table]) -> np.ndarray:
+        """True برای سطرهایی که حداقل یک قاعده را نقض می‌کنند"""
+        plan = self.compile(data.column_names if isinstance(data, pa.Table) else list(data.columns))
+        return plan.evaluate(data).any(axis=0)
+
+    def violation_counts(self, data: Union[pd.DataFrame, pa.Table]) -> Dict[str, int]:
+        """تعداد سطرها، سطرهای ناممکن و تخطی هر قاعده"""
+        plan = self.compile(data.column_names if isinstance(data, pa.Table) else list(data.columns))
+        violations = plan.evaluate(data)
+        counts = {'rows': len(data), 'implausible_rows': int(violations.any(axis=0).sum())}
+        counts.update(zip(plan.rules, np.count_nonzero(violations, axis=1).tolist()))
+        return counts
+
+    def range_violations(self, data: Union[pd.DataFrame, pa.Table]) -> Dict[str, Dict[str, int]]:
+        """شمارش کمتر از کمینه/بیشتر از بیشینه هر ستون با ساختار گزارش `QualityChecker`"""
+        plan = self.compile(data.column_names if isinstance(data, pa.Table) else list(data.columns))
+        counts = self.violation_counts(data)
+        report: Dict[str, Dict[str, int]] = {}
+        for rule, (column, side) in plan.bound_columns.items():
+            report.setdefault(column, {'below_min': 0, 'above_max': 0})[side] = counts[rule]
+        return report
+
+    def screen(
+        self,
+        data: Union[pd.DataFrame, pa.Table],
+        group_column: str = WELL_ID_COLUMN,
+        workers: Optional[int] = 1,
+        mp_context: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        تعداد تخطی هر قاعده برای هر چاه
+
+        با `workers=1` کل داده در یک گذر ارزیابی و شمارش‌ها با `bincount` روی کد
+        چاه تفکیک می‌شوند؛ با `workers` بیش از ۱ چاه‌ها در پردازه‌های موازی و با
+        انتقال از طریق حافظه مشترک (`map_wells`) بررسی می‌شوند.
+
+        خروجی: دیتافریم با یک سطر برای هر چاه و ستون‌های rows، implausible_rows و تعداد تخطی هر قاعده
+        """
+        if workers == 1:
+            plan = self.compile(data.column_names if isinstance(data, pa.Table) else list(data.columns))
+            violations = plan.evaluate(data)
+            groups = data[group_column].to_pandas() if isinstance(data, pa.Table) else data[group_column]
+            codes, wells = pd.factorize(groups)
+            if (codes < 0).any():
+                violations, codes = violations[:, codes >= 0], codes[codes >= 0]
+            size = len(wells)
+            table = {
+                'rows': np.bincount(codes, minlength=size),
+                'implausible_rows': np.bincount(codes[violations.any(axis=0)], minlength=size)
+            }
+            for rule, row in zip(plan.rules, violations):
+                table[rule] = np.bincount(codes[row], minlength=size)
+            counts = {well: {key: int(value[i]) for key, value in table.items()} for i, well in enumerate(wells)}
+        else:
+            from ..storage.shared import map_wells
+            counts = map_wells(self.violation_counts, data, workers=workers, group_column=group_column,
+                               as_table=True, mp_context=mp_context)
+        report = pd.DataFrame.from_dict(counts, orient='index')
+        report.index.name = group_column
+        return report.sort_index()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Screen well parquet files against physical plausibility rules")
+    parser.add_argument('--input-dir', default='well_outputs')
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--output', default='plausibility_report.csv')
+    args = parser.parse_args()
+
+    from pathlib import Path
+    import pyarrow.parquet as pq
+    from ..utils.loggers import ProcessingLogger
+    logger = ProcessingLogger()
+    checker = PlausibilityChecker()
+    reports = []
+    for path in sorted(Path(args.input_dir).glob('*.parquet')):
+        report = checker.screen(pq.read_table(path), workers=args.workers)
+        reports.append(report)
+        for well, row in report.iterrows():
+            logger.log_processing_step(
+                f"Plausibility {path.name} well {well}: {row['implausible_rows']} of {row['rows']} rows implausible",
+                "warning" if row['implausible_rows'] else "info"
+            )
+    if reports:
+        pd.concat(reports).to_csv(args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,40 +1,60 @@
 import pandas as pd
 import json
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from ..schema import PROCESSOR_COLUMN_ALIASES
+from .plausibility import PHYSICAL_LIMITS, PlausibilityChecker
 
 class QualityChecker:
-    def __init__(self):
+    # محدوده‌های منطقی مقادیر با هر دو نام ستون (مشترک با `ArrowBackend.quality_report`)
+    VALUE_RANGES = {
+        **PHYSICAL_LIMITS,
+        **{alias: PHYSICAL_LIMITS[name] for name, alias in PROCESSOR_COLUMN_ALIASES.items() if name in PHYSICAL_LIMITS}
+    }
+
+    def __init__(self, plausibility: Optional[PlausibilityChecker] = None):
         self.report = {}
+        self.plausibility = plausibility or PlausibilityChecker()
 
     def generate_report(self, df) -> Dict[str, Any]:
         """تولید گزارش جامع کیفیت داده‌ها"""
         self._check_missing_values(df)
         self._check_value_ranges(df)
+        self._check_plausibility(df)
         self._check_data_distribution(df)
         return self.report
 
     def _check_missing_values(self, df):
         """بررسی مقادیر گم‌شده"""
+        missing = df.isnull().sum()
         self.report['missing_values'] = {
-            'total': df.isnull().sum().sum(),
-            'by_column': df.isnull().sum().to_dict()
+            'total': int(missing.sum()),
+            'by_column': {col: int(n) for col, n in missing.items()}
         }
 
     def _check_value_ranges(self, df):
-        """بررسی محدوده‌های منطقی برای مقادیر"""
-        ranges = {
-            'Temperature_C': (0, 400),
-            'Pressure_psi': (0, 30000),
-            'pH': (0, 14)
-        }
-        violations = {}
-        for col, (min_val, max_val) in ranges.items():
-            if col in df.columns:
-                violations[col] = {
-                    'below_min': (df[col] < min_val).sum(),
-                    'above_max': (df[col] > max_val).sum()
-                }
-        self.report['value_range_violations'] = violations
+        """بررسی محدوده‌های فیزیکی مقادیر با قواعد `PlausibilityChecker`"""
+        self.report['value_range_violations'] = self.plausibility.range_violations(df)
+
+    def _check_plausibility(self, df):
+        """تعداد تخطی از هر قاعده فیزیکی، بین‌ستونی و وابسته به فاز"""
+        self.report['plausibility_violations'] = self.plausibility.violation_counts(df)
+
+    def _check_data_distribution(self, df):
+        """آمار توزیع ستون‌های عددی و فراوانی ستون‌های دسته‌ای (بدون تغییر نوع داده‌ها)"""
+        numeric = df.select_dtypes(include=['number'])
+        distribution = {}
+        if not numeric.empty:
+            stats = numeric.agg(['mean', 'std', 'min', 'max', 'skew'])
+            distribution = {
+                col: {stat: float(value) for stat, value in stats[col].items()}
+                for col in stats.columns
+            }
+        for col in df.select_dtypes(include=['category']).columns:
+            distribution[col] = {
+                str(k): int(v) for k, v in df[col].value_counts().items()
+            }
+        self.report['distribution'] = distribution
 
     def save_report(self, file_path: str):
         """ذخیره گزارش در فایل"""
@@ -0,0 +1,79 @@
+"""
+Well Data Schema
+
+Column names written by `datasets/generator.py` and the feature sets used by
+the damage-type model.
+"""
+
+WELL_ID_COLUMN = 'API_Well_ID'
+TIME_COLUMN = 'DateTime'
+DEPTH_COLUMN = 'Depth_Measured'
+PHASE_COLUMN = 'Phase_Operation'
+TARGET_COLUMN = 'Type_Damage'
+NO_DAMAGE_LABEL = 'No Damage'
+
+NUMERIC_FEATURES = [
+    'Days_Age_Well',
+    'Fractures_Presence',
+    'Reservoir_Temperature',
+    'Formation_Permeability',
+    'Clay_Content_Percent',
+    'Density_Perforation',
+    'Depth_Measured',
+    'Depth_Bit',
+    'Weight_on_Bit',
+    'RPM',
+    'ROP',
+    'Torque',
+    'Pressure_Standpipe',
+    'Pressure_Annulus',
+    'Overbalance',
+    'Pressure_Reservoir',
+    'In_Rate_Flow_Mud',
+    'Mud_Weight_In',
+    'Mud_Temperature_In',
+    'Chloride_Content',
+    'Solid_Content',
+    'Mud_pH',
+    'Out_Rate_Flow_Mud',
+    'Volume_Pit',
+    'Mud_Temperature_Out',
+    'Viscosity',
+    'Fluid_Loss_API',
+    'Mud_Weight_Out'
+]
+
+# ستون‌های روندی یکنوا (سن چاه، عمق، زمان) که الگوی داده را توصیف نمی‌کنند
+TREND_FEATURES = ('Days_Age_Well', DEPTH_COLUMN, 'Depth_Bit', TIME_COLUMN)
+
+CATEGORICAL_FEATURES = [
+    'Phase_Operation',
+    'Formation_Type',
+    'Clay_Mineralogy_Type',
+    'Completion_Type',
+    'Mud_Type'
+]
+
+DAMAGE_TYPES = [
+    'Clay & Iron Control',
+    'Drilling-Induced Damage',
+    'Fluid Loss',
+    'Scale / Sludge Incompatibility',
+    'Near-Wellbore Emulsions',
+    'Rock/Fluid Interaction',
+    'Completion Damage',
+    'Stress/Corrosion Cracking',
+    'Surface Filtration',
+    'Ultra-Clean Fluids Control',
+    'Generic Damage',
+    NO_DAMAGE_LABEL
+]
+
+# نام ستون‌های مورد انتظار `FeatureEngineer`/`QualityChecker` برای ستون‌های خروجی ژنراتور
+PROCESSOR_COLUMN_ALIASES = {
+    'Reservoir_Temperature': 'Temperature_C',
+    'Pressure_Reservoir': 'Pressure_psi',
+    'Formation_Type': 'Formation',
+    'Formation_Permeability': 'Permeability_mD',
+    'Mud_pH': 'pH'
+}
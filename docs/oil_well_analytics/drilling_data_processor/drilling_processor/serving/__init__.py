@@ -0,0 +1,23 @@
+"""
+Prediction Serving
+
+Contains:
+- batcher: Micro-batching of concurrent single-record predictions
+- server: Asyncio HTTP service for damage predictions
+"""
+
+from .._lazy import lazy_exports
+
+_EXPORTS = {
+    'MicroBatcher': '.batcher',
+    'LatencyTracker': '.batcher',
+    'record_validator': '.batcher',
+    'PredictionServer': '.server',
+    'load_model': '.server',
+    'load_predict_fn': '.server',
+    'make_predict_fn': '.server',
+    'make_record_validator': '.server'
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
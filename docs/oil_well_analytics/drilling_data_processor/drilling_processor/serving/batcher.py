@@ -0,0 +1,228 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+class LatencyTracker:
+    def __init__(self, window: int = 10000):
+        """
+        نگهداری تأخیر آخرین `window` درخواست برای محاسبه صدک‌ها
+
+        پارامترها:
+            window: تعداد نمونه‌های نگهداری‌شده (حافظه ثابت)
+        """
+        self._samples = deque(maxlen=window)
+        self.count = 0
+
+    def record(self, seconds: float):
+        self._samples.append(seconds)
+        self.count += 1
+
+    def percentile(self, q: float) -> Optional[float]:
+        """صدک `q` تأخیر به میلی‌ثانیه (None اگر نمونه‌ای نباشد)"""
+        if not self._samples:
+            return None
+        return float(np.percentile(np.fromiter(self._samples, dtype=float), q) * 1e3)
+
+
+def record_validator(
+    numeric_features: Sequence[str],
+    categorical_features: Sequence[str]
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    ساخت تابع اعتبارسنجی یک رکورد بر اساس ستون‌های مدل
+
+    رکورد باید همه ستون‌ها را داشته باشد (مقدار null مجاز است)؛ مقادیر عددی به float
+    و دسته‌ای به str تبدیل و ستون‌های اضافه حذف می‌شوند. بدین ترتیب نتیجه یک رکورد
+    به هم‌دسته‌های آن وابسته نیست و رکورد نامعتبر پیش از ورود به صف رد می‌شود.
+    """
+    numeric_features = list(numeric_features)
+    categorical_features = list(categorical_features)
+
+    def validate(record: Dict[str, Any]) -> Dict[str, Any]:
+        if not isinstance(record, dict):
+            raise ValueError("❌ خطا: هر رکورد باید یک شیء JSON باشد!")
+        missing = [col for col in numeric_features + categorical_features if col not in record]
+        if missing:
+            raise ValueError(f"Missing required columns: {missing}")
+        clean = {}
+        for col in numeric_features:
+            value = record[col]
+            if value is None:
+                clean[col] = math.nan
+                continue
+            if isinstance(value, bool):
+                value = int(value)
+            try:
+                clean[col] = float(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"❌ خطا: مقدار '{value}' برای ستون {col} عددی نیست!") from None
+        for col in categorical_features:
+            value = record[col]
+            clean[col] = None if value is None else str(value)
+        return clean
+
+    return validate
+
+
+class MicroBatcher:
+    def __init__(
+        self,
+        predict_fn: Callable[[pd.DataFrame], List[Dict[str, Any]]],
+        max_batch_size: int = 64,
+        max_latency_ms: float = 5.0,
+        latency_window: int = 10000,
+        validate_fn: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+    ):
+        """
+        تجمیع درخواست‌های تک‌رکوردی هم‌زمان در دسته‌های کوچک
+
+        اولین رکورد رسیده یک دسته را باز می‌کند؛ دسته وقتی به `max_batch_size`
+        برسد یا `max_latency_ms` از رسیدن اولین رکورد بگذرد اجرا می‌شود.
+        مدل در thread pool اجرا می‌شود تا حلقه asyncio مسدود نشود. اگر اجرای یک
+        دسته خطا دهد، رکوردها تک‌تک دوباره اجرا می‌شوند تا فقط درخواست مقصر خطا بگیرد.
+
+        پارامترها:
+            predict_fn: تابعی که یک DataFrame می‌گیرد و برای هر سطر یک نتیجه برمی‌گرداند
+            max_batch_size: حداکثر تعداد رکورد در هر دسته
+            max_latency_ms: حداکثر زمان انتظار برای پر شدن دسته
+            latency_window: تعداد نمونه‌های تأخیر برای محاسبه p50/p99
+            validate_fn: اعتبارسنجی و تبدیل هر رکورد در `submit` پیش از ورود به صف
+                (مثلاً خروجی `record_validator`)؛ ValueError آن مستقیم به فراخواننده می‌رسد
+        """
+        if max_batch_size <= 0:
+            raise ValueError("❌ خطا: max_batch_size باید مثبت باشد!")
+        if max_latency_ms < 0:
+            raise ValueError("❌ خطا: max_latency_ms نمی‌تواند منفی باشد!")
+
+        self.predict_fn = predict_fn
+        self.validate_fn = validate_fn
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency_ms / 1e3
+        self.latency = LatencyTracker(latency_window)
+        self.batch_count = 0
+        self.record_count = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        # دسته‌ای که از صف برداشته شده ولی هنوز نتیجه‌اش ثبت نشده است
+        self._inflight: list = []
+
+    async def start(self):
+        """شروع حلقه دسته‌بندی روی event loop جاری"""
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """توقف حلقه دسته‌بندی؛ درخواست‌های دسته در حال اجرا و در صف با خطا پایان می‌یابند"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+        pending = self._inflight
+        self._inflight = []
+        while self._queue is not None and not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for _, future, _ in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("❌ خطا: MicroBatcher متوقف شد!"))
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def submit(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """ارسال یک رکورد و انتظار برای نتیجه پیش‌بینی آن"""
+        if self._worker is None:
+            raise RuntimeError("❌ خطا: MicroBatcher هنوز start نشده است!")
+        if self.validate_fn is not None:
+            record = self.validate_fn(record)
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((record, future, time.perf_counter()))
+        return await future
+
+    async def _collect(self) -> list:
+        """جمع‌آوری یک دسته تا رسیدن به سقف اندازه یا مهلت تأخیر (در `_inflight` برای `stop`)"""
+        batch = self._inflight = []
+        batch.append(await self._queue.get())
+        deadline = time.perf_counter() + self.max_latency
+        while len(batch) < self.max_batch_size:
+            # ابتدا هرچه بدون انتظار در صف هست برداشته می‌شود
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _predict(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """اجرای `predict_fn` در thread pool؛ تعداد نتایج باید با تعداد رکوردها برابر باشد"""
+        results = await asyncio.get_running_loop().run_in_executor(
+            None, self.predict_fn, pd.DataFrame.from_records(records)
+        )
+        if len(results) != len(records):
+            raise RuntimeError(
+                f"❌ خطا: predict_fn برای {len(records)} رکورد {len(results)} نتیجه برگرداند!"
+            )
+        return results
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            records = [record for record, _, _ in batch]
+            try:
+                results = await self._predict(records)
+            except Exception as e:
+                if len(batch) == 1:
+                    _, future, _ = batch[0]
+                    if not future.done():
+                        future.set_exception(e)
+                    continue
+                # اجرای تک‌رکوردی تا خطای یک رکورد به بقیه دسته سرایت نکند
+                results = []
+                for record in records:
+                    try:
+                        results.append((await self._predict([record]))[0])
+                    except Exception as record_error:
+                        results.append(record_error)
+
+            done_at = time.perf_counter()
+            self.batch_count += 1
+            self.record_count += len(batch)
+            for (_, future, enqueued_at), result in zip(batch, results):
+                if future.done():
+                    continue
+                if isinstance(result, Exception):
+                    future.set_exception(result)
+                    continue
+                self.latency.record(done_at - enqueued_at)
+                future.set_result(result)
+            self._inflight = []
+
+    def metrics(self) -> Dict[str, Any]:
+        """شاخص‌های تأخیر، عمق صف و اندازه میانگین دسته"""
+        return {
+            'requests': self.latency.count,
+            'batches': self.batch_count,
+            'mean_batch_size': (
+                self.record_count / self.batch_count if self.batch_count else 0.0
+            ),
+            'queue_depth': self.queue_depth,
+            'latency_p50_ms': self.latency.percentile(50),
+            'latency_p99_ms': self.latency.percentile(99),
+            'max_batch_size': self.max_batch_size,
+            'max_latency_ms': self.max_latency * 1e3
+        }
@@ -0,0 +1,228 @@
+import argparse
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from .batcher import MicroBatcher, record_validator
+
+_REASONS = {
+    200: 'OK', 400: 'Bad Request', 404: 'Not Found', 413: 'Payload Too Large', 500: 'Internal Server Error'
+}
+
+
+def load_model(model_path: Union[str, Path]):
+    """
+    بارگذاری مدل: فایل `.onnx` با `OnnxDamagePredictor` و سایر فایل‌ها به‌عنوان
+    پایپ‌لاین sklearn ذخیره‌شده با joblib
+    """
+    model_path = Path(model_path)
+    if model_path.suffix == '.onnx':
+        from ..pipelines.onnx_export import OnnxDamagePredictor
+        return OnnxDamagePredictor(model_path)
+    import joblib
+    return joblib.load(model_path)
+
+
+def model_features(model) -> Tuple[List[str], List[str]]:
+    """ستون‌های عددی و دسته‌ای ورودی مدل (`OnnxDamagePredictor` یا پایپ‌لاین `build_ml_pipeline`)"""
+    if hasattr(model, 'numeric_features'):
+        return list(model.numeric_features), list(model.categorical_features)
+    preprocessor = model.named_steps['preprocessor']
+    columns = {name: list(cols) for name, _, cols in preprocessor.transformers_ if name in ('num', 'cat')}
+    return columns.get('num', []), columns.get('cat', [])
+
+
+def make_record_validator(model) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """اعتبارسنج رکورد `MicroBatcher` بر اساس ستون‌های مدل"""
+    return record_validator(*model_features(model))
+
+
+def load_predict_fn(model_path: Union[str, Path]) -> Callable[[pd.DataFrame], List[Dict[str, Any]]]:
+    """ساخت تابع پیش‌بینی دسته‌ای از فایل مدل"""
+    return make_predict_fn(load_model(model_path))
+
+
+def make_predict_fn(model) -> Callable[[pd.DataFrame], List[Dict[str, Any]]]:
+    """تابع پیش‌بینی دسته‌ای: برای هر سطر محتمل‌ترین نوع آسیب و احتمال آن"""
+    classes = np.asarray(model.classes_)
+
+    def predict(df: pd.DataFrame) -> List[Dict[str, Any]]:
+        proba = np.asarray(model.predict_proba(df))
+        best = proba.argmax(axis=1)
+        return [
+            {'damage_type': str(classes[i]), 'probability': float(p)}
+            for i, p in zip(best, proba[np.arange(len(best)), best])
+        ]
+
+    return predict
+
+
+class PredictionServer:
+    def __init__(
+        self,
+        batcher: MicroBatcher,
+        host: str = '127.0.0.1',
+        port: int = 8000,
+        max_body_bytes: int = 1 << 20
+    ):
+        """
+        سرویس HTTP سبک مبتنی بر asyncio برای پیش‌بینی نوع آسیب
+
+        مسیرها:
+            POST /predict  بدنه JSON یک رکورد یا `{"records": [...]}`
+            GET  /metrics  تأخیر p50/p99، عمق صف و اندازه دسته‌ها
+            GET  /health   بررسی سلامت سرویس
+
+        اتصال‌ها keep-alive هستند و هر رکورد جداگانه وارد `MicroBatcher` می‌شود.
+        بدنه بزرگ‌تر از `max_body_bytes` خوانده نمی‌شود و پاسخ 413 می‌گیرد.
+        """
+        if max_body_bytes <= 0:
+            raise ValueError("❌ خطا: max_body_bytes باید مثبت باشد!")
+        self.batcher = batcher
+        self.host = host
+        self.port = port
+        self.max_body_bytes = max_body_bytes
+        self._server = None
+
+    async def start(self):
+        await self.batcher.start()
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        # در صورت port=0 پورت واقعی از سوکت خوانده می‌شود
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.batcher.stop()
+
+    async def serve_forever(self):
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                try:
+                    method, path, headers = self._parse_head(head)
+                    length = int(headers.get('content-length', 0))
+                    if length < 0:
+                        raise ValueError(f'negative Content-Length {length}')
+                except (ValueError, KeyError, UnicodeDecodeError) as e:
+                    # قاب‌بندی درخواست معتبر نیست؛ پاسخ 400 و بستن اتصال
+                    self._write_response(writer, 400, {'error': f'Malformed request: {e}'}, False)
+                    await writer.drain()
+                    break
+                if length > self.max_body_bytes:
+                    # بدنه خوانده نمی‌شود؛ اتصال پس از پاسخ بسته می‌شود
+                    self._write_response(
+                        writer, 413, {'error': f'Body exceeds {self.max_body_bytes} bytes'}, False
+                    )
+                    await writer.drain()
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                status, payload = await self._dispatch(method, path, body)
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                self._write_response(writer, status, payload, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _parse_head(head: bytes) -> Tuple[str, str, Dict[str, str]]:
+        lines = head.decode('latin-1').split('\r\n')
+        method, path, _ = lines[0].split(' ', 2)
+        headers = {}
+        for line in lines[1:]:
+            if ':' in line:
+                key, value = line.split(':', 1)
+                headers[key.strip().lower()] = value.strip()
+        return method.upper(), path, headers
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, Any]:
+        if method == 'GET' and path == '/health':
+            return 200, {'status': 'ok'}
+        if method == 'GET' and path == '/metrics':
+            return 200, self.batcher.metrics()
+        if method == 'POST' and path == '/predict':
+            try:
+                payload = json.loads(body or b'null')
+            except json.JSONDecodeError as e:
+                return 400, {'error': f'Invalid JSON: {e}'}
+            if isinstance(payload, dict) and 'records' in payload:
+                records = payload['records']
+                if not isinstance(records, list) or not all(isinstance(r, dict) for r in records):
+                    return 400, {'error': '"records" must be a list of JSON objects'}
+            elif isinstance(payload, dict):
+                records = [payload]
+            else:
+                return 400, {'error': 'Body must be a record or {"records": [...]}'}
+            try:
+                results = await asyncio.gather(*(self.batcher.submit(r) for r in records))
+            except ValueError as e:
+                return 400, {'error': str(e)}
+            except Exception as e:
+                return 500, {'error': str(e)}
+            return 200, results[0] if 'records' not in payload else {'predictions': results}
+        return 404, {'error': f'No route for {method} {path}'}
+
+    @staticmethod
+    def _write_response(writer: asyncio.StreamWriter, status: int, payload: Any, keep_alive: bool):
+        body = json.dumps(payload).encode('utf-8')
+        head = (
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode('latin-1') + body)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Damage prediction micro-batching service")
+    parser.add_argument('--model', required=True, help="path to .onnx or joblib pipeline")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--max-batch-size', type=int, default=64)
+    parser.add_argument('--max-latency-ms', type=float, default=5.0)
+    parser.add_argument('--max-body-bytes', type=int, default=1 << 20)
+    args = parser.parse_args()
+
+    from ..utils.loggers import ProcessingLogger
+    logger = ProcessingLogger()
+
+    model = load_model(args.model)
+    batcher = MicroBatcher(
+        make_predict_fn(model),
+        max_batch_size=args.max_batch_size,
+        max_latency_ms=args.max_latency_ms,
+        validate_fn=make_record_validator(model)
+    )
+    server = PredictionServer(batcher, args.host, args.port, args.max_body_bytes)
+    logger.log_processing_step(
+        f"Serving {args.model} on http://{args.host}:{args.port} "
+        f"(batch<={args.max_batch_size}, wait<={args.max_latency_ms}ms)", "info"
+    )
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        logger.log_processing_step("Prediction service stopped", "info")
+
+
+if __name__ == '__main__':
+    main()
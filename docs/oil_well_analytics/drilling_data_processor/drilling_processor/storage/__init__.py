@@ -0,0 +1,31 @@
+"""
+Well Data Storage
+
+Contains:
+- rollups: Multi-resolution per-well time-bucket rollups for dashboard queries
+- index: Sidecar time/depth index for range reads over well parquet files
+- shared: Zero-copy shared-memory handoff of frames and arrays to worker processes
+- tensor_store: Memory-mapped per-well float32 feature tensors and sliding-window batches
+"""
+
+from .._lazy import lazy_exports
+
+_EXPORTS = {
+    'RollupStore': '.rollups',
+    'RESOLUTIONS': '.rollups',
+    'ROLLUP_COLUMNS': '.rollups',
+    'IndexedParquetWriter': '.index',
+    'WellIndex': '.index',
+    'read_range': '.index',
+    'filter_range': '.index',
+    'SharedStore': '.shared',
+    'SharedFrame': '.shared',
+    'SharedArray': '.shared',
+    'map_wells': '.shared',
+    'map_chunks': '.shared',
+    'TensorStore': '.tensor_store',
+    'WindowDataset': '.tensor_store'
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,306 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from ..schema import WELL_ID_COLUMN, TIME_COLUMN, DEPTH_COLUMN
+
+INDEX_SUFFIX = '.index.json'
+INDEX_VERSION = 2
+INDEXED_COLUMNS = (TIME_COLUMN, DEPTH_COLUMN, WELL_ID_COLUMN)
+
+
+def index_path_for(parquet_path: Union[str, Path]) -> Path:
+    """مسیر فایل ایندکس کناری یک فایل پارکت"""
+    parquet_path = Path(parquet_path)
+    return parquet_path.with_name(parquet_path.name + INDEX_SUFFIX)
+
+
+def file_signature(parquet_path: Union[str, Path]) -> Dict[str, int]:
+    """امضای فایل پارکت (اندازه، زمان تغییر، تعداد سطر و row group) برای تشخیص ایندکس کهنه"""
+    parquet_path = Path(parquet_path)
+    stat = parquet_path.stat()
+    metadata = pq.read_metadata(parquet_path)
+    return {
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'num_rows': metadata.num_rows,
+        'num_row_groups': metadata.num_row_groups
+    }
+
+
+def _bounds(column: pa.ChunkedArray) -> Optional[List[Any]]:
+    """کمینه و بیشینه ستون؛ زمان به صورت نانوثانیه epoch ذخیره می‌شود"""
+    if pa.types.is_timestamp(column.type):
+        column = column.cast(pa.timestamp('ns')).cast(pa.int64())
+    result = pc.min_max(column)
+    low, high = result['min'].as_py(), result['max'].as_py()
+    if low is None:
+        return None
+    return [low, high]
+
+
+def _fences(table: pa.Table, row_offset: int, fence_rows: int) -> Dict[str, Any]:
+    """محاسبه حصارهای min/max برای یک row group در بازه‌های `fence_rows` سطری"""
+    entry = {'row_offset': row_offset, 'num_rows': table.num_rows, 'fence_rows': fence_rows}
+    for col in INDEXED_COLUMNS:
+        if col not in table.column_names:
+            continue
+        entry[col] = _bounds(table[col])
+        entry[f'{col}_fences'] = [
+            _bounds(table[col].slice(start, fence_rows))
+            for start in range(0, table.num_rows, fence_rows)
+        ]
+    return entry
+
+
+class IndexedParquetWriter:
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        schema: Optional[pa.Schema] = None,
+        row_group_size: int = 1_000_000,
+        fence_rows: int = 65536,
+        compression: str = 'snappy'
+    ):
+        """
+        نویسنده پارکت که هنگام نوشتن، ایندکس کناری زمان/عمق/چاه را می‌سازد
+
+        برای هر row group کمینه/بیشینه `DateTime`، `Depth_Measured` و `API_Well_ID`
+        و حصارهای min/max هر `fence_rows` سطر ثبت می‌شود. با بستن نویسنده فایل
+        `<file>.index.json` کنار فایل پارکت نوشته می‌شود.
+
+        مثال:
+            with IndexedParquetWriter('well_1.parquet') as writer:
+                writer.write_table(table)
+        """
+        if row_group_size <= 0 or fence_rows <= 0:
+            raise ValueError("❌ خطا: row_group_size و fence_rows باید مثبت باشند!")
+        self.file_path = Path(file_path)
+        self.schema = schema
+        self.row_group_size = row_group_size
+        self.fence_rows = fence_rows
+        self.compression = compression
+        self._writer = None
+        self._row_groups = []
+        self._rows = 0
+
+    def write_table(self, table: pa.Table):
+        if self._writer is None:
+            self.schema = self.schema or table.schema
+            self._writer = pq.ParquetWriter(self.file_path, self.schema, compression=self.compression)
+        # هر برش دقیقاً یک row group می‌شود تا آفست‌های ایندکس با فایل یکی باشد
+        for start in range(0, table.num_rows, self.row_group_size):
+            chunk = table.slice(start, self.row_group_size)
+            self._writer.write_table(chunk, row_group_size=self.row_group_size)
+            self._row_groups.append(_fences(chunk, self._rows, self.fence_rows))
+            self._rows += chunk.num_rows
+
+    def write_df(self, df: pd.DataFrame):
+        self.write_table(pa.Table.from_pandas(df, schema=self.schema, preserve_index=False))
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            WellIndex(self._row_groups, file_signature(self.file_path)).save(index_path_for(self.file_path))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class WellIndex:
+    def __init__(self, row_groups: List[Dict[str, Any]], signature: Optional[Dict[str, int]] = None):
+        """
+        ایندکس بازه‌های زمان و عمق یک فایل پارکت
+
+        پارامترها:
+            row_groups: لیست ورودی‌های row group (آفست، تعداد سطر، بازه‌ها و حصارها)
+            signature: امضای فایل هنگام ساخت ایندکس (`file_signature`)
+        """
+        self.row_groups = row_groups
+        self.signature = signature
+
+    def matches(self, parquet_path: Union[str, Path]) -> bool:
+        """آیا ایندکس با وضعیت فعلی فایل پارکت سازگار است"""
+        return self.signature is not None and self.signature == file_signature(parquet_path)
+
+    @classmethod
+    def build(cls, parquet_path: Union[str, Path], fence_rows: int = 65536) -> 'WellIndex':
+        """ساخت ایندکس برای فایلی که بدون `IndexedParquetWriter` نوشته شده است"""
+        pf = pq.ParquetFile(parquet_path)
+        columns = [c for c in INDEXED_COLUMNS if c in pf.schema_arrow.names]
+        row_groups, offset = [], 0
+        for rg in range(pf.num_row_groups):
+            table = pf.read_row_group(rg, columns=columns)
+            row_groups.append(_fences(table, offset, fence_rows))
+            offset += table.num_rows
+        return cls(row_groups, file_signature(parquet_path))
+
+    @classmethod
+    def load(cls, index_path: Union[str, Path]) -> 'WellIndex':
+        payload = json.loads(Path(index_path).read_text())
+        if payload.get('version') != INDEX_VERSION:
+            raise ValueError(f"❌ خطا: نسخه ایندکس {index_path} پشتیبانی نمی‌شود!")
+        return cls(payload['row_groups'], payload.get('file'))
+
+    @classmethod
+    def for_file(cls, parquet_path: Union[str, Path], build_missing: bool = True) -> Optional['WellIndex']:
+        """
+        بارگذاری ایندکس کناری؛ در نبود آن یا وقتی با فایل سازگار نیست (نسخه قدیمی یا
+        فایل بازنویسی‌شده) در صورت `build_missing` از نو ساخته و ذخیره می‌شود
+        """
+        index_path = index_path_for(parquet_path)
+        if index_path.exists():
+            try:
+                index = cls.load(index_path)
+            except ValueError:
+                index = None
+            if index is not None and index.matches(parquet_path):
+                return index
+        if not build_missing:
+            return None
+        index = cls.build(parquet_path)
+        index.save(index_path)
+        return index
+
+    def save(self, index_path: Union[str, Path]):
+        Path(index_path).write_text(json.dumps({
+            'version': INDEX_VERSION,
+            'file': self.signature,
+            'row_groups': self.row_groups
+        }))
+
+    @staticmethod
+    def _overlaps(bounds, low, high) -> bool:
+        if bounds is None:
+            return False
+        return (low is None or bounds[1] >= low) and (high is None or bounds[0] <= high)
+
+    @staticmethod
+    def _normalize(time_range, depth_range, well_id) -> Dict[str, Tuple]:
+        conditions = {}
+        if time_range is not None:
+            conditions[TIME_COLUMN] = tuple(
+                None if t is None else pd.Timestamp(t).value for t in time_range
+            )
+        if depth_range is not None:
+            conditions[DEPTH_COLUMN] = tuple(depth_range)
+        if well_id is not None:
+            conditions[WELL_ID_COLUMN] = (well_id, well_id)
+        return conditions
+
+    def locate(
+        self,
+        time_range: Optional[Tuple] = None,
+        depth_range: Optional[Tuple] = None,
+        well_id=None
+    ) -> List[Tuple[int, int, int]]:
+        """
+        پیدا کردن بخش‌هایی از فایل که ممکن است سطرهای بازه را داشته باشند
+
+        خروجی: لیست (شماره row group، سطر شروع، سطر پایان) نسبت به ابتدای row group
+        """
+        conditions = self._normalize(time_range, depth_range, well_id)
+        slices = []
+        for rg, entry in enumerate(self.row_groups):
+            if not all(self._overlaps(entry.get(col), *bounds) for col, bounds in conditions.items()
+                       if col in entry):
+                continue
+            fence_rows = entry['fence_rows']
+            n_fences = -(-entry['num_rows'] // fence_rows)
+            keep = np.ones(n_fences, dtype=bool)
+            for col, bounds in conditions.items():
+                fences = entry.get(f'{col}_fences')
+                if fences is not None:
+                    keep &= np.array([self._overlaps(f, *bounds) for f in fences])
+            # حصارهای مجاور در یک برش پیوسته ادغام می‌شوند
+            start = None
+            for i, flag in enumerate(np.append(keep, False)):
+                if flag and start is None:
+                    start = i
+                elif not flag and start is not None:
+                    slices.append((rg, start * fence_rows, min(i * fence_rows, entry['num_rows'])))
+                    start = None
+        return slices
+
+
+def filter_range(
+    table: pa.Table,
+    time_range: Optional[Tuple] = None,
+    depth_range: Optional[Tuple] = None,
+    well_id=None
+) -> pa.Table:
+    """
+    فیلتر دقیق سطرهای یک بازه زمانی/عمقی یا یک چاه روی جدول درون‌حافظه‌ای
+
+    دو سر بازه‌ها شامل می‌شوند؛ ستون‌های شرط باید در جدول باشند.
+    """
+    mask = None
+    for col, (low, high) in WellIndex._normalize(time_range, depth_range, well_id).items():
+        if col not in table.column_names:
+            raise ValueError(f"❌ خطا: ستون {col} برای فیلتر بازه در داده وجود ندارد!")
+        values = table[col]
+        if pa.types.is_timestamp(values.type):
+            values = values.cast(pa.timestamp('ns')).cast(pa.int64())
+        for op, bound in ((pc.greater_equal, low), (pc.less_equal, high)):
+            if bound is not None:
+                condition = op(values, pa.scalar(bound, type=values.type))
+                mask = condition if mask is None else pc.and_(mask, condition)
+    return table.filter(mask) if mask is not None else table
+
+
+def read_range(
+    parquet_path: Union[str, Path],
+    time_range: Optional[Tuple] = None,
+    depth_range: Optional[Tuple] = None,
+    well_id=None,
+    columns: Optional[List[str]] = None,
+    index: Optional[WellIndex] = None,
+    as_table: bool = False
+) -> Union[pd.DataFrame, pa.Table]:
+    """
+    خواندن فقط سطرهای یک بازه زمانی/عمقی از یک فایل چاه با کمک ایندکس
+
+    فقط row groupهای مرتبط از دیسک خوانده می‌شوند، سپس برش‌های حصار و در
+    نهایت فیلتر دقیق اعمال می‌شود. دو سر بازه‌ها شامل می‌شوند.
+    با `as_table=True` خروجی `pyarrow.Table` است (برای `ArrowBackend`).
+
+    مثال:
+        read_range('well_40100050.parquet', depth_range=(900, 1100))
+    """
+    if index is None:
+        index = WellIndex.for_file(parquet_path)
+    elif not index.matches(parquet_path):
+        raise ValueError(f"❌ خطا: ایندکس داده‌شده با فایل {parquet_path} سازگار نیست!")
+    pf = pq.ParquetFile(parquet_path)
+    conditions = WellIndex._normalize(time_range, depth_range, well_id)
+    read_columns = None
+    if columns is not None:
+        read_columns = list(dict.fromkeys(list(columns) + list(conditions)))
+
+    pieces = []
+    slices = index.locate(time_range, depth_range, well_id)
+    for rg in sorted({rg for rg, _, _ in slices}):
+        table = pf.read_row_group(rg, columns=read_columns)
+        for _, start, stop in (s for s in slices if s[0] == rg):
+            pieces.append(table.slice(start, stop - start))
+    if not pieces:
+        table = pf.schema_arrow.empty_table()
+        if read_columns is not None:
+            table = table.select(read_columns)
+    else:
+        table = pa.concat_tables(pieces)
+
+    table = filter_range(table, time_range, depth_range, well_id)
+    if columns is not None:
+        table = table.select(list(columns))
+    return table if as_table else table.to_pandas()
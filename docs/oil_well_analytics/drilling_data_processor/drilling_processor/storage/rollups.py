@@ -0,0 +1,277 @@
+import argparse
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from ..schema import WELL_ID_COLUMN, TIME_COLUMN, PHASE_COLUMN, TARGET_COLUMN
+
+# رزولوشن‌ها به ترتیب ریز به درشت
+RESOLUTIONS = {
+    '1min': pd.Timedelta(minutes=1),
+    '1h': pd.Timedelta(hours=1),
+    '1D': pd.Timedelta(days=1)
+}
+
+ROLLUP_COLUMNS = [
+    'Pressure_Standpipe',
+    'Pressure_Annulus',
+    'Pressure_Reservoir',
+    'Reservoir_Temperature',
+    'Mud_Temperature_In',
+    'Mud_Temperature_Out',
+    'In_Rate_Flow_Mud',
+    'Out_Rate_Flow_Mud',
+    'ROP'
+]
+
+BUCKET_COLUMN = 'Bucket'
+COUNT_COLUMN = 'Row_Count'
+DAMAGE_PREFIX = 'damage_'
+_KEYS = [WELL_ID_COLUMN, PHASE_COLUMN, BUCKET_COLUMN]
+
+
+class RollupStore:
+    def __init__(
+        self,
+        root_dir: Union[str, Path],
+        columns: Optional[List[str]] = None,
+        resolutions: Optional[Dict[str, pd.Timedelta]] = None
+    ):
+        """
+        ذخیره خلاصه‌های زمانی چندرزولوشنه (۱ دقیقه / ۱ ساعت / ۱ روز) برای هر چاه و فاز
+
+        برای هر ستون مجموع، تعداد مقادیر غیرخالی، کمینه و بیشینه ذخیره می‌شود تا
+        خلاصه‌ها قابل ادغام باشند؛ میانگین هنگام پرس‌وجو محاسبه می‌شود. هر
+        به‌روزرسانی یک فایل part جدید می‌نویسد (هزینه متناسب با داده جدید) و
+        `compact` فایل‌های part هر رزولوشن را در یک فایل ادغام می‌کند.
+
+        ساختار پوشه:
+            root_dir/well=<API_Well_ID>/<resolution>/part-*.parquet
+
+        پارامترها:
+            root_dir: پوشه ذخیره خلاصه‌ها
+            columns: ستون‌های عددی خلاصه‌شده (پیش‌فرض `ROLLUP_COLUMNS`)
+            resolutions: دیکشنری نام رزولوشن -> طول بازه (از ریز به درشت)
+        """
+        self.root_dir = Path(root_dir)
+        self.columns = list(columns or ROLLUP_COLUMNS)
+        self.resolutions = dict(resolutions or RESOLUTIONS)
+
+    def _aggregations(self, frame: pd.DataFrame) -> Dict[str, str]:
+        """نحوه ادغام هر ستون خلاصه"""
+        aggs = {COUNT_COLUMN: 'sum'}
+        for col in self.columns:
+            aggs.update({f'{col}_sum': 'sum', f'{col}_n': 'sum',
+                         f'{col}_min': 'min', f'{col}_max': 'max'})
+        aggs.update({c: 'sum' for c in frame.columns if c.startswith(DAMAGE_PREFIX)})
+        return aggs
+
+    def _combine(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """ادغام سطرهای خلاصه با کلید یکسان"""
+        damage_cols = [c for c in frame.columns if c.startswith(DAMAGE_PREFIX)]
+        frame[damage_cols] = frame[damage_cols].fillna(0)
+        return frame.groupby(_KEYS, sort=True, observed=True).agg(
+            self._aggregations(frame)
+        ).reset_index()
+
+    def aggregate(self, df: pd.DataFrame, resolution: str) -> pd.DataFrame:
+        """خلاصه‌سازی داده خام ثانیه‌ای در بازه‌های `resolution`"""
+        missing = [c for c in [WELL_ID_COLUMN, TIME_COLUMN, PHASE_COLUMN] + self.columns
+                   if c not in df.columns]
+        if missing:
+            raise ValueError(f"Missing required columns: {missing}")
+
+        keys = [
+            df[WELL_ID_COLUMN],
+            df[PHASE_COLUMN].astype(str),
+            pd.to_datetime(df[TIME_COLUMN]).dt.floor(self.resolutions[resolution]).rename(BUCKET_COLUMN)
+        ]
+        values = df[self.columns]
+        grouped = values.groupby(keys, sort=True)
+        parts = [
+            grouped.size().rename(COUNT_COLUMN),
+            grouped.sum().add_suffix('_sum'),
+            grouped.count().add_suffix('_n'),
+            grouped.min().add_suffix('_min'),
+            grouped.max().add_suffix('_max')
+        ]
+        if TARGET_COLUMN in df.columns:
+            damage = pd.get_dummies(df[TARGET_COLUMN], prefix=DAMAGE_PREFIX[:-1], dtype='int64')
+            parts.append(damage.groupby(keys, sort=True).sum())
+        return pd.concat(parts, axis=1).reset_index()
+
+    def _coarsen(self, rollup: pd.DataFrame, resolution: str) -> pd.DataFrame:
+        """ساخت رزولوشن درشت‌تر از خلاصه ریزتر (بدون خواندن دوباره داده خام)"""
+        coarse = rollup.copy()
+        coarse[BUCKET_COLUMN] = coarse[BUCKET_COLUMN].dt.floor(self.resolutions[resolution])
+        return self._combine(coarse)
+
+    def update(self, df: pd.DataFrame) -> Dict[str, int]:
+        """
+        افزودن داده جدید به خلاصه‌ها (افزایشی)
+
+        خروجی: تعداد سطرهای خلاصه نوشته‌شده برای هر رزولوشن
+        """
+        written = {}
+        rollup = None
+        for resolution in self.resolutions:
+            rollup = self.aggregate(df, resolution) if rollup is None else self._coarsen(rollup, resolution)
+            written[resolution] = self._write(rollup, resolution)
+        return written
+
+    def build_from_parquet(self, file_path: Union[str, Path], batch_rows: int = 1_000_000) -> Dict[str, int]:
+        """ساخت خلاصه‌ها از یک فایل پارکت خام با خواندن دسته‌ای"""
+        pf = pq.ParquetFile(file_path)
+        columns = [c for c in [WELL_ID_COLUMN, TIME_COLUMN, PHASE_COLUMN, TARGET_COLUMN] + self.columns
+                   if c in pf.schema_arrow.names]
+        finest = next(iter(self.resolutions))
+        partials = [
+            self.aggregate(batch.to_pandas(), finest)
+            for batch in pf.iter_batches(batch_size=batch_rows, columns=columns)
+        ]
+        if not partials:
+            return {}
+        # بازه‌های مرزی دسته‌ها قبل از نوشتن ادغام می‌شوند
+        rollup = self._combine(pd.concat(partials, ignore_index=True))
+
+        written = {}
+        for resolution in self.resolutions:
+            if resolution != finest:
+                rollup = self._coarsen(rollup, resolution)
+            written[resolution] = self._write(rollup, resolution)
+        return written
+
+    def _write(self, rollup: pd.DataFrame, resolution: str) -> int:
+        """نوشتن یک فایل part جدید برای هر چاه"""
+        for well_id, part in rollup.groupby(WELL_ID_COLUMN, sort=False):
+            directory = self._directory(well_id, resolution)
+            directory.mkdir(parents=True, exist_ok=True)
+            part.to_parquet(directory / f'part-{uuid.uuid4().hex}.parquet', index=False)
+        return len(rollup)
+
+    def compact(self, well_id=None):
+        """ادغام فایل‌های part هر رزولوشن در یک فایل"""
+        wells = [well_id] if well_id is not None else self.wells()
+        for well in wells:
+            for resolution in self.resolutions:
+                parts = sorted(self._directory(well, resolution).glob('part-*.parquet'))
+                if len(parts) <= 1:
+                    continue
+                self._write(self._read(well, resolution), resolution)
+                for part in parts:
+                    part.unlink()
+
+    def wells(self) -> list:
+        """شناسه چاه‌های موجود در ذخیره"""
+        wells = []
+        for path in sorted(self.root_dir.glob('well=*')):
+            value = path.name.split('=', 1)[1]
+            wells.append(int(value) if value.lstrip('-').isdigit() else value)
+        return wells
+
+    def _directory(self, well_id, resolution: str) -> Path:
+        return self.root_dir / f'well={well_id}' / resolution
+
+    def _read(self, well_id, resolution: str, filters=None) -> pd.DataFrame:
+        parts = sorted(self._directory(well_id, resolution).glob('part-*.parquet'))
+        if not parts:
+            return pd.DataFrame(columns=_KEYS)
+        frames = [pd.read_parquet(p, filters=filters) for p in parts]
+        frame = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        return self._combine(frame) if len(frames) > 1 else frame
+
+    def choose_resolution(self, start, end, min_points: int = 200) -> str:
+        """
+        انتخاب درشت‌ترین رزولوشنی که در بازه حداقل `min_points` نقطه دارد
+
+        اگر هیچ رزولوشنی این شرط را نداشته باشد، ریزترین رزولوشن انتخاب می‌شود.
+        """
+        span = pd.Timestamp(end) - pd.Timestamp(start)
+        for name, width in reversed(list(self.resolutions.items())):
+            if span / width >= min_points:
+                return name
+        return next(iter(self.resolutions))
+
+    def query(
+        self,
+        well_id,
+        start,
+        end,
+        columns: Optional[List[str]] = None,
+        phase: Optional[str] = None,
+        resolution: Optional[str] = None,
+        min_points: int = 200
+    ) -> pd.DataFrame:
+        """
+        پرس‌وجوی سری زمانی خلاصه برای داشبورد
+
+        پارامترها:
+            well_id: شناسه چاه
+            start, end: بازه زمانی [start, end)
+            columns: ستون‌های مورد نیاز (پیش‌فرض همه ستون‌های خلاصه)
+            phase: فیلتر فاز عملیات (None = ادغام همه فازها)
+            resolution: رزولوشن اجباری (None = انتخاب خودکار با `choose_resolution`)
+            min_points: حداقل تعداد نقاط برای انتخاب خودکار رزولوشن
+
+        خروجی: دیتافریم با ستون‌های `Bucket`, `Row_Count`, `<col>_mean/min/max` و شمارش انواع آسیب
+        """
+        start, end = pd.Timestamp(start), pd.Timestamp(end)
+        if end <= start:
+            raise ValueError("❌ خطا: انتهای بازه باید بعد از ابتدای آن باشد!")
+        resolution = resolution or self.choose_resolution(start, end, min_points)
+        if resolution not in self.resolutions:
+            raise ValueError(f"❌ خطا: رزولوشن '{resolution}' تعریف نشده است!")
+        columns = list(columns or self.columns)
+
+        # فیلتر بازه روی footer فایل‌ها اعمال می‌شود و فقط row groupهای لازم خوانده می‌شوند
+        filters = [(BUCKET_COLUMN, '>=', start.floor(self.resolutions[resolution])),
+                   (BUCKET_COLUMN, '<', end)]
+        frame = self._read(well_id, resolution, filters=filters)
+        if frame.empty:
+            empty = pd.DataFrame(columns=[BUCKET_COLUMN, COUNT_COLUMN] + [
+                f'{col}_{stat}' for col in columns for stat in ('mean', 'min', 'max')
+            ])
+            empty.attrs['resolution'] = resolution
+            return empty
+        if phase is not None:
+            frame = frame[frame[PHASE_COLUMN] == phase]
+        else:
+            frame = frame.assign(**{PHASE_COLUMN: 'All'})
+            if len(frame):
+                frame = self._combine(frame)
+
+        result = pd.DataFrame({
+            BUCKET_COLUMN: frame[BUCKET_COLUMN],
+            COUNT_COLUMN: frame[COUNT_COLUMN]
+        })
+        for col in columns:
+            result[f'{col}_mean'] = frame[f'{col}_sum'] / frame[f'{col}_n'].where(frame[f'{col}_n'] > 0)
+            result[f'{col}_min'] = frame[f'{col}_min']
+            result[f'{col}_max'] = frame[f'{col}_max']
+        for col in frame.columns:
+            if col.startswith(DAMAGE_PREFIX):
+                result[col] = frame[col].astype('int64')
+        result.attrs['resolution'] = resolution
+        return result.sort_values(BUCKET_COLUMN).reset_index(drop=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Materialize per-well time-bucket rollups")
+    parser.add_argument('--input-dir', default='well_outputs')
+    parser.add_argument('--output-dir', default='well_rollups')
+    args = parser.parse_args()
+
+    from ..utils.loggers import ProcessingLogger
+    logger = ProcessingLogger()
+    store = RollupStore(args.output_dir)
+    for file_path in sorted(Path(args.input_dir).glob('*.parquet')):
+        written = store.build_from_parquet(file_path)
+        logger.log_processing_step(f"Rollups for {file_path.name}: {written}", "info")
+    store.compact()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,255 @@
+import os
+import shutil
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.ipc as ipc
+
+from ..schema import WELL_ID_COLUMN
+
+FRAME_SUFFIX = '.arrow'
+ARRAY_SUFFIX = '.npy'
+
+
+def default_shared_dir() -> str:
+    """پوشه tmpfs حافظه مشترک (/dev/shm) در صورت وجود، وگرنه پوشه موقت سیستم"""
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        return '/dev/shm'
+    return tempfile.gettempdir()
+
+
+def _as_table(data: Union[pd.DataFrame, pa.Table]) -> pa.Table:
+    if isinstance(data, pa.Table):
+        return data
+    return pa.Table.from_pandas(data, preserve_index=False)
+
+
+def _column_to_pandas(column: pa.ChunkedArray) -> Union[np.ndarray, pd.Series]:
+    """ستون عددی/زمانی بدون مقدار خالی بدون کپی به NumPy؛ بقیه با تبدیل معمول Arrow"""
+    if column.num_chunks == 1 and column.null_count == 0:
+        try:
+            return column.chunk(0).to_numpy(zero_copy_only=True)
+        except pa.ArrowInvalid:
+            pass
+    return column.to_pandas()
+
+
+class SharedFrame:
+    def __init__(
+        self,
+        path: Union[str, Path],
+        num_rows: int,
+        columns: List[str],
+        start: int = 0,
+        stop: Optional[int] = None
+    ):
+        """
+        دستگیره سبک یک جدول در حافظه مشترک (فایل Arrow IPC روی /dev/shm)
+
+        فقط مسیر، بازه سطرها و نام ستون‌ها pickle می‌شود؛ worker با `table()` یا
+        `to_pandas()` جدول را به صورت memory-map و بدون کپی باز می‌کند. دستگیره
+        را می‌توان مستقیم به عنوان `file_path` به `DrillingDataProcessor` داد.
+        """
+        self.path = str(path)
+        self.num_rows = num_rows
+        self.columns = list(columns)
+        self.start = start
+        self.stop = num_rows if stop is None else stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __fspath__(self) -> str:
+        return self.path
+
+    def __repr__(self) -> str:
+        return f"SharedFrame({self.path!r}, rows={self.start}:{self.stop})"
+
+    def slice(self, start: int, stop: int) -> 'SharedFrame':
+        """دستگیره بخشی از سطرها (نسبت به همین دستگیره) بدون هیچ کپی"""
+        start = self.start + max(start, 0)
+        stop = min(self.start + stop, self.stop)
+        return SharedFrame(self.path, self.num_rows, self.columns, start, max(start, stop))
+
+    def table(self, columns: Optional[List[str]] = None) -> pa.Table:
+        """باز کردن جدول با memory-map؛ بافرهای ستون‌ها مستقیماً روی حافظه مشترک‌اند"""
+        with pa.memory_map(self.path, 'r') as source:
+            table = ipc.open_file(source).read_all()
+        if columns is not None:
+            table = table.select(list(columns))
+        if self.start != 0 or self.stop != self.num_rows:
+            table = table.slice(self.start, self.stop - self.start)
+        return table
+
+    def to_pandas(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        دیتافریم pandas روی همان حافظه مشترک
+
+        ستون‌های عددی و زمانی بدون مقدار خالی کپی نمی‌شوند (آرایه‌ها فقط‌خواندنی‌اند
+        و pandas هنگام تغییر، کپی می‌گیرد)؛ ستون‌های متنی/دسته‌ای تبدیل می‌شوند.
+        """
+        table = self.table(columns)
+        data = {name: _column_to_pandas(table[name]) for name in table.column_names}
+        return pd.DataFrame(data, columns=table.column_names, copy=False)
+
+
+class SharedArray:
+    def __init__(self, path: Union[str, Path], shape: Tuple[int, ...], dtype: str):
+        """دستگیره سبک یک آرایه NumPy (فایل .npy روی /dev/shm)"""
+        self.path = str(path)
+        self.shape = tuple(shape)
+        self.dtype = dtype
+
+    def __repr__(self) -> str:
+        return f"SharedArray({self.path!r}, shape={self.shape}, dtype={self.dtype})"
+
+    def array(self) -> np.ndarray:
+        """آرایه فقط‌خواندنی memory-map شده روی حافظه مشترک"""
+        return np.load(self.path, mmap_mode='r')
+
+
+class SharedStore:
+    def __init__(self, directory: Optional[Union[str, Path]] = None):
+        """
+        مالک داده‌های حافظه مشترک در پردازه اصلی
+
+        هر `put_frame`/`put_array` داده را یک بار در یک پوشه اختصاصی روی /dev/shm
+        می‌نویسد و دستگیره‌ای برمی‌گرداند که به جای خود داده به workerها فرستاده
+        می‌شود. `close()` (یا خروج از with) همه فایل‌ها را پاک می‌کند.
+
+        مثال:
+            with SharedStore() as store:
+                handle = store.put_frame(df)
+                pool.map(score_rows, [handle.slice(i, i + 100_000) for i in range(0, len(df), 100_000)])
+        """
+        self.directory = Path(tempfile.mkdtemp(prefix='drilling_shared_', dir=directory or default_shared_dir()))
+        self._counter = 0
+
+    def _next_path(self, suffix: str) -> Path:
+        self._counter += 1
+        return self.directory / f'{self._counter:05d}{suffix}'
+
+    def put_frame(self, data: Union[pd.DataFrame, pa.Table]) -> SharedFrame:
+        """نوشتن جدول به صورت Arrow IPC (یک chunk برای هر ستون) و برگرداندن دستگیره"""
+        if self.directory is None:
+            raise ValueError("❌ خطا: SharedStore بسته شده است!")
+        table = _as_table(data).combine_chunks()
+        path = self._next_path(FRAME_SUFFIX)
+        with pa.OSFile(str(path), 'wb') as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        return SharedFrame(path, table.num_rows, table.column_names)
+
+    def put_array(self, array: np.ndarray) -> SharedArray:
+        """نوشتن آرایه NumPy (مثلاً ماتریس ویژگی) و برگرداندن دستگیره"""
+        if self.directory is None:
+            raise ValueError("❌ خطا: SharedStore بسته شده است!")
+        array = np.ascontiguousarray(array)
+        path = self._next_path(ARRAY_SUFFIX)
+        np.save(path, array)
+        return SharedArray(path, array.shape, array.dtype.str)
+
+    def close(self):
+        if self.directory is not None:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            self.directory = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def well_slices(table: pa.Table, group_column: str = WELL_ID_COLUMN) -> Tuple[pa.Table, List[Tuple[Any, int, int]]]:
+    """
+    مرتب‌سازی (فقط در صورت نیاز) و بازه سطرهای پیوسته هر چاه
+
+    خروجی: (جدول با سطرهای هر چاه کنار هم، لیست (شناسه چاه، شروع، پایان))
+    """
+    if group_column not in table.column_names:
+        raise ValueError(f"❌ خطا: ستون {group_column} در داده وجود ندارد!")
+    if table.num_rows == 0:
+        return table, []
+    keys = table[group_column].to_numpy()
+    boundaries = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+    if len(boundaries) + 1 != len(pd.unique(keys)):
+        # مرتب‌سازی پایدار تا ترتیب سطرهای داخل هر چاه حفظ شود
+        table = table.take(pc.sort_indices(table, [(group_column, 'ascending')]))
+        keys = table[group_column].to_numpy()
+        boundaries = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+    starts = np.concatenate([[0], boundaries])
+    stops = np.concatenate([boundaries, [table.num_rows]])
+    return table, [(keys[s].item(), int(s), int(e)) for s, e in zip(starts, stops)]
+
+
+def _pool(workers: Optional[int], mp_context: Optional[str]) -> ProcessPoolExecutor:
+    context = multiprocessing.get_context(mp_context) if mp_context else None
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context)
+
+
+def _call_frame(func: Callable[[pd.DataFrame], Any], handle: SharedFrame, as_table: bool) -> Any:
+    return func(handle.table() if as_table else handle.to_pandas())
+
+
+def map_wells(
+    func: Callable[[pd.DataFrame], Any],
+    data: Union[pd.DataFrame, pa.Table],
+    workers: Optional[int] = None,
+    group_column: str = WELL_ID_COLUMN,
+    as_table: bool = False,
+    mp_context: Optional[str] = None,
+    directory: Optional[Union[str, Path]] = None
+) -> Dict[Any, Any]:
+    """
+    اجرای موازی `func` روی داده هر چاه با انتقال از طریق حافظه مشترک
+
+    داده یک بار در حافظه مشترک نوشته می‌شود و به هر کار فقط یک `SharedFrame`
+    (چند ده بایت) فرستاده می‌شود؛ worker داده چاه را بدون کپی باز می‌کند.
+    `func` باید در سطح ماژول تعریف شده باشد (قابل pickle).
+
+    خروجی: دیکشنری {شناسه چاه: خروجی func}
+    """
+    table, slices = well_slices(_as_table(data), group_column)
+    with SharedStore(directory) as store:
+        handle = store.put_frame(table)
+        del table
+        with _pool(workers, mp_context) as pool:
+            futures = {
+                well: pool.submit(_call_frame, func, handle.slice(start, stop), as_table)
+                for well, start, stop in slices
+            }
+            return {well: future.result() for well, future in futures.items()}
+
+
+def map_chunks(
+    func: Callable[[pd.DataFrame], Any],
+    data: Union[pd.DataFrame, pa.Table],
+    chunk_rows: int = 100_000,
+    workers: Optional[int] = None,
+    as_table: bool = False,
+    mp_context: Optional[str] = None,
+    directory: Optional[Union[str, Path]] = None
+) -> List[Any]:
+    """
+    اجرای موازی `func` روی بلوک‌های `chunk_rows` سطری (مثلاً امتیازدهی دسته‌ای)
+
+    خروجی: لیست خروجی‌ها به ترتیب بلوک‌ها
+    """
+    if chunk_rows <= 0:
+        raise ValueError("❌ خطا: chunk_rows باید مثبت باشد!")
+    with SharedStore(directory) as store:
+        handle = store.put_frame(data)
+        with _pool(workers, mp_context) as pool:
+            futures = [
+                pool.submit(_call_frame, func, handle.slice(start, start + chunk_rows), as_table)
+                for start in range(0, len(handle), chunk_rows)
+            ]
+            return [future.result() for future in futures]
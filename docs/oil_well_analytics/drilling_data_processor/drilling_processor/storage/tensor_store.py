@@ -0,0 +1,325 @@
+import argparse
+import json
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+from numpy.lib.stride_tricks import as_strided
+
+from ..schema import NUMERIC_FEATURES, TARGET_COLUMN, WELL_ID_COLUMN
+
+META_FILE = 'meta.json'
+FEATURES_FILE = 'features.npy'
+LABELS_FILE = 'labels.npy'
+META_VERSION = 1
+
+Source = Union[str, Path, pd.DataFrame, Sequence[Union[str, Path]], Any]
+
+
+def _iter_frames(source: Source, columns: List[str], batch_rows: int) -> Iterator[pd.DataFrame]:
+    """دسته‌های ورودی از دیتافریم، فایل/پوشه پارکت یا شیء دارای `iter_batches()` (مثل `SyntheticWellGenerator`)"""
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), batch_rows):
+            yield source.iloc[start:start + batch_rows][columns]
+        return
+    if hasattr(source, 'iter_batches'):
+        for batch in source.iter_batches():
+            yield batch.select(columns).to_pandas() if hasattr(batch, 'select') else batch[columns]
+        return
+    if isinstance(source, (str, Path)):
+        source = Path(source)
+        paths = sorted(source.glob('*.parquet')) if source.is_dir() else [source]
+    else:
+        paths = [Path(p) for p in source]
+    for path in paths:
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=batch_rows, columns=columns):
+            yield batch.to_pandas()
+
+
+class TensorStore:
+    def __init__(self, root_dir: Union[str, Path]):
+        """
+        ذخیره ماتریس‌های ویژگی پاک‌شده و نرمال‌شده float32 هر چاه در فایل‌های memory-map
+
+        ساختار پوشه:
+            root_dir/meta.json                        ویژگی‌ها، میانگین/مقیاس، کلاس‌ها، تعداد سطر هر چاه
+            root_dir/well=<API_Well_ID>/features.npy  ماتریس [سطر, ویژگی] float32
+            root_dir/well=<API_Well_ID>/labels.npy    کد کلاس هر سطر (int16)
+
+        فایل‌ها با `np.load(mmap_mode='r')` باز می‌شوند؛ خواندن پنجره‌ها فقط صفحات
+        لازم را از دیسک می‌آورد و هیچ کپی کاملی از سری چاه ساخته نمی‌شود.
+
+        مثال:
+            store = TensorStore.build('well_outputs', 'well_tensors')
+            dataset = WindowDataset(store, window=128, batch_size=256)
+        """
+        self.root_dir = Path(root_dir)
+        meta_path = self.root_dir / META_FILE
+        if not meta_path.exists():
+            raise ValueError(f"❌ خطا: فایل {meta_path} وجود ندارد؛ ابتدا `TensorStore.build` را اجرا کنید!")
+        meta = json.loads(meta_path.read_text())
+        if meta.get('version') != META_VERSION:
+            raise ValueError(f"❌ خطا: نسخه {meta_path} پشتیبانی نمی‌شود!")
+        self.features: List[str] = meta['features']
+        self.mean = np.asarray(meta['mean'], dtype=np.float64)
+        self.scale = np.asarray(meta['scale'], dtype=np.float64)
+        self.classes: List[str] = meta['classes']
+        self.rows: Dict[str, int] = meta['wells']
+        self._cache: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+    @property
+    def wells(self) -> List[str]:
+        return list(self.rows)
+
+    def _well_dir(self, well) -> Path:
+        return self.root_dir / f'well={well}'
+
+    def arrays(self, well) -> Tuple[np.ndarray, np.ndarray]:
+        """ماتریس ویژگی و برچسب‌های یک چاه به صورت memory-map فقط‌خواندنی"""
+        well = str(well)
+        if well not in self._cache:
+            directory = self._well_dir(well)
+            self._cache[well] = (
+                np.load(directory / FEATURES_FILE, mmap_mode='r'),
+                np.load(directory / LABELS_FILE, mmap_mode='r')
+            )
+        return self._cache[well]
+
+    @classmethod
+    def build(
+        cls,
+        source: Source,
+        root_dir: Union[str, Path],
+        features: Optional[List[str]] = None,
+        label_column: str = TARGET_COLUMN,
+        group_column: str = WELL_ID_COLUMN,
+        normalization: Optional['TensorStore'] = None,
+        batch_rows: int = 1_000_000
+    ) -> 'TensorStore':
+        """
+        ساخت فروشگاه در دو گذر دسته‌ای (حافظه مستقل از اندازه داده)
+
+        گذر اول میانگین/انحراف معیار هر ویژگی، کلاس‌ها و تعداد سطر هر چاه را
+        حساب می‌کند؛ گذر دوم مقادیر را نرمال می‌کند، مقادیر گم‌شده را با آخرین
+        مقدار معتبر همان چاه (و در ابتدای سری با میانگین) پر می‌کند و مستقیم در
+        فایل‌های memory-map هر چاه می‌نویسد. سطرهای هر چاه باید به ترتیب زمان باشند.
+
+        پارامترها:
+            source: دیتافریم، فایل/پوشه/لیست پارکت یا `SyntheticWellGenerator`
+            root_dir: پوشه خروجی (محتوای قبلی پاک می‌شود)
+            features: ستون‌های ویژگی (پیش‌فرض `NUMERIC_FEATURES`)
+            normalization: فروشگاه دیگری (مثلاً داده آموزش) که میانگین/مقیاس و کلاس‌هایش استفاده شود
+        """
+        features = list(features or (normalization.features if normalization else NUMERIC_FEATURES))
+        columns = list(dict.fromkeys([group_column, label_column] + features))
+        root_dir = Path(root_dir)
+
+        # گذر اول: آمار نرمال‌سازی، کلاس‌ها و تعداد سطر هر چاه
+        total = np.zeros(len(features))
+        total_sq = np.zeros(len(features))
+        count = np.zeros(len(features))
+        rows: Dict[str, int] = {}
+        labels = set()
+        for df in _iter_frames(source, columns, batch_rows):
+            values = df[features].to_numpy(dtype=np.float64)
+            valid = ~np.isnan(values)
+            total += np.where(valid, values, 0).sum(axis=0)
+            total_sq += np.where(valid, values ** 2, 0).sum(axis=0)
+            count += valid.sum(axis=0)
+            for well, n in df[group_column].value_counts(sort=False).items():
+                rows[str(well)] = rows.get(str(well), 0) + int(n)
+            labels.update(df[label_column].dropna().astype(str).unique())
+        if not rows:
+            raise ValueError("❌ خطا: داده‌ای برای ساخت فروشگاه وجود ندارد!")
+
+        if normalization is not None:
+            mean, scale, classes = normalization.mean, normalization.scale, normalization.classes
+        else:
+            mean = total / np.maximum(count, 1)
+            std = np.sqrt(np.maximum(total_sq / np.maximum(count, 1) - mean ** 2, 0))
+            scale = np.where(std > 0, std, 1.0)
+            classes = sorted(labels)
+        class_index = pd.Index(classes)
+
+        if root_dir.exists():
+            shutil.rmtree(root_dir)
+        writers = {}
+        for well, n in rows.items():
+            directory = root_dir / f'well={well}'
+            directory.mkdir(parents=True)
+            writers[well] = [
+                np.lib.format.open_memmap(directory / FEATURES_FILE, mode='w+',
+                                          dtype=np.float32, shape=(n, len(features))),
+                np.lib.format.open_memmap(directory / LABELS_FILE, mode='w+', dtype=np.int16, shape=(n,)),
+                0,
+                np.zeros(len(features), dtype=np.float32)  # آخرین مقدار معتبر (پس از نرمال‌سازی)
+            ]
+
+        # گذر دوم: نرمال‌سازی، پرکردن رو به جلو و نوشتن در memory-map
+        for df in _iter_frames(source, columns, batch_rows):
+            for well, group in df.groupby(group_column, sort=False):
+                state = writers[str(well)]
+                values = ((group[features].to_numpy(dtype=np.float64) - mean) / scale).astype(np.float32)
+                frame = pd.DataFrame(np.vstack([state[3], values])).ffill()
+                values = frame.to_numpy(dtype=np.float32)[1:]
+                position = state[2]
+                state[0][position:position + len(values)] = values
+                codes = class_index.get_indexer(group[label_column].astype(str))
+                state[1][position:position + len(values)] = codes
+                state[2] = position + len(values)
+                state[3] = values[-1]
+        for features_map, labels_map, _, _ in writers.values():
+            features_map.flush()
+            labels_map.flush()
+        del writers
+
+        (root_dir / META_FILE).write_text(json.dumps({
+            'version': META_VERSION,
+            'features': features,
+            'mean': np.asarray(mean).tolist(),
+            'scale': np.asarray(scale).tolist(),
+            'classes': list(classes),
+            'wells': rows
+        }))
+        return cls(root_dir)
+
+
+class WindowDataset:
+    def __init__(
+        self,
+        store: TensorStore,
+        window: int = 128,
+        stride: int = 1,
+        horizon: int = 0,
+        batch_size: int = 256,
+        shuffle: bool = True,
+        wells: Optional[Sequence] = None,
+        seed: Optional[int] = None,
+        prefetch: bool = True
+    ):
+        """
+        دیتاست پنجره‌های لغزان برای آموزش مدل‌های توالی (LSTM/GRU)
+
+        پنجره‌های هر چاه یک view گام‌دار (`as_strided`) روی ماتریس memory-map
+        هستند و ساخته نمی‌شوند؛ تنها کپی، جمع‌کردن پنجره‌های انتخاب‌شده در آرایه
+        پیوسته دسته است. برچسب هر پنجره کلاس سطر `horizon` گام پس از آخرین سطر
+        پنجره است. در حالت `shuffle` هر دسته از شماره‌های تصادفی پنجره در کل
+        چاه‌ها (با جایگذاری، حافظه ثابت) ساخته می‌شود و دسته بعدی هم‌زمان در یک
+        thread آماده می‌شود.
+
+        پارامترها:
+            store: `TensorStore`
+            window: طول پنجره (تعداد سطر)
+            stride: فاصله شروع پنجره‌های متوالی
+            horizon: فاصله سطر برچسب از انتهای پنجره (۰ = آخرین سطر پنجره)
+            batch_size: تعداد پنجره در هر دسته
+            shuffle: نمونه‌برداری تصادفی در همه چاه‌ها؛ False = ترتیب پیوسته
+            wells: زیرمجموعه چاه‌ها (پیش‌فرض همه)
+            seed: بذر تصادفی
+            prefetch: آماده‌سازی دسته بعد در thread جداگانه
+
+        خروجی هر گام پیمایش: (X با شکل [batch, window, features] از نوع float32, y با شکل [batch])
+        """
+        if window <= 0 or stride <= 0 or batch_size <= 0 or horizon < 0:
+            raise ValueError("❌ خطا: window، stride و batch_size باید مثبت و horizon نامنفی باشد!")
+        self.store = store
+        self.window = window
+        self.stride = stride
+        self.horizon = horizon
+        self.batch_size = batch_size
+        self.shuffle = shuffle
+        self.prefetch = prefetch
+        self.rng = np.random.default_rng(seed)
+        self.wells = [str(w) for w in (wells if wells is not None else store.wells)]
+
+        counts = np.array([self._n_windows(store.rows[w]) for w in self.wells], dtype=np.int64)
+        self._offsets = np.concatenate([[0], np.cumsum(counts)])
+        self._views = [self.window_view(w) for w in self.wells]
+        self._labels = [store.arrays(w)[1] for w in self.wells]
+
+    def _n_windows(self, rows: int) -> int:
+        span = self.window + self.horizon
+        return 0 if rows < span else (rows - span) // self.stride + 1
+
+    @property
+    def n_windows(self) -> int:
+        return int(self._offsets[-1])
+
+    def __len__(self) -> int:
+        """تعداد دسته‌های هر epoch"""
+        return -(-self.n_windows // self.batch_size)
+
+    def window_view(self, well) -> np.ndarray:
+        """همه پنجره‌های یک چاه با شکل [پنجره, window, features] بدون هیچ کپی"""
+        features = self.store.arrays(well)[0]
+        n = self._n_windows(len(features))
+        row_stride, column_stride = features.strides
+        return as_strided(
+            features,
+            shape=(n, self.window, features.shape[1]),
+            strides=(row_stride * self.stride, row_stride, column_stride),
+            writeable=False
+        )
+
+    def _batch(self, ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """جمع‌کردن پنجره‌های شماره‌های سراسری `ids` (مرتب بر حسب چاه) در یک آرایه پیوسته"""
+        ids = np.sort(ids)
+        well_index = np.searchsorted(self._offsets, ids, side='right') - 1
+        X = np.empty((len(ids), self.window, len(self.store.features)), dtype=np.float32)
+        y = np.empty(len(ids), dtype=np.int16)
+        bounds = np.flatnonzero(np.diff(well_index)) + 1
+        for start, stop in zip(np.concatenate([[0], bounds]), np.concatenate([bounds, [len(ids)]])):
+            w = well_index[start]
+            local = ids[start:stop] - self._offsets[w]
+            X[start:stop] = self._views[w][local]
+            y[start:stop] = self._labels[w][local * self.stride + self.window - 1 + self.horizon]
+        return X, y
+
+    def _batch_ids(self) -> Iterator[np.ndarray]:
+        total = self.n_windows
+        for start in range(0, total, self.batch_size):
+            if self.shuffle:
+                yield self.rng.integers(0, total, min(self.batch_size, total - start))
+            else:
+                yield np.arange(start, min(start + self.batch_size, total))
+
+    def __iter__(self) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        if not self.prefetch:
+            for ids in self._batch_ids():
+                yield self._batch(ids)
+            return
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = None
+            for ids in self._batch_ids():
+                future = executor.submit(self._batch, ids)
+                if pending is not None:
+                    yield pending.result()
+                pending = future
+            if pending is not None:
+                yield pending.result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write per-well normalized float32 feature tensors for sequence models")
+    parser.add_argument('--input-dir', default='well_outputs')
+    parser.add_argument('--output-dir', default='well_tensors')
+    parser.add_argument('--features', nargs='+', default=None)
+    parser.add_argument('--normalization-from', default=None, help='existing store whose mean/scale are reused')
+    parser.add_argument('--batch-rows', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    from ..utils.loggers import ProcessingLogger
+    logger = ProcessingLogger()
+    normalization = TensorStore(args.normalization_from) if args.normalization_from else None
+    store = TensorStore.build(args.input_dir, args.output_dir, features=args.features,
+                              normalization=normalization, batch_rows=args.batch_rows)
+    for well, rows in store.rows.items():
+        logger.log_processing_step(f"Tensor store well {well}: {rows} rows x {len(store.features)} features", "info")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,21 @@
+"""
+Streaming Processing
+
+Contains:
+- sources: Pluggable record sources (in-process queue, parquet and synthetic replayers)
+- engine: Incremental cleaning, featurization, scoring and damage alerts
+"""
+
+from .._lazy import lazy_exports
+
+_EXPORTS = {
+    'QueueSource': '.sources',
+    'ParquetReplaySource': '.sources',
+    'replay_directory': '.sources',
+    'SyntheticReplaySource': '.sources',
+    'synthetic_sources': '.sources',
+    'StreamingEngine': '.engine'
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,234 @@
+import argparse
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..preprocessors.cleaners import DataCleaner
+from ..preprocessors.feature_engine import FeatureEngineer
+from ..schema import (
+    WELL_ID_COLUMN,
+    TIME_COLUMN,
+    NO_DAMAGE_LABEL,
+    PROCESSOR_COLUMN_ALIASES
+)
+from ..serving.batcher import LatencyTracker
+from ..utils.loggers import ProcessingLogger
+
+
+class StreamingEngine:
+    def __init__(
+        self,
+        model,
+        alert_threshold: float = 0.8,
+        alert_cooldown_seconds: float = 60.0,
+        on_alert: Optional[Callable[[Dict[str, Any]], None]] = None,
+        max_queue_batches: int = 1000,
+        keep_alerts: int = 10000,
+        logger: Optional[ProcessingLogger] = None,
+        drift_monitor=None,
+        engineer_features: bool = False
+    ):
+        """
+        موتور پردازش جریانی: پاک‌سازی، ساخت ویژگی و امتیازدهی افزایشی رکوردهای چاه
+
+        همه منابع (یکی برای هر چاه) هم‌زمان در یک صف مشترک می‌ریزند؛ مصرف‌کننده
+        هرچه در صف آماده است را در یک دسته اجرا می‌کند تا هزینه هر فراخوانی مدل
+        بین چاه‌ها تقسیم شود. پاک‌سازی با ایمپوت افزایشی `DataCleaner` (آمار
+        جداگانه برای هر چاه) و در صورت درخواست ساخت ویژگی با `FeatureEngineer` انجام می‌شود.
+
+        پارامترها:
+            model: شیء دارای `predict_proba` و `classes_` (پایپ‌لاین sklearn یا `OnnxDamagePredictor`)
+            alert_threshold: حداقل احتمال کلاس آسیب برای صدور هشدار
+            alert_cooldown_seconds: فاصله زمانی (زمان داده) بین هشدارهای تکراری هر چاه و نوع آسیب
+            on_alert: تابعی که برای هر هشدار فراخوانی می‌شود
+            max_queue_batches: ظرفیت صف مشترک (فشار معکوس روی منابع)
+            keep_alerts: تعداد آخرین هشدارهای نگهداری‌شده در `alerts`
+            logger: لاگر پردازش (اختیاری)
+            drift_monitor: `DriftMonitor` برای پایش رانش رکوردهای خام هر دسته (اختیاری)؛
+                باید `check_every_rows` داشته باشد چون موتور فقط `update` را صدا می‌زند
+            engineer_features: ساخت ویژگی‌های `FeatureEngineer.apply_available` (مثل `PT_Ratio`)
+                پیش از امتیازدهی؛ فقط برای مدلی که روی این ستون‌ها آموزش دیده لازم است
+        """
+        if drift_monitor is not None and drift_monitor.check_every_rows is None:
+            raise ValueError("❌ خطا: drift_monitor موتور جریانی باید check_every_rows داشته باشد!")
+        self.model = model
+        self.classes = np.asarray(model.classes_)
+        self.alert_threshold = alert_threshold
+        self.alert_cooldown = pd.Timedelta(seconds=alert_cooldown_seconds)
+        self.on_alert = on_alert
+        self.max_queue_batches = max_queue_batches
+        self.logger = logger
+        self.feature_engineer = FeatureEngineer() if engineer_features else None
+        self.alerts = deque(maxlen=keep_alerts)
+        self.latency = LatencyTracker()
+        self.records_processed = 0
+        self.cleaner = DataCleaner()
+        self.drift_monitor = drift_monitor
+        self._wells = set()
+        self._last_alert: Dict[tuple, pd.Timestamp] = {}
+
+    def _clean(self, df: pd.DataFrame) -> pd.DataFrame:
+        """ایمپوت افزایشی با آمار جداگانه برای هر چاه"""
+        self._wells.update(df[WELL_ID_COLUMN].unique())
+        return self.cleaner.handle_missing_values_incremental(df, group_column=WELL_ID_COLUMN)
+
+    def _featurize(self, df: pd.DataFrame) -> pd.DataFrame:
+        aliases = {
+            src: dst for src, dst in PROCESSOR_COLUMN_ALIASES.items()
+            if src in df.columns and dst not in df.columns
+        }
+        for src, dst in aliases.items():
+            df[dst] = df[src]
+        return self.feature_engineer.apply_available(df)
+
+    def process_batch(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """پردازش هم‌زمان یک دسته از رکوردهای یک یا چند چاه و بازگرداندن هشدارها"""
+        if self.drift_monitor is not None:
+            # رانش روی داده خام سنجیده می‌شود؛ ایمپوت تغییر نرخ مقادیر گم‌شده را پنهان می‌کند
+            self.drift_monitor.update(df)
+        df = self._clean(df)
+        if self.feature_engineer is not None:
+            df = self._featurize(df)
+        proba = np.asarray(self.model.predict_proba(df))
+        best = proba.argmax(axis=1)
+        best_proba = proba[np.arange(len(best)), best]
+        labels = self.classes[best]
+
+        alerts = []
+        candidates = (labels != NO_DAMAGE_LABEL) & (best_proba >= self.alert_threshold)
+        # فقط ستون‌های لازم سطرهای نامزد یک‌جا استخراج می‌شوند، نه سطر به سطر
+        records = df.loc[candidates, [WELL_ID_COLUMN, TIME_COLUMN]].to_dict('records')
+        for i, record in zip(np.flatnonzero(candidates), records):
+            key = (record[WELL_ID_COLUMN], labels[i])
+            timestamp = pd.Timestamp(record[TIME_COLUMN])
+            last = self._last_alert.get(key)
+            if last is not None and timestamp - last < self.alert_cooldown:
+                continue
+            self._last_alert[key] = timestamp
+            alerts.append({
+                'well_id': record[WELL_ID_COLUMN],
+                'timestamp': timestamp,
+                'damage_type': str(labels[i]),
+                'probability': float(best_proba[i]),
+                'row': int(i)
+            })
+        return alerts
+
+    async def _pump(self, source, queue: asyncio.Queue):
+        async for item in source:
+            await queue.put(item)
+
+    async def run(self, sources: list, duration: Optional[float] = None) -> Dict[str, Any]:
+        """
+        اجرای هم‌زمان همه منابع تا پایان آن‌ها یا گذشت `duration` ثانیه
+
+        خروجی: خلاصه شامل تعداد رکوردها، توان عملیاتی و تأخیر p50/p99
+        """
+        loop = asyncio.get_running_loop()
+        queue = asyncio.Queue(self.max_queue_batches)
+        producers = [loop.create_task(self._pump(src, queue)) for src in sources]
+        started = time.perf_counter()
+        deadline = started + duration if duration is not None else None
+
+        async def consume():
+            while True:
+                if all(p.done() for p in producers) and queue.empty():
+                    return
+                try:
+                    first = await asyncio.wait_for(queue.get(), 0.1)
+                except asyncio.TimeoutError:
+                    continue
+                items = [first]
+                while not queue.empty():
+                    items.append(queue.get_nowait())
+                frame = pd.concat([df for df, _ in items], ignore_index=True)
+                available_at = np.concatenate([t for _, t in items])
+
+                alerts = await loop.run_in_executor(None, self.process_batch, frame)
+                done_at = time.perf_counter()
+                for latency in done_at - available_at:
+                    self.latency.record(latency)
+                self.records_processed += len(frame)
+                for alert in alerts:
+                    alert['latency_ms'] = float((done_at - available_at[alert.pop('row')]) * 1e3)
+                    self._emit(alert)
+
+        consumer = loop.create_task(consume())
+        try:
+            if deadline is None:
+                await consumer
+            else:
+                await asyncio.wait_for(consumer, max(0.0, deadline - time.perf_counter()))
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            for task in producers + [consumer]:
+                task.cancel()
+            await asyncio.gather(*producers, consumer, return_exceptions=True)
+
+        elapsed = time.perf_counter() - started
+        for p in producers:
+            if p.done() and not p.cancelled() and p.exception() is not None:
+                raise p.exception()
+        if self.drift_monitor is not None:
+            # سطرهای پس از آخرین بررسی خودکار هم در خلاصه سنجیده می‌شوند
+            self.drift_monitor.check()
+        return self.summary(elapsed)
+
+    def _emit(self, alert: Dict[str, Any]):
+        self.alerts.append(alert)
+        if self.logger is not None:
+            self.logger.log_processing_step(
+                f"Damage alert well={alert['well_id']} type={alert['damage_type']} "
+                f"p={alert['probability']:.2f} latency={alert['latency_ms']:.1f}ms",
+                "warning"
+            )
+        if self.on_alert is not None:
+            self.on_alert(alert)
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        return {
+            'records': self.records_processed,
+            'wells': len(self._wells),
+            'alerts': len(self.alerts),
+            'elapsed_s': elapsed,
+            'records_per_s': self.records_processed / elapsed if elapsed > 0 else 0.0,
+            'latency_p50_ms': self.latency.percentile(50),
+            'latency_p99_ms': self.latency.percentile(99),
+            'drifted_features': len(self.drift_monitor.drifted) if self.drift_monitor is not None else None
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay well parquet files through the streaming engine")
+    parser.add_argument('--input-dir', default='well_outputs')
+    parser.add_argument('--model', required=True, help="path to .onnx or joblib pipeline")
+    parser.add_argument('--speed', type=float, default=60.0, help="replay speed (x real time)")
+    parser.add_argument('--duration', type=float, default=None)
+    parser.add_argument('--alert-threshold', type=float, default=0.8)
+    parser.add_argument('--engineer-features', action='store_true',
+                        help="add FeatureEngineer columns (PT_Ratio, ...) before scoring")
+    args = parser.parse_args()
+
+    from .sources import replay_directory
+
+    if args.model.endswith('.onnx'):
+        from ..pipelines.onnx_export import OnnxDamagePredictor
+        model = OnnxDamagePredictor(args.model)
+    else:
+        import joblib
+        model = joblib.load(args.model)
+
+    logger = ProcessingLogger()
+    engine = StreamingEngine(model, alert_threshold=args.alert_threshold, logger=logger,
+                             engineer_features=args.engineer_features)
+    summary = asyncio.run(engine.run(replay_directory(args.input_dir, args.speed), args.duration))
+    logger.log_processing_step(f"Streaming summary: {summary}", "info")
+
+
+if __name__ == '__main__':
+    main()
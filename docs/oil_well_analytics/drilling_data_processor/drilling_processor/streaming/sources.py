@@ -0,0 +1,160 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from ..schema import TIME_COLUMN
+
+# هر آیتم منبع: (دسته رکوردها, زمان دسترس‌پذیری هر رکورد بر حسب perf_counter)
+StreamItem = Tuple[pd.DataFrame, np.ndarray]
+
+
+class QueueSource:
+    def __init__(self, maxsize: int = 0):
+        """
+        منبع درون‌پردازه‌ای؛ تولیدکننده‌ها رکورد را با `put` وارد می‌کنند
+
+        جایگزین محلی broker (مثل Kafka) برای تست و اجرای درون‌فرآیندی.
+        رکوردهای در صف هنگام خواندن در یک دسته تجمیع می‌شوند.
+        """
+        self._queue = asyncio.Queue(maxsize)
+        self._closed = object()
+
+    async def put(self, record: Dict[str, Any]):
+        await self._queue.put((record, time.perf_counter()))
+
+    def put_nowait(self, record: Dict[str, Any]):
+        self._queue.put_nowait((record, time.perf_counter()))
+
+    async def close(self):
+        """پایان جریان؛ بعد از تخلیه صف، پیمایش متوقف می‌شود"""
+        await self._queue.put(self._closed)
+
+    async def __aiter__(self) -> AsyncIterator[StreamItem]:
+        while True:
+            items = [await self._queue.get()]
+            while not self._queue.empty():
+                items.append(self._queue.get_nowait())
+            closed = items[-1] is self._closed
+            if closed:
+                items.pop()
+            if items:
+                records, times = zip(*items)
+                yield pd.DataFrame.from_records(records), np.array(times)
+            if closed:
+                return
+
+
+class ReplaySource(ABC):
+    def __init__(self, speed: float = 1.0, min_tick: float = 0.01):
+        """
+        پایه منابع بازپخش با سرعت N برابر زمان واقعی
+
+        زمان هر رکورد از ستون `DateTime` خوانده می‌شود؛ رکوردی که زمانش رسیده
+        در اولین tick بعدی منتشر می‌شود و زمان برنامه‌ریزی‌شده‌اش به‌عنوان زمان
+        دسترس‌پذیری ثبت می‌شود تا تأخیر انتها به انتها قابل اندازه‌گیری باشد.
+        زیرکلاس‌ها فقط `_frames()` (دسته‌های مرتب بر حسب زمان) را پیاده می‌کنند.
+
+        پارامترها:
+            speed: ضریب سرعت نسبت به زمان واقعی (`float('inf')` = بدون مکث)
+            min_tick: حداقل فاصله بین انتشارها (ثانیه)
+        """
+        if speed <= 0:
+            raise ValueError("❌ خطا: speed باید مثبت باشد!")
+        self.speed = speed
+        self.min_tick = min_tick
+
+    @abstractmethod
+    def _frames(self) -> Iterator[pd.DataFrame]:
+        """دسته‌های رکورد مرتب بر حسب `DateTime`"""
+
+    async def __aiter__(self) -> AsyncIterator[StreamItem]:
+        wall_start = None
+        data_start = None
+        for df in self._frames():
+            seconds = pd.to_datetime(df[TIME_COLUMN]).to_numpy(dtype='datetime64[ns]')
+            if data_start is None:
+                data_start = seconds[0]
+                wall_start = time.perf_counter()
+            # زمان دسترس‌پذیری هر رکورد روی ساعت perf_counter
+            offsets = (seconds - data_start).astype('timedelta64[ns]').astype(np.int64) / 1e9
+            due = wall_start + offsets / self.speed
+
+            position = 0
+            while position < len(df):
+                now = time.perf_counter()
+                end = int(np.searchsorted(due, now, side='right'))
+                if end > position:
+                    yield df.iloc[position:end], due[position:end]
+                    position = end
+                if position < len(df):
+                    await asyncio.sleep(max(self.min_tick, due[position] - time.perf_counter()))
+
+
+class ParquetReplaySource(ReplaySource):
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        speed: float = 1.0,
+        read_batch_rows: int = 65536,
+        min_tick: float = 0.01
+    ):
+        """
+        بازپخش فایل `well_*.parquet` با سرعت N برابر زمان واقعی
+
+        پارامترها:
+            file_path: مسیر فایل پارکت یک چاه
+            speed: ضریب سرعت نسبت به زمان واقعی (`float('inf')` = بدون مکث)
+            read_batch_rows: اندازه دسته‌های خواندن از فایل
+            min_tick: حداقل فاصله بین انتشارها (ثانیه)
+        """
+        super().__init__(speed, min_tick)
+        self.file_path = Path(file_path)
+        self.read_batch_rows = read_batch_rows
+
+    def _frames(self) -> Iterator[pd.DataFrame]:
+        pf = pq.ParquetFile(self.file_path)
+        for batch in pf.iter_batches(batch_size=self.read_batch_rows):
+            yield batch.to_pandas()
+
+
+class SyntheticReplaySource(ReplaySource):
+    def __init__(self, generator, well_id: int, speed: float = 1.0, min_tick: float = 0.01):
+        """
+        جریان یک چاه مستقیم از `SyntheticWellGenerator` بدون نوشتن فایل
+
+        دسته‌ها هنگام پیمایش تولید می‌شوند؛ اندازه هر دسته `batch_rows` سناریو است.
+
+        پارامترها:
+            generator: نمونه `SyntheticWellGenerator`
+            well_id: شناسه چاه در سناریو
+        """
+        super().__init__(speed, min_tick)
+        self.generator = generator
+        self.well_id = well_id
+
+    def _frames(self) -> Iterator[pd.DataFrame]:
+        for batch in self.generator.iter_batches([self.well_id]):
+            yield batch.to_pandas()
+
+
+def replay_directory(
+    input_dir: Union[str, Path],
+    speed: float = 1.0,
+    pattern: str = 'well_*.parquet'
+) -> List[ParquetReplaySource]:
+    """ساخت یک منبع بازپخش برای هر فایل چاه در پوشه"""
+    files = sorted(Path(input_dir).glob(pattern))
+    if not files:
+        raise ValueError(f"❌ خطا: هیچ فایلی با الگوی {pattern} در {input_dir} پیدا نشد!")
+    return [ParquetReplaySource(f, speed=speed) for f in files]
+
+
+def synthetic_sources(generator, speed: float = 1.0) -> List[SyntheticReplaySource]:
+    """ساخت یک منبع جریانی برای هر چاه سناریوی `SyntheticWellGenerator`"""
+    return [SyntheticReplaySource(generator, well_id, speed=speed) for well_id in generator.scenario.well_ids]
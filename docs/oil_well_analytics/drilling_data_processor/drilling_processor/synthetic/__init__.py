@@ -0,0 +1,18 @@
+"""
+Synthetic Well Data
+
+Contains:
+- scenario: Scenario configuration (wells, time span, row rate, base maps)
+- generator: Lazy Arrow record-batch generator for synthetic well data
+"""
+
+from .._lazy import lazy_exports
+
+_EXPORTS = {
+    'Scenario': '.scenario',
+    'DEFAULT_WELLS': '.scenario',
+    'SyntheticWellGenerator': '.generator'
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
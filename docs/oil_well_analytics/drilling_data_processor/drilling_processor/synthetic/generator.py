@@ -0,0 +1,317 @@
+import argparse
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from ..schema import NO_DAMAGE_LABEL, PROCESSOR_COLUMN_ALIASES
+from .scenario import Scenario, PHASES
+
+ACTIVE_DAMAGE_LEVELS = ['No', 'Yes']
+# قواعد نوع آسیب به ترتیب اولویت (همان قواعد `determine_damage_type` اسکریپت قدیمی)
+DAMAGE_RULES = [
+    'Clay & Iron Control',
+    'Drilling-Induced Damage',
+    'Fluid Loss',
+    'Scale / Sludge Incompatibility',
+    'Near-Wellbore Emulsions',
+    'Rock/Fluid Interaction',
+    'Completion Damage',
+    'Stress/Corrosion Cracking',
+    'Surface Filtration',
+    'Ultra-Clean Fluids Control'
+]
+DAMAGE_LEVELS = DAMAGE_RULES + ['Generic Damage', NO_DAMAGE_LABEL]
+
+
+def _categorical(codes: np.ndarray, levels: Sequence[str]) -> pa.DictionaryArray:
+    return pa.DictionaryArray.from_arrays(pa.array(codes.astype(np.int8)), pa.array(list(levels)))
+
+
+def _choice(rng: np.random.Generator, probs: Dict[str, float], n: int) -> np.ndarray:
+    """کد سطح‌های دسته‌ای با احتمال‌های داده‌شده (نرمال‌سازی‌شده)"""
+    p = np.asarray(list(probs.values()), dtype=float)
+    return rng.choice(len(p), size=n, p=p / p.sum())
+
+
+def _lookup(mapping: Dict[str, float], levels: Sequence[str], codes: np.ndarray) -> np.ndarray:
+    return np.asarray([mapping[level] for level in levels], dtype=float)[codes]
+
+
+class SyntheticWellGenerator:
+    def __init__(self, scenario: Optional[Scenario] = None, **overrides):
+        """
+        تولیدکننده تنبل داده مصنوعی چاه به صورت `pyarrow.RecordBatch`
+
+        داده هیچ‌گاه کامل ساخته نمی‌شود: هر دسته `batch_rows` سطری فقط هنگام
+        پیمایش و به صورت برداری تولید می‌شود و بذر تصادفی آن از (seed، چاه،
+        شماره دسته) به دست می‌آید، پس هر بخش از داده مستقل و تکرارپذیر است.
+        ستون‌های دسته‌ای به صورت dictionary (category در pandas) ساخته می‌شوند.
+
+        خروجی را می‌توان مستقیم به `DrillingDataProcessor` (با `column_set='processor'`)،
+        منبع جریانی `SyntheticReplaySource` یا بنچمارک‌ها داد.
+
+        پارامترها:
+            scenario: پیکربندی `Scenario` (پیش‌فرض: سناریوی پیش‌فرض)
+            overrides: کلیدهای سازنده `Scenario` برای جایگزینی
+
+        مثال:
+            generator = SyntheticWellGenerator(wells=[(1, -94.8, 32.2)], duration='1D')
+            for batch in generator.iter_batches():
+                ...
+        """
+        if scenario is None:
+            scenario = Scenario(**overrides)
+        elif overrides:
+            config = {**scenario.to_dict(), **overrides}
+            if 'duration' in overrides and 'records_per_well' not in overrides:
+                config['records_per_well'] = None
+            scenario = Scenario.from_dict(config)
+        self.scenario = scenario
+        self._wells = {well_id: (long_val, lat_val) for well_id, long_val, lat_val in scenario.wells}
+
+    def __repr__(self) -> str:
+        return f"SyntheticWellGenerator({self.scenario!r})"
+
+    @property
+    def schema(self) -> pa.Schema:
+        well_id = self.scenario.well_ids[0]
+        return self.generate_batch(well_id, 0, 1).schema
+
+    def _rng(self, well_id: int, start: int) -> np.random.Generator:
+        return np.random.default_rng([self.scenario.seed, well_id, start // self.scenario.batch_rows])
+
+    def generate_batch(self, well_id: int, start: int, rows: int) -> pa.RecordBatch:
+        """
+        تولید سطرهای [start, start + rows) یک چاه
+
+        `start` باید مضربی از `batch_rows` باشد تا خروجی با پیمایش عادی یکسان بماند.
+        """
+        s = self.scenario
+        rng = self._rng(well_id, start)
+        long_val, lat_val = self._wells[well_id]
+        n = rows
+        randn = lambda: rng.standard_normal(n)  # noqa: E731
+
+        index = np.arange(start, start + n, dtype=np.int64)
+        elapsed_ns = (index * (1e9 / s.rows_per_second)).astype(np.int64)
+        date_time = np.datetime64(s.start.value, 'ns') + elapsed_ns.astype('timedelta64[ns]')
+        days = elapsed_ns // (86400 * 10 ** 9)
+        phase = np.searchsorted(np.asarray(s.phase_days), days, side='right')
+
+        formations = list(s.formation_probs)
+        clays = list(s.clay_probs)
+        completions = list(s.completion_probs)
+        muds = list(s.mud_probs)
+        formation = _choice(rng, s.formation_probs, n)
+        clay = _choice(rng, s.clay_probs, n)
+        fractures = (rng.random(n) < _lookup(s.fracture_prob, formations, formation)).astype(np.int64)
+        temperature = _lookup(s.temp_base, formations, formation) + randn() * 2
+        permeability = _lookup(s.perm_base, formations, formation) + randn() * 5
+        clay_content = _lookup(s.clay_base, clays, clay) + randn() * 3
+        completion = _choice(rng, s.completion_probs, n)
+        perforation = _lookup(s.density_perforation_map, completions, completion) + randn() * 2
+
+        depth = days * 5 + randn() * 10 + 500
+        depth_bit = depth - rng.random(n) * 10
+        drilling = phase == 0
+        wob = _lookup(s.wob_map, PHASES, phase) + randn() * 300
+        rpm = np.where(drilling, 120 + randn() * 10, 50 + randn() * 5)
+        rop = np.where(drilling, 10 + 5 * rng.random(n), 0.0)
+        torque = wob / 10 + randn() * 50
+        standpipe = 3000 + rop * 20 + randn() * 100
+        annulus = standpipe - 200 + randn() * 50
+        overbalance = 100 + randn() * 20
+        reservoir_pressure = 5000 + randn() * 300
+
+        mud = _choice(rng, s.mud_probs, n)
+        flow_in = 100 + 10 * randn()
+        weight_in = 9 + 0.5 * randn()
+        temp_in = 40 + 5 * randn()
+        chloride = 500 + 50 * randn()
+        solid = 10 + 5 * randn()
+        ph = 7 + randn() * 0.5
+        flow_out = flow_in * (0.95 + 0.05 * rng.random(n))
+        pit = 500 + 100 * randn()
+        temp_out = temp_in - (1 + 0.5 * rng.random(n))
+        viscosity = 15 + 5 * randn()
+        fluid_loss = np.clip(0.5 + 0.1 * randn(), 0, None)
+        weight_out = weight_in * (0.95 + 0.05 * rng.random(n))
+
+        injected = rng.random(n) < s.injected_fraction
+        temperature[injected] = rng.uniform(86, 100, injected.sum())
+        permeability[injected] = rng.uniform(5, 29, injected.sum())
+
+        damage_prob = np.minimum(
+            s.damage_base_prob + 0.2 * (clay_content > 30) + 0.3 * (fluid_loss > 1.0)
+            + 0.1 * (fractures == 1) + 0.2 * (fluid_loss > 0.6),
+            0.95
+        )
+        damaged = rng.random(n) < damage_prob
+
+        level = lambda levels, name: levels.index(name) if name in levels else -1  # noqa: E731
+        conditions = [
+            (clay_content > 35) & (clay == level(clays, 'Montmorillonite')),
+            (formation == level(formations, 'Shale')) & (fluid_loss > 0.8),
+            (fluid_loss > 1.0) & (mud == level(muds, 'Water-based')),
+            (chloride > 500) & (solid > 10),
+            (completion == level(completions, 'Open Hole')) & (ph < 7.0),
+            (permeability < 30) & (temperature > 85),
+            (completion == level(completions, 'Cased')) & (overbalance > 100),
+            (temperature > 95) & (weight_in > 9.5),
+            (viscosity > 18) & (mud == level(muds, 'Oil-based')),
+            (viscosity < 12) & (mud == level(muds, 'Synthetic'))
+        ]
+        damage_type = np.select(conditions, np.arange(len(DAMAGE_RULES)), len(DAMAGE_RULES))
+        damage_type = np.where(damaged, damage_type, len(DAMAGE_LEVELS) - 1)
+
+        columns = {
+            'Record_ID': pa.array(index),
+            'API_Well_ID': pa.array(np.full(n, well_id, dtype=np.int64)),
+            'LONG': pa.array(long_val + randn() * 0.001),
+            'LAT': pa.array(lat_val + randn() * 0.001),
+            'DateTime': pa.array(date_time),
+            'Days_Age_Well': pa.array(days),
+            'Phase_Operation': _categorical(phase, PHASES),
+            'Formation_Type': _categorical(formation, formations),
+            'Clay_Mineralogy_Type': _categorical(clay, clays),
+            'Fractures_Presence': pa.array(fractures),
+            'Reservoir_Temperature': pa.array(temperature),
+            'Formation_Permeability': pa.array(permeability),
+            'Clay_Content_Percent': pa.array(clay_content),
+            'Completion_Type': _categorical(completion, completions),
+            'Density_Perforation': pa.array(perforation),
+            'Depth_Measured': pa.array(depth),
+            'Depth_Bit': pa.array(depth_bit),
+            'Weight_on_Bit': pa.array(wob),
+            'RPM': pa.array(rpm),
+            'ROP': pa.array(rop),
+            'Torque': pa.array(torque),
+            'Pressure_Standpipe': pa.array(standpipe),
+            'Pressure_Annulus': pa.array(annulus),
+            'Overbalance': pa.array(overbalance),
+            'Pressure_Reservoir': pa.array(reservoir_pressure),
+            'Mud_Type': _categorical(mud, muds),
+            'In_Rate_Flow_Mud': pa.array(flow_in),
+            'Mud_Weight_In': pa.array(weight_in),
+            'Mud_Temperature_In': pa.array(temp_in),
+            'Chloride_Content': pa.array(chloride),
+            'Solid_Content': pa.array(solid),
+            'Mud_pH': pa.array(ph),
+            'Out_Rate_Flow_Mud': pa.array(flow_out),
+            'Volume_Pit': pa.array(pit),
+            'Mud_Temperature_Out': pa.array(temp_out),
+            'Viscosity': pa.array(viscosity),
+            'Fluid_Loss_API': pa.array(fluid_loss),
+            'Mud_Weight_Out': pa.array(weight_out),
+            'Active_Damage': _categorical(damaged.astype(np.int8), ACTIVE_DAMAGE_LEVELS),
+            'Type_Damage': _categorical(damage_type, DAMAGE_LEVELS)
+        }
+        if s.column_set == 'processor':
+            # نام‌های مورد انتظار `FeatureEngineer`/`QualityChecker`؛ دبی و تخلخل در ژنراتور اصلی نیستند
+            columns = {PROCESSOR_COLUMN_ALIASES.get(name, name): array for name, array in columns.items()}
+            columns['Flow_Rate_bbl_day'] = columns['Out_Rate_Flow_Mud']
+            columns['Porosity_pct'] = pa.array(rng.uniform(5, 30, n))
+        return pa.RecordBatch.from_pydict(columns)
+
+    def _spans(self, well_id: int) -> Iterator[tuple]:
+        total, step = self.scenario.records_per_well, self.scenario.batch_rows
+        for start in range(0, total, step):
+            yield well_id, start, min(step, total - start)
+
+    def iter_batches(
+        self,
+        wells: Optional[Sequence[int]] = None,
+        interleave: bool = False
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        پیمایش تنبل دسته‌ها
+
+        پارامترها:
+            wells: زیرمجموعه شناسه چاه‌ها (پیش‌فرض همه چاه‌های سناریو)
+            interleave: True یعنی دسته‌های هم‌زمان چاه‌ها یکی‌درمیان (مناسب جریان چندچاهی)؛
+                در حالت پیش‌فرض چاه‌ها پشت سر هم تولید می‌شوند
+        """
+        wells = self.scenario.well_ids if wells is None else list(wells)
+        unknown = set(wells) - set(self._wells)
+        if unknown:
+            raise ValueError(f"❌ خطا: چاه‌های {sorted(unknown)} در سناریو وجود ندارند!")
+        if interleave:
+            spans = (span for group in zip(*(self._spans(w) for w in wells)) for span in group)
+        else:
+            spans = (span for w in wells for span in self._spans(w))
+        for well_id, start, rows in spans:
+            yield self.generate_batch(well_id, start, rows)
+
+    def reader(self, wells: Optional[Sequence[int]] = None, interleave: bool = False) -> pa.RecordBatchReader:
+        """`RecordBatchReader` تنبل برای مصرف‌کننده‌های Arrow (مثلاً `pyarrow.dataset`)"""
+        return pa.RecordBatchReader.from_batches(self.schema, self.iter_batches(wells, interleave))
+
+    def table(self, columns: Optional[List[str]] = None, wells: Optional[Sequence[int]] = None) -> pa.Table:
+        """ساخت کامل داده در حافظه (فقط برای سناریوهای کوچک)"""
+        table = pa.Table.from_batches(list(self.iter_batches(wells)), schema=self.schema)
+        if columns is not None:
+            table = table.select(list(columns))
+        return table
+
+    def to_pandas(self, columns: Optional[List[str]] = None, wells: Optional[Sequence[int]] = None) -> pd.DataFrame:
+        return self.table(columns, wells).to_pandas()
+
+    def write_parquet(
+        self,
+        output_dir: Union[str, Path],
+        wells: Optional[Sequence[int]] = None,
+        compression: str = 'snappy'
+    ) -> List[Path]:
+        """
+        نوشتن فایل `well_<id>.parquet` هر چاه (هر دسته یک row group) همراه با ایندکس کناری
+        """
+        from ..storage.index import IndexedParquetWriter
+
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for well_id in (self.scenario.well_ids if wells is None else wells):
+            path = output_dir / f'well_{well_id}.parquet'
+            with IndexedParquetWriter(path, self.schema, row_group_size=self.scenario.batch_rows,
+                                      compression=compression) as writer:
+                for batch in self.iter_batches([well_id]):
+                    writer.write_table(pa.Table.from_batches([batch]))
+            paths.append(path)
+        return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description='تولید داده مصنوعی چاه‌ها و ذخیره پارکت هر چاه')
+    parser.add_argument('--output-dir', default='well_outputs')
+    parser.add_argument('--scenario', help='فایل JSON با کلیدهای Scenario')
+    parser.add_argument('--records-per-well', type=float)
+    parser.add_argument('--duration', help="بازه هر چاه، مثلاً '30D'")
+    parser.add_argument('--rows-per-second', type=float)
+    parser.add_argument('--batch-rows', type=int)
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--wells', type=int, nargs='+', help='زیرمجموعه شناسه چاه‌ها')
+    args = parser.parse_args()
+
+    from ..utils.loggers import ProcessingLogger
+
+    scenario = Scenario.from_json(args.scenario) if args.scenario else Scenario()
+    overrides = {
+        key: value for key, value in (
+            ('records_per_well', None if args.records_per_well is None else int(args.records_per_well)),
+            ('duration', args.duration),
+            ('rows_per_second', args.rows_per_second),
+            ('batch_rows', args.batch_rows),
+            ('seed', args.seed)
+        ) if value is not None
+    }
+    generator = SyntheticWellGenerator(scenario, **overrides)
+    logger = ProcessingLogger()
+    for path in generator.write_parquet(args.output_dir, wells=args.wells):
+        logger.log_processing_step(f"Wrote {path}", "info")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,152 @@
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+
+# (شناسه API چاه, طول جغرافیایی, عرض جغرافیایی) چاه‌های پیش‌فرض `datasets/generator.py`
+DEFAULT_WELLS = [
+    (40100050, -94.86, 32.26),
+    (40131881, -94.82, 32.26),
+    (40134068, -94.78, 32.25),
+    (40181715, -94.95, 32.17),
+    (36535068, -94.18, 32.32),
+    (36500362, -94.13, 32.32),
+    (36530944, -94.15, 32.12),
+    (18332094, -94.62, 32.37),
+    (18331921, -94.6, 32.37),
+    (18387931, -94.86, 32.45)
+]
+
+# ۱۸۰ روز با نرخ یک سطر در ثانیه
+DEFAULT_RECORDS_PER_WELL = 15_552_000
+
+FORMATION_PROBS = {'Shale': 0.4, 'Limestone': 0.3, 'Sandstone': 0.3}
+CLAY_PROBS = {'Kaolinite': 1 / 3, 'Illite': 1 / 3, 'Montmorillonite': 1 / 3}
+COMPLETION_PROBS = {'Cased': 1 / 3, 'Open Hole': 1 / 3, 'Liner': 1 / 3}
+MUD_PROBS = {'Water-based': 0.6, 'Oil-based': 0.3, 'Synthetic': 0.1}
+
+FRACTURE_PROB = {'Shale': 0.2, 'Limestone': 0.6, 'Sandstone': 0.4}
+TEMP_BASE = {'Shale': 70, 'Limestone': 90, 'Sandstone': 85}
+PERM_BASE = {'Shale': 5, 'Limestone': 150, 'Sandstone': 80}
+CLAY_BASE = {'Kaolinite': 15, 'Illite': 25, 'Montmorillonite': 40}
+DENSITY_PERFORATION_MAP = {'Cased': 30, 'Open Hole': 10, 'Liner': 20}
+WOB_MAP = {'Drilling': 5000, 'Completion': 2000, 'Production': 0}
+
+PHASES = ['Drilling', 'Completion', 'Production']
+# روز شروع فازهای Completion و Production
+PHASE_DAYS = (100, 200)
+
+COLUMN_SETS = ('generator', 'processor')
+
+
+class Scenario:
+    def __init__(
+        self,
+        wells: Optional[Sequence[Tuple[int, float, float]]] = None,
+        start: Union[str, pd.Timestamp] = '2023-01-01',
+        records_per_well: Optional[int] = None,
+        duration: Optional[Union[str, pd.Timedelta]] = None,
+        rows_per_second: float = 1.0,
+        batch_rows: int = 1_000_000,
+        seed: int = 42,
+        formation_probs: Optional[Dict[str, float]] = None,
+        clay_probs: Optional[Dict[str, float]] = None,
+        completion_probs: Optional[Dict[str, float]] = None,
+        mud_probs: Optional[Dict[str, float]] = None,
+        fracture_prob: Optional[Dict[str, float]] = None,
+        temp_base: Optional[Dict[str, float]] = None,
+        perm_base: Optional[Dict[str, float]] = None,
+        clay_base: Optional[Dict[str, float]] = None,
+        density_perforation_map: Optional[Dict[str, float]] = None,
+        wob_map: Optional[Dict[str, float]] = None,
+        phase_days: Tuple[int, int] = PHASE_DAYS,
+        injected_fraction: float = 0.002,
+        damage_base_prob: float = 0.1,
+        column_set: str = 'generator'
+    ):
+        """
+        پیکربندی سناریوی داده مصنوعی چاه‌ها (جایگزین متغیرهای سراسری `datasets/generator.py`)
+
+        پارامترها:
+            wells: لیست (شناسه چاه, طول, عرض)؛ پیش‌فرض ۱۰ چاه `DEFAULT_WELLS`
+            start: زمان اولین رکورد هر چاه
+            records_per_well: تعداد سطر هر چاه (پیش‌فرض ۱۸۰ روز در ۱ هرتز)
+            duration: بازه زمانی هر چاه (مثلاً '7D')؛ به جای records_per_well
+            rows_per_second: نرخ ثبت رکورد (۱ یعنی هر ثانیه یک سطر)
+            batch_rows: اندازه هر record batch تولیدی
+            seed: بذر تصادفی؛ هر (چاه, دسته) بذر مستقل دارد و خروجی تکرارپذیر است
+            *_probs: احتمال سطوح متغیرهای دسته‌ای
+            fracture_prob, temp_base, perm_base, clay_base, density_perforation_map, wob_map:
+                نگاشت‌های پایه متغیرهای عددی
+            phase_days: روز شروع فاز Completion و Production (صعودی، یکی کمتر از تعداد `PHASES`)
+            injected_fraction: سهم سطرهای تزریقی با دمای بالا و تراوایی کم (Rock/Fluid Interaction)
+            damage_base_prob: احتمال پایه آسیب پیش از افزایش‌های رس/هرزروی/شکاف
+            column_set: 'generator' (نام ستون‌های اصلی) یا 'processor' (نام‌های `DrillingDataProcessor`
+                به همراه `Flow_Rate_bbl_day` و `Porosity_pct`)
+
+        مثال:
+            Scenario(wells=[(1, -94.8, 32.2)], duration='1D', rows_per_second=10)
+        """
+        if records_per_well is not None and duration is not None:
+            raise ValueError("❌ خطا: فقط یکی از records_per_well و duration را تعیین کنید!")
+        if rows_per_second <= 0 or batch_rows <= 0:
+            raise ValueError("❌ خطا: rows_per_second و batch_rows باید مثبت باشند!")
+        if column_set not in COLUMN_SETS:
+            raise ValueError(f"❌ خطا: column_set '{column_set}' معتبر نیست!")
+        if len(phase_days) != len(PHASES) - 1 or any(b <= a for a, b in zip(phase_days, phase_days[1:])):
+            raise ValueError(
+                f"❌ خطا: phase_days باید {len(PHASES) - 1} روز صعودی برای شروع فازهای {PHASES[1:]} باشد!"
+            )
+        if wells is not None and len(wells) == 0:
+            raise ValueError("❌ خطا: لیست wells نمی‌تواند خالی باشد!")
+        if duration is not None:
+            records_per_well = int(pd.Timedelta(duration).total_seconds() * rows_per_second)
+        self.wells = [tuple(w) for w in (wells if wells is not None else DEFAULT_WELLS)]
+        self.start = pd.Timestamp(start)
+        self.records_per_well = DEFAULT_RECORDS_PER_WELL if records_per_well is None else int(records_per_well)
+        self.rows_per_second = float(rows_per_second)
+        self.batch_rows = int(batch_rows)
+        self.seed = seed
+        self.formation_probs = dict(formation_probs or FORMATION_PROBS)
+        self.clay_probs = dict(clay_probs or CLAY_PROBS)
+        self.completion_probs = dict(completion_probs or COMPLETION_PROBS)
+        self.mud_probs = dict(mud_probs or MUD_PROBS)
+        self.fracture_prob = dict(fracture_prob or FRACTURE_PROB)
+        self.temp_base = dict(temp_base or TEMP_BASE)
+        self.perm_base = dict(perm_base or PERM_BASE)
+        self.clay_base = dict(clay_base or CLAY_BASE)
+        self.density_perforation_map = dict(density_perforation_map or DENSITY_PERFORATION_MAP)
+        self.wob_map = dict(wob_map or WOB_MAP)
+        self.phase_days = tuple(phase_days)
+        self.injected_fraction = injected_fraction
+        self.damage_base_prob = damage_base_prob
+        self.column_set = column_set
+
+    @property
+    def well_ids(self) -> List[int]:
+        return [well_id for well_id, _, _ in self.wells]
+
+    @property
+    def total_rows(self) -> int:
+        return self.records_per_well * len(self.wells)
+
+    def to_dict(self) -> Dict[str, Any]:
+        config = dict(vars(self))
+        config['start'] = self.start.isoformat()
+        config['wells'] = [list(w) for w in self.wells]
+        config['phase_days'] = list(self.phase_days)
+        return config
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> 'Scenario':
+        return cls(**config)
+
+    @classmethod
+    def from_json(cls, path: Union[str, Path]) -> 'Scenario':
+        """بارگذاری سناریو از فایل JSON با همان کلیدهای سازنده"""
+        return cls.from_dict(json.loads(Path(path).read_text(encoding='utf-8')))
+
+    def __repr__(self) -> str:
+        return (f"Scenario(wells={len(self.wells)}, records_per_well={self.records_per_well}, "
+                f"rows_per_second={self.rows_per_second}, seed={self.seed})")
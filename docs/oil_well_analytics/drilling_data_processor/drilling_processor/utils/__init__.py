@@ -4,12 +4,16 @@ Utility Modules
 Contains:
 - validators: Data validation tools
 - loggers: Processing logging system
+- memory: Load-time dtype downcasting and memory reporting
 """
 
-from .validators import DataValidator
-from .loggers import ProcessingLogger
+from .._lazy import lazy_exports
 
-__all__ = [
-    'DataValidator',
-    'ProcessingLogger'
-]
\ No newline at end of file
+_EXPORTS = {
+    'DataValidator': '.validators',
+    'ProcessingLogger': '.loggers',
+    'MemoryOptimizer': '.memory'
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -9,26 +9,30 @@ class ProcessingLogger:
         self._setup_logger()
         
     def _setup_logger(self):
-        """تنظیمات اولیه سیستم ثبت رویدادها"""
-        log_file = f"{self.log_dir}/drilling_processor_{datetime.now().strftime('%Y%m%d')}.log"
+        """تنظیمات اولیه سیستم ثبت رویدادها (تکرار ساخت، handler تکراری اضافه نمی‌کند)"""
+        log_file = os.path.abspath(
+            f"{self.log_dir}/drilling_processor_{datetime.now().strftime('%Y%m%d')}.log"
+        )
         
         self.logger = logging.getLogger('DrillingProcessor')
         self.logger.setLevel(logging.DEBUG)
         
         formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
         
-        # Handler برای فایل
-        fh = logging.FileHandler(log_file)
-        fh.setLevel(logging.DEBUG)
-        fh.setFormatter(formatter)
+        # Handler برای فایل (یک بار برای هر فایل لاگ)
+        if not any(getattr(h, 'baseFilename', None) == log_file for h in self.logger.handlers):
+            fh = logging.FileHandler(log_file)
+            fh.setLevel(logging.DEBUG)
+            fh.setFormatter(formatter)
+            self.logger.addHandler(fh)
         
-        # Handler برای کنسول
-        ch = logging.StreamHandler()
-        ch.setLevel(logging.INFO)
-        ch.setFormatter(formatter)
-        
-        self.logger.addHandler(fh)
-        self.logger.addHandler(ch)
+        # Handler برای کنسول (یک بار برای کل پردازه)
+        if not any(getattr(h, '_drilling_console', False) for h in self.logger.handlers):
+            ch = logging.StreamHandler()
+            ch.setLevel(logging.INFO)
+            ch.setFormatter(formatter)
+            ch._drilling_console = True
+            self.logger.addHandler(ch)
     
     def log_processing_step(self, message: str, level: str = "info"):
         """ثبت یک مرحله پردازش"""
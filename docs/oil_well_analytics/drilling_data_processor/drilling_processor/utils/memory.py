@@ -0,0 +1,134 @@
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, Optional
+
+# خطای مطلق مجاز پیش‌فرض ستون‌هایی که دقتی سخت‌گیرانه‌تر از `default_tolerance` لازم دارند
+DEFAULT_COLUMN_TOLERANCES = {
+    'LAT': 1e-6,
+    'LONG': 1e-6,
+    'Depth_Measured': 1e-3,
+    'Depth_Bit': 1e-3
+}
+
+
+class MemoryOptimizer:
+    def __init__(
+        self,
+        default_tolerance: float = 1e-2,
+        column_tolerances: Optional[Dict[str, float]] = None,
+        category_max_ratio: float = 0.5,
+        dtype_overrides: Optional[Dict[str, str]] = None,
+        exclude: Optional[list] = None,
+        downcast_integers: bool = False
+    ):
+        """
+        کاهش حافظه دیتافریم هنگام بارگذاری با قابلیت‌های:
+        - تبدیل float64 به float32 فقط وقتی بیشترین خطای رفت‌وبرگشت هر ستون از خطای
+          مطلق مجاز آن بیشتر نباشد: `column_tolerances` (پیش‌فرض عمق و مختصات) و برای
+          بقیه ستون‌ها `default_tolerance` (مثلاً ۰.۰۱ تا مقادیر حدود ۱۳۰۰۰۰ برقرار است)
+        - کوچک‌کردن ستون‌های صحیح به کوچک‌ترین نوع بدون از دست رفتن داده (اختیاری؛
+          محاسبات بعدی روی int8/int16 سرریز می‌کنند)
+        - تبدیل ستون‌های متنی کم‌تنوع به `category`
+        - گزارش بایت‌های ذخیره‌شده برای هر ستون
+
+        پارامترها:
+            default_tolerance: خطای مطلق مجاز تبدیل به float32 برای ستون‌های بدون تلورانس خاص
+            column_tolerances: خطای مطلق مجاز برای ستون‌های خاص (با `DEFAULT_COLUMN_TOLERANCES` ادغام می‌شود)
+            category_max_ratio: حداکثر نسبت مقادیر یکتا به تعداد سطر برای تبدیل به category
+            dtype_overrides: نوع اجباری برای ستون‌های خاص (مثلاً نوع‌های مورد انتظار `DataValidator`)
+            exclude: ستون‌هایی که نباید تغییر کنند
+            downcast_integers: کوچک‌کردن ستون‌های صحیح (پیش‌فرض False)
+        """
+        if default_tolerance < 0:
+            raise ValueError("❌ خطا: default_tolerance نمی‌تواند منفی باشد!")
+        self.default_tolerance = default_tolerance
+        self.column_tolerances = {**DEFAULT_COLUMN_TOLERANCES, **(column_tolerances or {})}
+        self.category_max_ratio = category_max_ratio
+        self.dtype_overrides = dtype_overrides or {}
+        self.exclude = set(exclude or [])
+        self.downcast_integers = downcast_integers
+        self.report = {}
+
+    def _fits_float32(self, col: str, values: pd.Series) -> bool:
+        """بررسی تحمل خطای تبدیل به float32"""
+        original = values.to_numpy(dtype=np.float64, na_value=np.nan)
+        converted = original.astype(np.float32)
+        if not np.isfinite(converted[np.isfinite(original)]).all():
+            return False  # سرریز محدوده float32
+        error = np.abs(converted.astype(np.float64) - original)
+        tolerance = self.column_tolerances.get(col, self.default_tolerance)
+        return bool(np.nanmax(error, initial=0.0) <= tolerance)
+
+    def _target_dtype(self, col: str, values: pd.Series):
+        if col in self.dtype_overrides:
+            return self.dtype_overrides[col]
+        if pd.api.types.is_bool_dtype(values) or isinstance(values.dtype, pd.CategoricalDtype):
+            return None
+        if pd.api.types.is_float_dtype(values):
+            if values.dtype.itemsize > 4 and self._fits_float32(col, values):
+                return 'float32'
+            return None
+        if pd.api.types.is_integer_dtype(values):
+            if not self.downcast_integers:
+                return None
+            downcast = pd.to_numeric(values, downcast='integer').dtype
+            return downcast if downcast.itemsize < values.dtype.itemsize else None
+        if pd.api.types.is_object_dtype(values) or pd.api.types.is_string_dtype(values):
+            n_unique = values.nunique(dropna=True)
+            if len(values) and n_unique / len(values) <= self.category_max_ratio:
+                return 'category'
+        return None
+
+    def optimize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        بازگرداندن دیتافریم با نوع‌های فشرده؛ گزارش در `self.report` ذخیره می‌شود
+
+        مثال:
+            optimizer = MemoryOptimizer(column_tolerances={'LAT': 1e-5, 'LONG': 1e-5})
+            df = optimizer.optimize(df)
+            optimizer.total_saved()
+        """
+        if df is None or not isinstance(df, pd.DataFrame):
+            raise ValueError("❌ خطا: ورودی باید یک DataFrame معتبر باشد!")
+
+        self.report = {}
+        converted = {}
+        for col in df.columns:
+            if col in self.exclude:
+                continue
+            target = self._target_dtype(col, df[col])
+            if target is None or str(target) == str(df[col].dtype):
+                continue
+            before = int(df[col].memory_usage(index=False, deep=True))
+            new_values = df[col].astype(target)
+            after = int(new_values.memory_usage(index=False, deep=True))
+            converted[col] = new_values
+            self.report[col] = {
+                'from': str(df[col].dtype),
+                'to': str(new_values.dtype),
+                'bytes_before': before,
+                'bytes_after': after,
+                'bytes_saved': before - after
+            }
+            if str(target) == 'float32':
+                # بیشترین خطای مطلق تبدیل برای ردیابی از دست رفتن دقت
+                error = np.abs(new_values.to_numpy(dtype=np.float64) - df[col].to_numpy(dtype=np.float64))
+                self.report[col]['max_abs_error'] = float(np.nanmax(error, initial=0.0))
+
+        if not converted:
+            return df
+        result = df.copy(deep=False)
+        for col, values in converted.items():
+            result[col] = values
+        return result
+
+    def total_saved(self) -> int:
+        """مجموع بایت‌های ذخیره‌شده در آخرین فراخوانی `optimize`"""
+        return sum(item['bytes_saved'] for item in self.report.values())
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'columns_converted': len(self.report),
+            'bytes_saved': self.total_saved(),
+            'by_column': self.report
+        }
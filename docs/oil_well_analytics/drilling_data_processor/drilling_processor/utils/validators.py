@@ -2,14 +2,17 @@ import pandas as pd
 from typing import Tuple
 
 class DataValidator:
+    # ستون‌های الزامی و نوع داده مورد انتظار
+    REQUIRED_COLUMNS = {
+        'Temperature_C': 'float32',
+        'Pressure_psi': 'float32',
+        'Formation': 'category'
+    }
+
     @staticmethod
     def validate_input_data(df: pd.DataFrame) -> Tuple[bool, str]:
         """اعتبارسنجی ساختار داده‌های ورودی"""
-        required_columns = {
-            'Temperature_C': 'float32',
-            'Pressure_psi': 'float32',
-            'Formation': 'category'
-        }
+        required_columns = DataValidator.REQUIRED_COLUMNS
         
         missing_cols = [col for col in required_columns if col not in df.columns]
         if missing_cols:
@@ -43,6 +43,10 @@ setup(
         "visualization": [
             "matplotlib>=3.0",
             "seaborn>=0.11.0"
+        ],
+        "onnx": [
+            "skl2onnx>=1.14.0",
+            "onnxruntime>=1.15.0"
         ]
     },
     
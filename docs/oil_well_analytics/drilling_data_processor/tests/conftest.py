@@ -2,6 +2,11 @@ import pytest
 import pandas as pd
 import numpy as np
 
+from drilling_data_processor.drilling_processor.synthetic.generator import SyntheticWellGenerator
+
+# (شناسه چاه, طول, عرض) چاه‌های مصنوعی تست‌ها؛ `synthetic_wells` چند چاه اول را برمی‌دارد
+SYNTHETIC_WELLS = [(1, -94.8, 32.2), (2, -94.7, 32.3), (3, -94.6, 32.4), (4, -94.5, 32.5)]
+
 @pytest.fixture
 def sample_well_data():
     """دیتافریم نمونه برای تست‌های حفاری"""
@@ -11,4 +16,25 @@ def sample_well_data():
         'Pressure_psi': [5000, 12000, 8000],
         'Formation': ['Sandstone', 'Carbonate', None],
         'Damage_Type': ['Clay & Iron', None, 'Fluid Loss']
-    })
\ No newline at end of file
+    })
+
+@pytest.fixture(scope='session')
+def synthetic_wells():
+    """
+    داده مصنوعی `n_wells` چاه اول `SYNTHETIC_WELLS`
+
+    synthetic_wells(n_wells=3, **overrides) یک کپی از دیتافریم کش‌شده برمی‌گرداند
+    (overrides همان پارامترهای `Scenario` هستند، مثل records_per_well و seed)؛
+    با frame=False خود `SyntheticWellGenerator` برگردانده می‌شود.
+    """
+    cache = {}
+
+    def make(n_wells=3, frame=True, **overrides):
+        if not frame:
+            return SyntheticWellGenerator(wells=SYNTHETIC_WELLS[:n_wells], **overrides)
+        key = (n_wells, tuple(sorted(overrides.items())))
+        if key not in cache:
+            cache[key] = SyntheticWellGenerator(wells=SYNTHETIC_WELLS[:n_wells], **overrides).to_pandas()
+        return cache[key].copy()
+
+    return make
@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from drilling_data_processor.drilling_processor.backends.arrow_backend import ArrowBackend
+from drilling_data_processor.drilling_processor.core import DrillingDataProcessor
+from drilling_data_processor.drilling_processor.preprocessors.cleaners import DataCleaner
+from drilling_data_processor.drilling_processor.preprocessors.feature_engine import FeatureEngineer
+from drilling_data_processor.drilling_processor.preprocessors.quality import QualityChecker
+
+
+def make_frame(n=500):
+    rng = np.random.default_rng(1)
+    df = pd.DataFrame({
+        'Temperature_C': rng.normal(90, 10, n).astype('float32'),
+        'Pressure_psi': rng.normal(5000, 300, n).astype('float32'),
+        'Flow_Rate_bbl_day': rng.uniform(100, 900, n).astype('float32'),
+        'Permeability_mD': rng.uniform(5, 500, n).astype('float32'),
+        'Porosity_pct': rng.uniform(5, 30, n).astype('float32'),
+        'pH': rng.uniform(6, 9, n).astype('float32'),
+        'Formation': pd.Categorical(rng.choice(['Sandstone', 'Carbonate', 'Shale'], n))
+    })
+    df.loc[::17, 'Temperature_C'] = np.nan
+    df.loc[::23, 'Formation'] = np.nan
+    df = pd.concat([df, df.iloc[:20]], ignore_index=True)  # سطرهای تکراری
+    return df
+
+
+def test_arrow_steps_match_pandas_steps():
+    df = make_frame()
+    backend = ArrowBackend()
+    table = pa.Table.from_pandas(df, preserve_index=False)
+
+    table = backend.remove_duplicates(backend.handle_missing_values(table, 'median'))
+    for step in ('add_pt_ratio', 'add_flow_efficiency', 'add_formation_metrics'):
+        table = getattr(backend, step)(table)
+
+    cleaner, engineer = DataCleaner(), FeatureEngineer()
+    expected = cleaner.remove_duplicates(cleaner.handle_missing_values(df, 'median'))
+    for step in ('add_pt_ratio', 'add_flow_efficiency', 'add_formation_metrics'):
+        expected = getattr(engineer, step)(expected)
+
+    result = table.to_pandas()
+    assert backend.history[-1] == cleaner.imputation_history[-1] == 'Removed 20 duplicate rows'
+    assert len(result) == len(expected) == 500
+    assert backend.null_counts(table) == {col: 0 for col in table.column_names}
+    pd.testing.assert_frame_equal(
+        result, expected.reset_index(drop=True), check_dtype=False,
+        check_categorical=False, rtol=1e-5
+    )
+    assert result['Carbonate_Flag'].dtype == np.int8
+
+
+def test_untouched_columns_are_not_copied():
+    table = pa.Table.from_pandas(make_frame(), preserve_index=False)
+    filled = ArrowBackend().handle_missing_values(table)
+
+    def data_address(t, col):
+        return t[col].chunk(0).buffers()[1].address
+
+    assert data_address(filled, 'Pressure_psi') == data_address(table, 'Pressure_psi')
+    assert data_address(filled, 'Temperature_C') != data_address(table, 'Temperature_C')
+    with pytest.raises(ValueError):
+        ArrowBackend().handle_missing_values(table, strategy='knn')
+
+
+def test_quality_report_matches_quality_checker():
+    df = make_frame()
+    report = ArrowBackend().quality_report(
+        pa.Table.from_pandas(df, preserve_index=False), QualityChecker.VALUE_RANGES
+    )
+    expected = QualityChecker().generate_report(df)
+
+    assert report['missing_values'] == expected['missing_values']
+    assert report['value_range_violations'] == expected['value_range_violations']
+    assert report['distribution']['Formation'] == expected['distribution']['Formation']
+    assert report['distribution']['pH']['mean'] == pytest.approx(expected['distribution']['pH']['mean'], rel=1e-5)
+
+
+def test_processor_arrow_backend_converts_only_at_the_edge(tmp_path):
+    path = tmp_path / 'well.parquet'
+    df = make_frame()
+    df['Formation'] = df['Formation'].astype(object)
+    df.astype({'Temperature_C': 'float64'}).to_parquet(path)
+
+    processor = DrillingDataProcessor(str(path), {'backend': 'arrow'})
+    table = processor.load_data()
+    assert isinstance(table, pa.Table)
+    assert pa.types.is_dictionary(table.schema.field('Formation').type)
+    assert table.schema.field('Temperature_C').type == pa.float32()
+
+    result = processor.run_pipeline()
+    assert isinstance(result, pd.DataFrame)
+    assert 0 < len(result) < 500
+    assert {'PT_Ratio', 'Flow_Efficiency', 'Sandstone_Flag'} <= set(result.columns)
+    assert processor.quality_report['missing_values']['total'] == 0
+
+    with pytest.raises(ValueError):
+        DrillingDataProcessor(str(path), {'backend': 'polars'})
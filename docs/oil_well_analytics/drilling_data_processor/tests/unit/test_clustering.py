@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from drilling_data_processor.drilling_processor.pipelines.clustering import (
+    DamagePatternClusterer,
+    CLUSTER_COLUMN,
+    COUNT_COLUMN,
+    NOISE_LABEL
+)
+from drilling_data_processor.drilling_processor.schema import TREND_FEATURES
+
+FEATURES = ['Viscosity', 'Fluid_Loss_API', 'Clay_Content_Percent']
+CENTERS = np.array([[0.0, 0.0, 0.0], [10.0, 10.0, 0.0], [0.0, 10.0, 10.0]])
+
+
+def make_wells(n_per_well=1500, seed=0):
+    rng = np.random.default_rng(seed)
+    frames, truth = [], []
+    for well in (40100050, 40131881):
+        labels = rng.integers(0, 3, n_per_well)
+        df = pd.DataFrame(CENTERS[labels] + rng.normal(0, 0.5, (n_per_well, 3)), columns=FEATURES)
+        df.insert(0, 'API_Well_ID', well)
+        df.insert(1, 'DateTime', pd.date_range('2023-01-01', periods=n_per_well, freq='s'))
+        frames.append(df)
+        truth.append(labels)
+    return pd.concat(frames, ignore_index=True), np.concatenate(truth)
+
+
+def purity(truth, labels):
+    table = pd.crosstab(truth, labels)
+    table = table.drop(columns=[NOISE_LABEL], errors='ignore')
+    return table.max(axis=0).sum() / len(truth)
+
+
+@pytest.mark.parametrize('method', ['kmeans', 'density'])
+def test_recovers_blobs_from_streamed_parquet(tmp_path, method):
+    df, truth = make_wells()
+    path = tmp_path / 'wells.parquet'
+    df.to_parquet(path, row_group_size=500)
+
+    clusterer = DamagePatternClusterer(
+        method=method, n_clusters=3, features=FEATURES, batch_rows=400, sample_size=1500
+    ).fit(path)
+    labels = clusterer.predict(df)
+
+    assert clusterer.n_rows_ == len(df)
+    assert len(clusterer.centroids_) == 3
+    assert purity(truth, labels) > 0.9
+    np.testing.assert_allclose(
+        np.sort(clusterer.centroids_[FEATURES].to_numpy(), axis=0), np.sort(CENTERS, axis=0), atol=0.3
+    )
+    if method == 'density':
+        # eps تخمینی فقط در eps_ ذخیره می‌شود؛ پارامتر سازنده دست نمی‌خورد
+        assert clusterer.eps is None and clusterer.eps_ > 0
+
+
+def test_export_writes_labels_and_centroids_per_well(tmp_path):
+    df, _ = make_wells()
+    clusterer = DamagePatternClusterer(n_clusters=3, features=FEATURES, batch_rows=700).fit(df)
+
+    rows = clusterer.export(df, tmp_path / 'clusters')
+
+    assert rows == {40100050: 1500, 40131881: 1500}
+    labels = pd.read_parquet(tmp_path / 'clusters' / 'well=40100050' / 'labels.parquet')
+    assert list(labels.columns) == ['API_Well_ID', 'DateTime', CLUSTER_COLUMN]
+    np.testing.assert_array_equal(labels[CLUSTER_COLUMN], clusterer.predict(df.iloc[:1500]))
+
+    centroids = pd.read_parquet(tmp_path / 'clusters' / 'well=40131881' / 'centroids.parquet')
+    assert centroids[COUNT_COLUMN].sum() == 1500
+    expected = df.iloc[1500:].groupby(clusterer.predict(df.iloc[1500:]))[FEATURES].mean()
+    np.testing.assert_allclose(centroids[FEATURES].to_numpy(), expected.to_numpy())
+    assert len(pd.read_parquet(tmp_path / 'clusters' / 'centroids.parquet')) == 3
+
+
+def test_default_features_are_engineered_and_non_trend(tmp_path, synthetic_wells):
+    df = synthetic_wells(n_wells=2, records_per_well=400, seed=0)
+    path = tmp_path / 'wells.parquet'
+    df.to_parquet(path)
+
+    clusterer = DamagePatternClusterer(n_clusters=3, batch_rows=300).fit(path)
+
+    assert not set(TREND_FEATURES) & set(clusterer.features)
+    assert {'PT_Ratio', 'Carbonate_Flag', 'Sandstone_Flag', 'Viscosity'} <= set(clusterer.features)
+    # ویژگی‌های مهندسی‌شده هنگام پیش‌بینی روی داده خام هم ساخته می‌شوند و ورودی تغییر نمی‌کند
+    labels = clusterer.predict(df)
+    assert len(labels) == len(df) and 'PT_Ratio' not in df.columns
+    assert sum(clusterer.export(path, tmp_path / 'clusters').values()) == len(df)
+
+
+def test_rejects_missing_features():
+    df, _ = make_wells(50)
+    with pytest.raises(ValueError):
+        DamagePatternClusterer(features=FEATURES + ['Porosity_pct']).fit(df)
+    with pytest.raises(ValueError):
+        DamagePatternClusterer(method='dbscan')
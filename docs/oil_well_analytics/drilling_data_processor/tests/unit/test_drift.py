@@ -0,0 +1,100 @@
+import logging
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from drilling_data_processor.drilling_processor.core import DrillingDataProcessor
+from drilling_data_processor.drilling_processor.monitoring.drift import DriftMonitor, ReferenceProfile
+
+
+@pytest.fixture(scope='module')
+def wells(synthetic_wells):
+    return lambda seed, **overrides: synthetic_wells(n_wells=2, records_per_well=2000, seed=seed, **overrides)
+
+
+@pytest.fixture(scope='module')
+def profile(wells):
+    return ReferenceProfile.from_frame(wells(seed=1))
+
+
+def test_same_distribution_has_no_drift(profile, wells, tmp_path):
+    path = tmp_path / 'profile.json'
+    profile.save(path)
+    monitor = DriftMonitor(path)
+
+    live = wells(seed=2)
+    for start in range(0, 4000, 500):
+        monitor.update(live.iloc[start:start + 500])
+    report = monitor.check()
+
+    assert set(report['feature']) == set(profile.features)
+    assert not report['drifted'].any()
+    assert report['rows'].eq(4000).all()
+    assert monitor.rows_seen == 4000
+
+
+def test_shifted_sensor_raises_single_alert(profile, wells, caplog):
+    monitor = DriftMonitor(profile, check_every_rows=1000, group_column='API_Well_ID')
+    batch = wells(seed=3)
+    batch.loc[batch['API_Well_ID'] == 2, 'Reservoir_Temperature'] += 15
+    batch.loc[batch['API_Well_ID'] == 2, 'Mud_pH'] = np.nan
+
+    with caplog.at_level(logging.WARNING, logger='DrillingProcessor'):
+        monitor.update(batch)
+        report = monitor.update(pa.Table.from_pandas(batch))
+
+    drifted = report[report['drifted']]
+    assert set(map(tuple, drifted[['group', 'feature']].to_numpy())) == {
+        (2, 'Reservoir_Temperature'), (2, 'Mud_pH')
+    }
+    assert drifted.loc[drifted['feature'] == 'Reservoir_Temperature', 'ks'].iloc[0] > 0.5
+    warnings = [r.getMessage() for r in caplog.records if 'Data drift' in r.getMessage()]
+    assert len(warnings) == 2
+    counts, _ = monitor._counts[(2, 'Drilling')]['Reservoir_Temperature']
+    assert len(counts) == len(profile.numeric['Reservoir_Temperature']['probs'])
+
+
+def test_decay_applies_to_every_group(profile, wells):
+    monitor = DriftMonitor(profile, decay=0.5, group_column='API_Well_ID')
+    batch = wells(seed=2)
+    monitor.update(batch)
+    monitor.update(batch[batch['API_Well_ID'] == 1])
+
+    rows = {key[0]: state['Reservoir_Temperature'][0].sum() for key, state in monitor._counts.items()
+            if 'Reservoir_Temperature' in state}
+    # چاه ۲ در دسته دوم نبود ولی شمارنده‌اش هم نصف شده است
+    assert rows == {1: 2000 * 0.5 + 2000, 2: 2000 * 0.5}
+
+
+def test_early_lifecycle_window_compared_per_phase(synthetic_wells):
+    """جریان دو هفته اول چاه با طرح کل عمر چاه: فاز و ستون‌های روندی رانش کاذب نمی‌سازند"""
+    train = synthetic_wells(n_wells=2, records_per_well=180 * 24, rows_per_second=1 / 3600, seed=1)
+    live = synthetic_wells(n_wells=2, records_per_well=14 * 24, rows_per_second=1 / 3600, seed=2)
+
+    profile = ReferenceProfile.from_frame(train)
+    assert not {'Days_Age_Well', 'Depth_Measured', 'Depth_Bit', 'Phase_Operation'} & set(profile.features)
+    assert set(profile.numeric['ROP']['phases']) == set(train['Phase_Operation'].astype(str))
+    monitor = DriftMonitor(profile, min_rows=100, group_column='API_Well_ID')
+    monitor.update(live)
+    report = monitor.check()
+    assert set(report['phase'].dropna()) == {'Drilling'}
+    assert not report['drifted'].any()
+
+    overall = DriftMonitor(ReferenceProfile.from_frame(train, phase_column=None),
+                           min_rows=100, group_column='API_Well_ID')
+    overall.update(live)
+    assert 'ROP' in set(overall.check().query('drifted')['feature'])
+
+
+def test_processor_checks_drift_after_load(profile, wells, tmp_path):
+    df = wells(seed=4, column_set='processor')
+    df['Temperature_C'] = df['Temperature_C'] * 1.8 + 32
+    path = tmp_path / 'well.parquet'
+    df.to_parquet(path)
+
+    for backend in ('pandas', 'arrow'):
+        processor = DrillingDataProcessor(str(path), config={'drift_profile': profile, 'backend': backend})
+        processor.load_data()
+        drifted = processor.drift_report.loc[processor.drift_report['drifted'], 'feature']
+        assert drifted.tolist() == ['Reservoir_Temperature']
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from drilling_data_processor.drilling_processor.pipelines.evaluation import WellGroupedEvaluator
+
+
+@pytest.fixture
+def wells_frame(synthetic_wells):
+    return synthetic_wells(n_wells=4, records_per_well=300)
+
+
+def test_folds_never_split_a_well(wells_frame):
+    evaluator = WellGroupedEvaluator(n_splits=4)
+    folds = evaluator.assign_folds(wells_frame)
+
+    assert sorted(np.bincount(folds)) == [300] * 4
+    assert (wells_frame.assign(fold=folds).groupby('API_Well_ID')['fold'].nunique() == 1).all()
+
+    with pytest.raises(ValueError):
+        WellGroupedEvaluator(n_splits=5).assign_folds(wells_frame)
+
+
+def test_evaluate_in_process_pool_and_reuse_cache(wells_frame, tmp_path):
+    evaluator = WellGroupedEvaluator(n_splits=2, workers=2, cache_dir=tmp_path)
+
+    report = evaluator.evaluate(wells_frame, {'n_estimators': [5, 10], 'max_depth': [4]})
+
+    assert evaluator.meta_['cached'] is False
+    assert len(list(tmp_path.glob('*/fold=*/X_train.npy'))) == 2
+    assert sorted(w for f in evaluator.meta_['folds'] for w in f['test_wells']) == [1, 2, 3, 4]
+    folds = report['folds']
+    assert len(folds) == 4
+    assert (folds[['wall_seconds', 'prepare_seconds']] > 0).all().all()
+    per_class = report['per_class']
+    assert set(per_class['damage_type']) == set(wells_frame['Type_Damage'].astype(str))
+    assert per_class.groupby(['candidate', 'fold'])['support'].sum().tolist() == [600] * 4
+    assert sorted(report['summary']['candidate']) == [0, 1]
+
+    again = WellGroupedEvaluator(n_splits=2, workers=1, cache_dir=tmp_path)
+    cached = again.evaluate(wells_frame, [{'n_estimators': 5, 'max_depth': 4}])
+    assert again.meta_['cached'] is True
+    assert again.cache_dir_ == evaluator.cache_dir_
+    assert cached['folds']['macro_f1'].between(0, 1).all()
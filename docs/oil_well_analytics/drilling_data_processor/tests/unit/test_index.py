@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from drilling_data_processor.drilling_processor.core import DrillingDataProcessor
+from drilling_data_processor.drilling_processor.storage.index import (
+    IndexedParquetWriter,
+    WellIndex,
+    index_path_for,
+    read_range
+)
+
+
+@pytest.fixture
+def indexed_well(tmp_path):
+    """فایل چاه با ۴ row group و ایندکس کناری"""
+    n = 4000
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        'API_Well_ID': 40100050,
+        'DateTime': pd.date_range('2023-01-01', periods=n, freq='s'),
+        'Depth_Measured': 500 + np.arange(n) * 0.5 + rng.normal(0, 2, n),
+        'Temperature_C': rng.normal(80, 5, n).astype('float32'),
+        'Pressure_psi': rng.normal(5000, 100, n).astype('float32'),
+        'Formation': pd.Categorical(rng.choice(['Shale', 'Sandstone'], n))
+    })
+    path = tmp_path / 'well_40100050.parquet'
+    with IndexedParquetWriter(path, row_group_size=1000, fence_rows=100) as writer:
+        writer.write_df(df)
+    return path, df
+
+
+def test_index_prunes_row_groups_and_fences(indexed_well):
+    path, df = indexed_well
+    index = WellIndex.load(index_path_for(path))
+
+    slices = index.locate(depth_range=(900, 1100))
+    assert {rg for rg, _, _ in slices} == {0, 1}
+    assert sum(stop - start for _, start, stop in slices) < 1000
+
+    result = read_range(path, depth_range=(900, 1100))
+    expected = df[df['Depth_Measured'].between(900, 1100)]
+    assert result['Depth_Measured'].tolist() == expected['Depth_Measured'].tolist()
+
+
+def test_time_range_and_missing_index_is_built(indexed_well):
+    path, df = indexed_well
+    index_path_for(path).unlink()
+
+    result = read_range(path, time_range=('2023-01-01 00:30:00', '2023-01-01 00:40:00'),
+                        well_id=40100050, columns=['DateTime', 'Temperature_C'])
+
+    assert index_path_for(path).exists()
+    assert list(result.columns) == ['DateTime', 'Temperature_C']
+    assert len(result) == 601
+    assert read_range(path, well_id=1).empty
+
+
+def test_stale_index_is_rebuilt(indexed_well):
+    path, df = indexed_well
+    rewritten = df.assign(Depth_Measured=df['Depth_Measured'].to_numpy()[::-1])
+    rewritten.to_parquet(path, row_group_size=1000)
+
+    stale = WellIndex.load(index_path_for(path))
+    assert not stale.matches(path)
+    with pytest.raises(ValueError):
+        read_range(path, depth_range=(900, 1100), index=stale)
+
+    result = read_range(path, depth_range=(900, 1100))
+    assert len(result) == rewritten['Depth_Measured'].between(900, 1100).sum()
+    assert WellIndex.load(index_path_for(path)).matches(path)
+
+    rewritten.to_parquet(path, row_group_size=700)
+    assert len(read_range(path, depth_range=(900, 1100))) == len(result)
+
+
+def test_processor_loads_depth_interval(indexed_well):
+    path, df = indexed_well
+    processor = DrillingDataProcessor(path, config={'depth_range': (900, 1100)})
+
+    loaded = processor.load_data()
+
+    assert len(loaded) == df['Depth_Measured'].between(900, 1100).sum()
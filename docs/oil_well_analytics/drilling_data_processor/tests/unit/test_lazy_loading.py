@@ -0,0 +1,77 @@
+import logging
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from drilling_data_processor.drilling_processor.preprocessors import cleaners, outliers
+from drilling_data_processor.drilling_processor.utils.loggers import ProcessingLogger
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_package_import_does_not_load_sklearn():
+    code = (
+        "import sys, drilling_processor as d\n"
+        "assert not any(m.startswith('sklearn') for m in sys.modules)\n"
+        "d.DataCleaner(); d.DrillingDataProcessor\n"
+        "assert not any(m.startswith('sklearn') for m in sys.modules)\n"
+        "assert 'build_ml_pipeline' in dir(d)\n"
+        "d.build_ml_pipeline\n"
+        "assert 'sklearn.ensemble' in sys.modules\n"
+    )
+    subprocess.run([sys.executable, '-c', code], cwd=PACKAGE_ROOT, check=True)
+
+
+def test_imputers_are_created_on_first_use():
+    cleaner = cleaners.DataCleaner()
+    assert cleaner.imputation_strategies == {}
+
+    df = pd.DataFrame({'Temperature_C': [80.0, np.nan, 90.0]})
+    result = cleaner.handle_missing_values(df, strategy='mean')
+
+    assert list(cleaner.imputation_strategies) == ['mean']
+    assert result['Temperature_C'].tolist() == [80.0, 85.0, 90.0]
+    with pytest.raises(ValueError):
+        cleaner.handle_missing_values(df, strategy='unknown')
+
+
+def test_registered_strategies_are_used(monkeypatch):
+    class ConstantImputer:
+        def fit_transform(self, values):
+            return np.nan_to_num(np.asarray(values, dtype=float), nan=-1.0)
+
+    class FirstRowDetector:
+        def fit_predict(self, values):
+            return np.where(np.arange(len(values)) == 0, -1, 1)
+
+    monkeypatch.setitem(cleaners.IMPUTATION_STRATEGIES, 'constant', ConstantImputer)
+    monkeypatch.setitem(
+        outliers.OUTLIER_DETECTORS, 'first_row', lambda contamination, n_jobs: FirstRowDetector()
+    )
+    df = pd.DataFrame({'Pressure_psi': [np.nan, 5000.0]})
+
+    filled = cleaners.DataCleaner().handle_missing_values(df, strategy='constant')
+    assert filled['Pressure_psi'].tolist() == [-1.0, 5000.0]
+    assert outliers.OutlierDetector().detect(df, method='first_row').tolist() == [True, False]
+    # random_state فقط به آشکارسازهای دارای پارامتر sklearn داده می‌شود
+    assert outliers.OutlierDetector().detect(df, method='first_row', random_state=0).tolist() == [True, False]
+    values = np.random.default_rng(0).normal(size=(500, 3))
+    runs = [outliers.OutlierDetector().detect(values, random_state=7) for _ in range(2)]
+    np.testing.assert_array_equal(*runs)
+    with pytest.raises(ValueError):
+        outliers.OutlierDetector().detect(df, method='lof')
+
+
+def test_logger_setup_is_idempotent(tmp_path):
+    logger = logging.getLogger('DrillingProcessor')
+    ProcessingLogger(log_dir=str(tmp_path))
+    count = len(logger.handlers)
+
+    for _ in range(3):
+        ProcessingLogger(log_dir=str(tmp_path))
+
+    assert len(logger.handlers) == count
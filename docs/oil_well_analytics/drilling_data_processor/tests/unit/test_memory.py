@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+
+from drilling_data_processor.drilling_processor.core import DrillingDataProcessor
+from drilling_data_processor.drilling_processor.preprocessors.cleaners import DataCleaner
+from drilling_data_processor.drilling_processor.preprocessors.feature_engine import FeatureEngineer
+from drilling_data_processor.drilling_processor.utils.memory import MemoryOptimizer
+
+
+def make_frame(n=1000):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'Temperature_C': rng.normal(80, 5, n),
+        'Pressure_psi': rng.normal(5000, 100, n),
+        'LAT': 32.26 + rng.normal(0, 1e-3, n),
+        'Days_Age_Well': np.arange(n, dtype='int64') // 100,
+        'Formation': rng.choice(['Sandstone', 'Carbonate', 'Shale'], n).astype(object),
+        'Record_Tag': [f'r{i}' for i in range(n)]
+    })
+
+
+def test_optimizer_downcasts_within_tolerance_and_reports_savings():
+    df = make_frame()
+    optimizer = MemoryOptimizer(column_tolerances={'LAT': 1e-9}, downcast_integers=True)
+
+    optimized = optimizer.optimize(df)
+
+    assert optimized['Temperature_C'].dtype == np.float32
+    assert optimized['LAT'].dtype == np.float64  # float32 دقت 1e-9 را ندارد
+    assert optimized['Days_Age_Well'].dtype == np.int8
+    assert isinstance(optimized['Formation'].dtype, pd.CategoricalDtype)
+    assert optimized['Record_Tag'].dtype == df['Record_Tag'].dtype  # تنوع بالا
+    assert optimizer.report['Temperature_C']['bytes_saved'] == 4 * len(df)
+    assert optimizer.total_saved() > 0
+    np.testing.assert_allclose(optimized['Pressure_psi'], df['Pressure_psi'], rtol=1e-6)
+
+
+def test_absolute_tolerance_protects_depth_and_coordinates():
+    df = pd.DataFrame({
+        'Depth_Measured': 39000.0 + np.arange(100) * 0.001,
+        'Depth_Bit': 500.0 + np.arange(100) * 0.001,
+        'LONG': -94.86 + np.arange(100) * 1e-7
+    })
+    optimizer = MemoryOptimizer()
+
+    optimized = optimizer.optimize(df)
+
+    assert optimized['Depth_Measured'].dtype == np.float64
+    assert optimized['LONG'].dtype == np.float64
+    assert optimized['Depth_Bit'].dtype == np.float32
+    assert 0 < optimizer.report['Depth_Bit']['max_abs_error'] <= 1e-3
+
+    # بقیه ستون‌ها هم با خطای مطلق رفت‌وبرگشت سنجیده می‌شوند
+    rates = pd.DataFrame({'Flow_Rate_bbl_day': 2.5e6 + np.arange(100) * 0.01})
+    assert MemoryOptimizer().optimize(rates)['Flow_Rate_bbl_day'].dtype == np.float64
+    assert MemoryOptimizer(default_tolerance=1.0).optimize(rates)['Flow_Rate_bbl_day'].dtype == np.float32
+
+
+def test_downstream_steps_keep_compact_dtypes():
+    df = MemoryOptimizer(downcast_integers=True).optimize(make_frame())
+    df.loc[:4, 'Temperature_C'] = np.nan
+    df.loc[:4, 'Formation'] = np.nan
+
+    cleaned = DataCleaner().handle_missing_values(df, strategy='median')
+    featured = FeatureEngineer().add_formation_metrics(FeatureEngineer().add_pt_ratio(cleaned))
+
+    assert cleaned.isna().sum().sum() == 0
+    assert cleaned['Temperature_C'].dtype == np.float32
+    assert cleaned['Days_Age_Well'].dtype == np.int8
+    assert isinstance(cleaned['Formation'].dtype, pd.CategoricalDtype)
+    assert featured['PT_Ratio'].dtype == np.float32
+    assert featured['Carbonate_Flag'].dtype == np.int8
+
+
+def test_processor_load_produces_validator_dtypes(tmp_path):
+    path = tmp_path / 'well.parquet'
+    make_frame().to_parquet(path)
+
+    processor = DrillingDataProcessor(path)
+    loaded = processor.load_data()
+
+    assert loaded['Pressure_psi'].dtype == np.float32
+    assert str(loaded['Formation'].dtype) == 'category'
+    assert processor.memory_optimizer.total_saved() > 0
+
+
+def test_integer_inputs_do_not_overflow_in_feature_engineering(tmp_path):
+    df = make_frame(3)
+    df['Flow_Rate_bbl_day'] = np.array([1500, 3000, 800], dtype='int64')
+    df['Permeability_mD'] = np.array([20, 15, 10], dtype='int64')
+    df['Porosity_pct'] = np.array([100, 50, 10], dtype='int64')
+    path = tmp_path / 'well.parquet'
+    df.to_parquet(path)
+
+    processor = DrillingDataProcessor(path)
+    loaded = processor.load_data()
+    assert loaded['Flow_Rate_bbl_day'].dtype == np.int64
+    featured = FeatureEngineer().add_flow_efficiency(loaded)
+    np.testing.assert_allclose(featured['Flow_Efficiency'], [75, 400, 800], rtol=1e-6)
+
+    compact = MemoryOptimizer(downcast_integers=True).optimize(df)
+    assert compact['Flow_Rate_bbl_day'].dtype == np.int16
+    featured = FeatureEngineer().add_flow_efficiency(compact)
+    np.testing.assert_allclose(featured['Flow_Efficiency'], [75, 400, 800], rtol=1e-6)
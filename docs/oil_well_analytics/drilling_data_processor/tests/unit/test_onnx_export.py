@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("skl2onnx")
+pytest.importorskip("onnxruntime")
+
+from drilling_data_processor.drilling_processor.pipelines.ml_pipeline import build_ml_pipeline
+from drilling_data_processor.drilling_processor.pipelines.onnx_export import (
+    export_pipeline_to_onnx,
+    OnnxDamagePredictor
+)
+
+NUMERIC = ['Clay_Content_Percent', 'Fluid_Loss_API', 'Viscosity']
+CATEGORICAL = ['Formation_Type', 'Mud_Type']
+
+
+@pytest.fixture
+def fitted_pipeline():
+    """پایپ‌لاین آموزش‌دیده روی داده مصنوعی با مقادیر گم‌شده"""
+    rng = np.random.default_rng(0)
+    n = 400
+    df = pd.DataFrame({
+        'Clay_Content_Percent': rng.normal(25, 8, n),
+        'Fluid_Loss_API': rng.normal(0.5, 0.3, n),
+        'Viscosity': rng.normal(15, 5, n),
+        'Formation_Type': rng.choice(['Shale', 'Limestone', 'Sandstone'], n),
+        'Mud_Type': rng.choice(['Water-based', 'Oil-based', 'Synthetic'], n)
+    })
+    y = np.where(df['Clay_Content_Percent'] > 35, 'Clay & Iron Control',
+                 np.where(df['Fluid_Loss_API'] > 0.8, 'Fluid Loss', 'No Damage'))
+    df.loc[:9, 'Viscosity'] = np.nan
+    df.loc[10:19, 'Mud_Type'] = None
+    pipeline = build_ml_pipeline(NUMERIC, CATEGORICAL)
+    pipeline.fit(df, y)
+    return pipeline, df
+
+
+def test_onnx_parity_with_sklearn(tmp_path, fitted_pipeline):
+    """پیش‌بینی ONNX باید با پایپ‌لاین sklearn یکسان باشد"""
+    pipeline, df = fitted_pipeline
+    model_path = export_pipeline_to_onnx(pipeline, NUMERIC, CATEGORICAL, tmp_path / "damage.onnx")
+
+    predictor = OnnxDamagePredictor(model_path, intra_op_threads=1, batch_size=64)
+
+    assert list(predictor.classes_) == list(pipeline.classes_)
+    assert (predictor.predict(df) == pipeline.predict(df)).all()
+    np.testing.assert_allclose(
+        predictor.predict_proba(df), pipeline.predict_proba(df), atol=1e-5
+    )
+
+
+def test_onnx_predictor_rejects_missing_columns(tmp_path, fitted_pipeline):
+    pipeline, df = fitted_pipeline
+    model_path = export_pipeline_to_onnx(pipeline, NUMERIC, CATEGORICAL, tmp_path / "damage.onnx")
+    predictor = OnnxDamagePredictor(model_path)
+
+    with pytest.raises(ValueError):
+        predictor.predict(df.drop(columns=['Viscosity']))
@@ -0,0 +1,56 @@
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from drilling_data_processor.drilling_processor.preprocessors.plausibility import PlausibilityChecker
+from drilling_data_processor.drilling_processor.preprocessors.quality import QualityChecker
+
+
+@pytest.fixture()
+def wells_frame(synthetic_wells):
+    df = synthetic_wells(records_per_well=400, seed=0)
+    df.loc[df.index[:5], 'Depth_Bit'] = df['Depth_Measured'].iloc[:5] + 50
+    df.loc[df['API_Well_ID'] == 2, 'Out_Rate_Flow_Mud'] = df['In_Rate_Flow_Mud'] * 1.2
+    df.loc[df.index[10], 'Mud_pH'] = 15
+    df.loc[df.index[11], 'Mud_pH'] = np.nan
+    df.loc[df.index[12], 'Phase_Operation'] = 'Production'
+    df.loc[df.index[12], 'ROP'] = 5.0
+    return df
+
+
+def test_rules_evaluated_in_one_pass(wells_frame):
+    checker = PlausibilityChecker()
+    violations = checker.evaluate(wells_frame)
+    counts = checker.violation_counts(wells_frame)
+
+    assert counts['Depth_Bit <= Depth_Measured'] == 5
+    assert counts['Out_Rate_Flow_Mud <= In_Rate_Flow_Mud'] == 400
+    assert counts['Mud_pH <= 14'] == 1
+    assert counts['0 <= ROP <= 0 when Phase_Operation == Production'] == 1
+    assert counts['rows'] == 1200
+    np.testing.assert_array_equal(violations.sum().to_numpy(), [counts[r] for r in violations.columns])
+    assert counts['implausible_rows'] == checker.mask(wells_frame).sum()
+    assert checker.violation_counts(pa.Table.from_pandas(wells_frame)) == counts
+
+    renamed = wells_frame.rename(columns={'Mud_pH': 'pH'})
+    assert checker.violation_counts(renamed)['pH <= 14'] == 1
+    with pytest.raises(ValueError):
+        PlausibilityChecker(consistency=[('Depth_Bit', '>', 'Depth_Measured')])
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_screen_counts_per_well(wells_frame, workers):
+    report = PlausibilityChecker().screen(wells_frame, workers=workers)
+
+    assert report.index.tolist() == [1, 2, 3]
+    assert report['rows'].tolist() == [400] * 3
+    assert report['Out_Rate_Flow_Mud <= In_Rate_Flow_Mud'].tolist() == [0, 400, 0]
+    assert report['Depth_Bit <= Depth_Measured'].tolist() == [5, 0, 0]
+
+
+def test_quality_checker_uses_plausibility_rules(wells_frame):
+    report = QualityChecker().generate_report(wells_frame)
+
+    assert report['value_range_violations']['Mud_pH'] == {'below_min': 0, 'above_max': 1}
+    assert 'Depth_Bit' in report['value_range_violations']
+    assert report['plausibility_violations']['Depth_Bit <= Depth_Measured'] == 5
@@ -0,0 +1,62 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from drilling_data_processor.drilling_processor.storage.rollups import RollupStore
+
+
+@pytest.fixture
+def raw_well_data():
+    """سه ساعت داده ثانیه‌ای یک چاه با دو فاز"""
+    n = 3 * 3600
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'API_Well_ID': 40100050,
+        'DateTime': pd.date_range('2023-01-01', periods=n, freq='s'),
+        'Phase_Operation': np.where(np.arange(n) < n // 2, 'Drilling', 'Completion'),
+        'Pressure_Standpipe': rng.normal(3000, 100, n),
+        'ROP': rng.uniform(0, 15, n),
+        'Type_Damage': rng.choice(['No Damage', 'Fluid Loss'], n)
+    })
+
+
+def test_rollup_matches_direct_resample(tmp_path, raw_well_data):
+    store = RollupStore(tmp_path, columns=['Pressure_Standpipe', 'ROP'])
+    store.update(raw_well_data)
+
+    result = store.query(40100050, '2023-01-01', '2023-01-01 03:00', resolution='1min')
+    expected = raw_well_data.set_index('DateTime')['Pressure_Standpipe'].resample('1min')
+
+    assert len(result) == 180
+    np.testing.assert_allclose(result['Pressure_Standpipe_mean'], expected.mean().to_numpy())
+    np.testing.assert_allclose(result['Pressure_Standpipe_max'], expected.max().to_numpy())
+    assert result['damage_Fluid Loss'].sum() == (raw_well_data['Type_Damage'] == 'Fluid Loss').sum()
+
+
+def test_incremental_update_equals_full_build(tmp_path, raw_well_data):
+    half = len(raw_well_data) // 2 + 17  # مرز دسته وسط یک بازه دقیقه‌ای
+    full = RollupStore(tmp_path / 'full', columns=['ROP'])
+    full.update(raw_well_data)
+    incremental = RollupStore(tmp_path / 'inc', columns=['ROP'])
+    incremental.update(raw_well_data.iloc[:half])
+    incremental.update(raw_well_data.iloc[half:])
+    incremental.compact()
+
+    for resolution in ('1min', '1h'):
+        a = full.query(40100050, '2023-01-01', '2023-01-02', resolution=resolution)
+        b = incremental.query(40100050, '2023-01-01', '2023-01-02', resolution=resolution)
+        pd.testing.assert_frame_equal(a, b)
+
+
+def test_query_picks_coarsest_sufficient_resolution(tmp_path, raw_well_data):
+    store = RollupStore(tmp_path, columns=['ROP'])
+    store.update(raw_well_data)
+
+    assert store.choose_resolution('2023-01-01', '2023-12-31', min_points=200) == '1D'
+    assert store.choose_resolution('2023-01-01', '2023-01-31', min_points=200) == '1h'
+    hourly = store.query(40100050, '2023-01-01', '2023-01-01 03:00', min_points=3)
+    assert hourly.attrs['resolution'] == '1h'
+    assert hourly['Row_Count'].tolist() == [3600, 3600, 3600]
+
+    drilling = store.query(40100050, '2023-01-01', '2023-01-01 03:00', phase='Drilling', resolution='1h')
+    assert drilling['Row_Count'].sum() == len(raw_well_data) // 2
@@ -0,0 +1,184 @@
+import asyncio
+import json
+
+from drilling_data_processor.drilling_processor.serving.batcher import MicroBatcher, record_validator
+from drilling_data_processor.drilling_processor.serving.server import PredictionServer
+
+
+def make_predict_fn(batch_sizes):
+    """تابع پیش‌بینی ساختگی که اندازه هر دسته را ثبت می‌کند"""
+    def predict(df):
+        batch_sizes.append(len(df))
+        return [{'damage_type': 'Fluid Loss' if v > 1 else 'No Damage', 'probability': 1.0}
+                for v in df['Fluid_Loss_API']]
+    return predict
+
+
+def test_concurrent_requests_are_coalesced():
+    """درخواست‌های هم‌زمان باید در دسته‌های کمتری اجرا شوند"""
+    batch_sizes = []
+
+    async def scenario():
+        batcher = MicroBatcher(make_predict_fn(batch_sizes), max_batch_size=8, max_latency_ms=50)
+        await batcher.start()
+        results = await asyncio.gather(
+            *(batcher.submit({'Fluid_Loss_API': float(i % 3)}) for i in range(20))
+        )
+        metrics = batcher.metrics()
+        await batcher.stop()
+        return results, metrics
+
+    results, metrics = asyncio.run(scenario())
+
+    assert [r['damage_type'] for r in results[:3]] == ['No Damage', 'No Damage', 'Fluid Loss']
+    assert max(batch_sizes) <= 8
+    assert sum(batch_sizes) == 20
+    assert len(batch_sizes) < 20
+    assert metrics['requests'] == 20
+    assert metrics['latency_p99_ms'] >= metrics['latency_p50_ms']
+
+
+def test_single_request_flushes_after_max_latency():
+    batch_sizes = []
+
+    async def scenario():
+        batcher = MicroBatcher(make_predict_fn(batch_sizes), max_batch_size=64, max_latency_ms=1)
+        await batcher.start()
+        result = await asyncio.wait_for(batcher.submit({'Fluid_Loss_API': 2.0}), timeout=2)
+        await batcher.stop()
+        return result
+
+    assert asyncio.run(scenario())['damage_type'] == 'Fluid Loss'
+    assert batch_sizes == [1]
+
+
+def test_bad_record_fails_only_its_own_request():
+    batch_sizes = []
+    predict = make_predict_fn(batch_sizes)
+
+    def strict_predict(df):
+        if df['Fluid_Loss_API'].lt(0).any():
+            raise RuntimeError('model rejected batch')
+        return predict(df)
+
+    async def scenario():
+        batcher = MicroBatcher(strict_predict, max_batch_size=8, max_latency_ms=50,
+                               validate_fn=record_validator(['Fluid_Loss_API'], ['Mud_Type']))
+        await batcher.start()
+        results = await asyncio.gather(
+            batcher.submit({'Fluid_Loss_API': '2.5', 'Mud_Type': 'Oil-based', 'extra': 1}),
+            batcher.submit({'Fluid_Loss_API': 'abc', 'Mud_Type': 'Oil-based'}),
+            batcher.submit({'Mud_Type': 'Oil-based'}),
+            batcher.submit({'Fluid_Loss_API': -1, 'Mud_Type': None}),
+            batcher.submit({'Fluid_Loss_API': None, 'Mud_Type': 'Synthetic'}),
+            return_exceptions=True
+        )
+        await batcher.stop()
+        return results
+
+    ok, not_numeric, missing, rejected, null = asyncio.run(scenario())
+
+    assert ok['damage_type'] == 'Fluid Loss'
+    assert isinstance(not_numeric, ValueError) and 'Fluid_Loss_API' in str(not_numeric)
+    assert isinstance(missing, ValueError) and 'Missing required columns' in str(missing)
+    assert isinstance(rejected, RuntimeError)
+    assert null['damage_type'] == 'No Damage'
+    assert batch_sizes == [1, 1]  # دسته ۳تایی شکست خورد و تک‌تک تکرار شد
+
+
+def test_stop_and_short_results_resolve_every_request():
+    """توقف هنگام اجرای مدل و تعداد نتیجه نادرست نباید درخواستی را معلق بگذارد"""
+    release = asyncio.Event()
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+
+        def blocking_predict(df):
+            asyncio.run_coroutine_threadsafe(release.wait(), loop).result()
+            return [{'damage_type': 'No Damage', 'probability': 1.0}] * len(df)
+
+        batcher = MicroBatcher(blocking_predict, max_batch_size=4, max_latency_ms=1)
+        await batcher.start()
+        pending = [loop.create_task(batcher.submit({'Fluid_Loss_API': 0.0})) for _ in range(3)]
+        while not batcher._inflight:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        await batcher.stop()
+        stopped = await asyncio.wait_for(asyncio.gather(*pending, return_exceptions=True), timeout=2)
+        release.set()
+
+        short = MicroBatcher(lambda df: [{'damage_type': 'No Damage'}], max_batch_size=4, max_latency_ms=50)
+        await short.start()
+        mismatched = await asyncio.wait_for(asyncio.gather(
+            *(short.submit({'Fluid_Loss_API': 0.0}) for _ in range(3)), return_exceptions=True
+        ), timeout=2)
+        await short.stop()
+        return stopped, mismatched
+
+    stopped, mismatched = asyncio.run(scenario())
+
+    assert all(isinstance(r, RuntimeError) for r in stopped)
+    # هر رکورد تک‌تک دوباره اجرا و پاسخ داده می‌شود
+    assert mismatched == [{'damage_type': 'No Damage'}] * 3
+
+
+async def _http(port, method, path, payload=None):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    body = json.dumps(payload).encode() if payload is not None else b''
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: x\r\nContent-Length: {len(body)}\r\n"
+        "Connection: close\r\n\r\n".encode() + body
+    )
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, data = response.partition(b'\r\n\r\n')
+    return int(head.split()[1]), json.loads(data)
+
+
+def test_prediction_server_endpoints():
+    async def scenario():
+        server = PredictionServer(MicroBatcher(make_predict_fn([])), port=0)
+        await server.start()
+        try:
+            single = await _http(server.port, 'POST', '/predict', {'Fluid_Loss_API': 1.5})
+            many = await _http(server.port, 'POST', '/predict',
+                               {'records': [{'Fluid_Loss_API': 0.1}, {'Fluid_Loss_API': 3.0}]})
+            metrics = await _http(server.port, 'GET', '/metrics')
+            missing = await _http(server.port, 'GET', '/unknown')
+        finally:
+            await server.stop()
+        return single, many, metrics, missing
+
+    single, many, metrics, missing = asyncio.run(scenario())
+
+    assert single == (200, {'damage_type': 'Fluid Loss', 'probability': 1.0})
+    assert [p['damage_type'] for p in many[1]['predictions']] == ['No Damage', 'Fluid Loss']
+    assert metrics[1]['requests'] == 3
+    assert 'queue_depth' in metrics[1]
+    assert missing[0] == 404
+
+
+def test_malformed_request_gets_4xx():
+    async def raw(port, data):
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(data)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        return int(response.split()[1])
+
+    async def scenario():
+        server = PredictionServer(MicroBatcher(make_predict_fn([])), port=0, max_body_bytes=1000)
+        await server.start()
+        try:
+            bad_length = await raw(server.port, b"POST /predict HTTP/1.1\r\nContent-Length: ten\r\n\r\n")
+            bad_line = await raw(server.port, b"GARBAGE\r\n\r\n")
+            too_large = await raw(server.port, b"POST /predict HTTP/1.1\r\nContent-Length: 1000000000\r\n\r\n")
+            bad_records = [(await _http(server.port, 'POST', '/predict', payload))[0]
+                           for payload in ({'records': 5}, {'records': 'x'}, {'records': [1]})]
+        finally:
+            await server.stop()
+        return bad_length, bad_line, too_large, bad_records
+
+    assert asyncio.run(scenario()) == (400, 400, 413, [400, 400, 400])
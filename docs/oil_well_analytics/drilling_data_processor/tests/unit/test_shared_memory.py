@@ -0,0 +1,107 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from drilling_data_processor.drilling_processor.core import DrillingDataProcessor
+from drilling_data_processor.drilling_processor.storage.shared import (
+    SharedStore,
+    map_chunks,
+    map_wells,
+    well_slices
+)
+
+
+def _well_summary(df: pd.DataFrame):
+    """کار worker: باید در سطح ماژول باشد تا pickle شود"""
+    return len(df), float(df['Temperature_C'].sum())
+
+
+def _row_count(df: pd.DataFrame) -> int:
+    return len(df)
+
+
+@pytest.fixture
+def wells_frame():
+    rng = np.random.default_rng(0)
+    n = 600
+    return pd.DataFrame({
+        'API_Well_ID': np.repeat([3, 1, 2], n // 3)[rng.permutation(n)],
+        'DateTime': pd.date_range('2023-01-01', periods=n, freq='s'),
+        'Temperature_C': rng.normal(80, 5, n),
+        'Pressure_psi': rng.normal(5000, 100, n),
+        'Formation': pd.Categorical(rng.choice(['Shale', 'Sandstone'], n))
+    })
+
+
+def test_handle_is_small_and_reads_zero_copy(wells_frame, tmp_path):
+    with SharedStore(tmp_path) as store:
+        handle = store.put_frame(wells_frame)
+        assert len(pickle.dumps(handle)) < 500
+
+        result = pickle.loads(pickle.dumps(handle)).to_pandas()
+        pd.testing.assert_frame_equal(result, wells_frame)
+        assert not result['Temperature_C'].to_numpy().flags.writeable
+
+        part = handle.slice(100, 200).to_pandas(['Pressure_psi'])
+        assert part['Pressure_psi'].tolist() == wells_frame['Pressure_psi'].iloc[100:200].tolist()
+
+        matrix = store.put_array(wells_frame[['Temperature_C', 'Pressure_psi']].to_numpy())
+        np.testing.assert_array_equal(matrix.array(), wells_frame[['Temperature_C', 'Pressure_psi']].to_numpy())
+        directory = store.directory
+    assert not directory.exists()
+
+
+def test_well_slices_groups_rows_in_order(wells_frame):
+    import pyarrow as pa
+    table, slices = well_slices(pa.Table.from_pandas(wells_frame, preserve_index=False))
+
+    assert [well for well, _, _ in slices] == [1, 2, 3]
+    for well, start, stop in slices:
+        times = table['DateTime'].to_pandas().iloc[start:stop]
+        assert times.is_monotonic_increasing
+        assert len(times) == (wells_frame['API_Well_ID'] == well).sum()
+
+
+def test_map_wells_and_chunks_in_worker_processes(wells_frame, tmp_path):
+    results = map_wells(_well_summary, wells_frame, workers=2, directory=tmp_path)
+
+    expected = wells_frame.groupby('API_Well_ID')['Temperature_C'].agg(['size', 'sum'])
+    assert list(results) == [1, 2, 3]
+    for well, (rows, total) in results.items():
+        assert rows == expected.loc[well, 'size']
+        assert total == pytest.approx(expected.loc[well, 'sum'])
+
+    assert map_chunks(_row_count, wells_frame, chunk_rows=250, workers=2, directory=tmp_path) == [250, 250, 100]
+    assert not any(tmp_path.iterdir())
+
+
+@pytest.mark.parametrize('backend', ['pandas', 'arrow'])
+def test_processor_accepts_shared_frame(wells_frame, tmp_path, backend):
+    with SharedStore(tmp_path) as store:
+        handle = store.put_frame(wells_frame)
+        processor = DrillingDataProcessor(handle, config={'backend': backend})
+        processor.load_data()
+        assert len(processor.data) == len(wells_frame)
+        assert processor.source is handle
+
+
+@pytest.mark.parametrize('backend', ['pandas', 'arrow'])
+def test_processor_applies_ranges_to_shared_frame(wells_frame, tmp_path, backend):
+    """کلیدهای بازه برای منبع درون‌حافظه‌ای نادیده گرفته نمی‌شوند"""
+    config = {
+        'backend': backend,
+        'well_id': 2,
+        'time_range': ('2023-01-01 00:01:00', '2023-01-01 00:05:00')
+    }
+    expected = wells_frame[
+        (wells_frame['API_Well_ID'] == 2)
+        & wells_frame['DateTime'].between('2023-01-01 00:01:00', '2023-01-01 00:05:00')
+    ]
+    with SharedStore(tmp_path) as store:
+        processor = DrillingDataProcessor(store.put_frame(wells_frame), config=config)
+        processor.load_data()
+        assert processor.data['API_Well_ID'].eq(2).all()
+        assert len(processor.data) == len(expected) > 0
+        np.testing.assert_allclose(processor.data['Temperature_C'], expected['Temperature_C'], rtol=1e-6)
@@ -0,0 +1,106 @@
+import asyncio
+
+import numpy as np
+import pandas as pd
+
+import pytest
+
+from drilling_data_processor.drilling_processor.monitoring.drift import DriftMonitor, ReferenceProfile
+from drilling_data_processor.drilling_processor.streaming.engine import StreamingEngine
+from drilling_data_processor.drilling_processor.streaming.sources import (
+    QueueSource,
+    ReplaySource,
+    replay_directory
+)
+
+
+class ThresholdModel:
+    """مدل ساختگی: آسیب Fluid Loss وقتی Fluid_Loss_API > 1"""
+    classes_ = np.array(['Fluid Loss', 'No Damage'], dtype=object)
+
+    def __init__(self):
+        self.seen_columns = set()
+
+    def predict_proba(self, df):
+        self.seen_columns.update(df.columns)
+        damaged = (df['Fluid_Loss_API'] > 1.0).to_numpy(dtype=float)
+        return np.column_stack([damaged, 1 - damaged])
+
+
+def well_frame(well_id, n, spike_at=None):
+    df = pd.DataFrame({
+        'API_Well_ID': well_id,
+        'DateTime': pd.date_range('2023-01-01', periods=n, freq='s'),
+        'Reservoir_Temperature': np.full(n, 85.0),
+        'Pressure_Reservoir': np.full(n, 5000.0),
+        'Formation_Type': 'Sandstone',
+        'Fluid_Loss_API': np.full(n, 0.5)
+    })
+    df.loc[3, 'Reservoir_Temperature'] = np.nan
+    if spike_at is not None:
+        df.loc[spike_at:, 'Fluid_Loss_API'] = 2.0
+    return df
+
+
+def test_replay_all_wells_with_alerts(tmp_path):
+    """بازپخش هم‌زمان چند چاه با هشدار، ایمپوت و ساخت ویژگی"""
+    for well_id in range(10):
+        spike = 50 if well_id % 2 == 0 else None
+        well_frame(well_id, 100, spike).to_parquet(tmp_path / f"well_{well_id}.parquet")
+
+    model = ThresholdModel()
+    engine = StreamingEngine(model, alert_threshold=0.9, alert_cooldown_seconds=3600, engineer_features=True)
+    summary = asyncio.run(engine.run(replay_directory(tmp_path, speed=float('inf'))))
+
+    assert summary['records'] == 1000
+    assert summary['wells'] == 10
+    # یک هشدار برای هر چاه دارای آسیب به دلیل cooldown
+    assert sorted(a['well_id'] for a in engine.alerts) == [0, 2, 4, 6, 8]
+    assert all(a['latency_ms'] >= 0 for a in engine.alerts)
+    assert {'PT_Ratio', 'Sandstone_Flag'} <= model.seen_columns
+    assert summary['latency_p99_ms'] is not None
+    with pytest.raises(TypeError):
+        ReplaySource()
+
+
+def test_queue_source_incremental_imputation():
+    received = []
+
+    class RecordingModel(ThresholdModel):
+        def predict_proba(self, df):
+            received.append(df.copy())
+            return super().predict_proba(df)
+
+    async def scenario():
+        source = QueueSource()
+        engine = StreamingEngine(RecordingModel())
+        for i, temp in enumerate([80.0, 90.0, np.nan]):
+            source.put_nowait({'API_Well_ID': 1, 'DateTime': pd.Timestamp('2023-01-01') + pd.Timedelta(seconds=i),
+                               'Reservoir_Temperature': temp, 'Pressure_Reservoir': 5000.0,
+                               'Formation_Type': 'Shale', 'Fluid_Loss_API': 0.1})
+        await source.close()
+        return await engine.run([source])
+
+    summary = asyncio.run(scenario())
+
+    assert summary['records'] == 3
+    frame = pd.concat(received)
+    # بدون engineer_features ستون‌های FeatureEngineer ساخته نمی‌شوند
+    assert not {'PT_Ratio', 'Sandstone_Flag'} & set(frame.columns)
+    assert frame['Reservoir_Temperature'].tolist() == [80.0, 90.0, 85.0]
+
+
+def test_engine_checks_drift(tmp_path):
+    """موتور فقط `update` را صدا می‌زند؛ بررسی دوره‌ای و پایانی رانش را در خلاصه می‌آورد"""
+    profile = ReferenceProfile.from_frame(well_frame(0, 1000), numeric_features=['Fluid_Loss_API'])
+    for well_id in range(2):
+        well_frame(well_id, 1000, spike_at=0 if well_id else None).to_parquet(tmp_path / f"well_{well_id}.parquet")
+
+    with pytest.raises(ValueError):
+        StreamingEngine(ThresholdModel(), drift_monitor=DriftMonitor(profile))
+    monitor = DriftMonitor(profile, min_rows=100, check_every_rows=500, group_column='API_Well_ID')
+    engine = StreamingEngine(ThresholdModel(), drift_monitor=monitor)
+    summary = asyncio.run(engine.run(replay_directory(tmp_path, speed=float('inf'))))
+
+    assert summary['drifted_features'] == 1
+    assert {key[0] for key in monitor.drifted} == {1}
@@ -0,0 +1,79 @@
+import asyncio
+import json
+
+import pandas as pd
+import pytest
+
+from drilling_data_processor.drilling_processor.core import DrillingDataProcessor
+from drilling_data_processor.drilling_processor.schema import NUMERIC_FEATURES, CATEGORICAL_FEATURES
+from drilling_data_processor.drilling_processor.storage.index import WellIndex, index_path_for
+from drilling_data_processor.drilling_processor.streaming.sources import synthetic_sources
+from drilling_data_processor.drilling_processor.synthetic.generator import SyntheticWellGenerator
+from drilling_data_processor.drilling_processor.synthetic.scenario import Scenario
+
+
+def test_batches_are_lazy_reproducible_and_cover_time_span(synthetic_wells):
+    generator = synthetic_wells(n_wells=2, frame=False, duration='1h', rows_per_second=2, batch_rows=3000)
+    wells = generator.scenario.wells
+
+    batches = list(generator.iter_batches(interleave=True))
+    assert [b.num_rows for b in batches] == [3000, 3000, 3000, 3000, 1200, 1200]
+    assert [b['API_Well_ID'][0].as_py() for b in batches[:2]] == [1, 2]
+
+    df = generator.to_pandas(wells=[2])
+    assert len(df) == 7200
+    assert set(NUMERIC_FEATURES + CATEGORICAL_FEATURES) <= set(df.columns)
+    assert df['DateTime'].iloc[-1] - df['DateTime'].iloc[0] == pd.Timedelta(seconds=3599.5)
+
+    again = SyntheticWellGenerator(Scenario(wells=wells, duration='1h', rows_per_second=2, batch_rows=3000))
+    assert again.table(wells=[2]).equals(generator.table(wells=[2]))
+    assert not generator.table(wells=[1]).equals(SyntheticWellGenerator(
+        wells=wells, duration='1h', rows_per_second=2, batch_rows=3000, seed=7).table(wells=[1]))
+
+
+def test_scenario_validation_and_round_trip(synthetic_wells, tmp_path):
+    with pytest.raises(ValueError):
+        Scenario(records_per_well=10, duration='1D')
+    with pytest.raises(ValueError):
+        Scenario(wells=[])
+    for phase_days in [(100,), (200, 100), (100, 100), (1, 2, 3)]:
+        with pytest.raises(ValueError):
+            Scenario(phase_days=phase_days)
+    with pytest.raises(ValueError):
+        synthetic_wells(n_wells=2, frame=False, records_per_well=10).table(wells=[3])
+
+    scenario = Scenario(wells=synthetic_wells(n_wells=2, frame=False).scenario.wells, duration='2D', rows_per_second=0.01, phase_days=(1, 2))
+    path = tmp_path / 'scenario.json'
+    path.write_text(json.dumps(scenario.to_dict()))
+    loaded = Scenario.from_json(path)
+    assert loaded.records_per_well == 1728
+    df = SyntheticWellGenerator(loaded).to_pandas(wells=[1])
+    assert df['Phase_Operation'].astype(str).value_counts().to_dict() == {'Drilling': 864, 'Completion': 864}
+
+
+def test_processor_reads_generator_without_files(synthetic_wells):
+    generator = synthetic_wells(n_wells=2, frame=False, records_per_well=2000, column_set='processor')
+    processor = DrillingDataProcessor(generator, config={'remove_outliers': False})
+    processor.load_data()
+    result = processor.run_pipeline()
+
+    assert len(result) == 4000
+    assert {'PT_Ratio', 'Flow_Efficiency'} <= set(result.columns)
+    assert processor.file_path is None
+
+
+def test_write_parquet_and_streaming_source(synthetic_wells, tmp_path):
+    generator = synthetic_wells(n_wells=2, frame=False, records_per_well=2500, batch_rows=1000)
+
+    paths = generator.write_parquet(tmp_path)
+    assert [p.name for p in paths] == ['well_1.parquet', 'well_2.parquet']
+    assert len(WellIndex.load(index_path_for(paths[0])).row_groups) == 3
+
+    async def consume():
+        rows = 0
+        for source in synthetic_sources(generator, speed=float('inf')):
+            async for df, due in source:
+                rows += len(df)
+        return rows
+
+    assert asyncio.run(consume()) == 5000
@@ -0,0 +1,67 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from drilling_data_processor.drilling_processor.storage.tensor_store import TensorStore, WindowDataset
+
+FEATURES = ['Depth_Bit', 'Reservoir_Temperature', 'Mud_pH']
+
+
+@pytest.fixture(scope='module')
+def store(tmp_path_factory, synthetic_wells):
+    generator = synthetic_wells(frame=False, records_per_well=500, batch_rows=128, seed=0)
+    return TensorStore.build(generator, tmp_path_factory.mktemp('tensors'), features=FEATURES, batch_rows=100)
+
+
+def test_build_normalizes_and_fills_per_well(store, synthetic_wells):
+    df = synthetic_wells(records_per_well=500, batch_rows=128, seed=0)
+
+    assert store.rows == {'1': 500, '2': 500, '3': 500}
+    features, labels = store.arrays(2)
+    assert isinstance(features, np.memmap) and features.dtype == np.float32
+    expected = df.loc[df['API_Well_ID'] == 2, FEATURES].reset_index(drop=True)
+    expected = ((expected - store.mean) / store.scale).ffill().fillna(0)
+    np.testing.assert_allclose(features, expected.to_numpy(), rtol=1e-5, atol=1e-5)
+    assert store.classes == sorted(df['Type_Damage'].astype(str).unique())
+    decoded = np.asarray(store.classes)[labels]
+    assert (decoded == df.loc[df['API_Well_ID'] == 2, 'Type_Damage'].astype(str).to_numpy()).all()
+
+    other = TensorStore.build(df[df['API_Well_ID'] == 1], store.root_dir.parent / 'valid', normalization=store)
+    assert other.features == FEATURES
+    np.testing.assert_array_equal(other.scale, store.scale)
+
+
+def test_windows_are_zero_copy_views(store):
+    dataset = WindowDataset(store, window=16, stride=4, horizon=2, batch_size=50, shuffle=False)
+    features, labels = store.arrays(1)
+
+    view = dataset.window_view(1)
+    assert np.shares_memory(view, features)
+    assert view.shape == ((500 - 18) // 4 + 1, 16, len(FEATURES))
+    np.testing.assert_array_equal(view[3], features[12:28])
+    assert dataset.n_windows == 3 * len(view)
+
+    X, y = next(iter(dataset))
+    assert X.shape == (50, 16, len(FEATURES)) and X.dtype == np.float32
+    np.testing.assert_array_equal(X[10], features[40:56])
+    assert y[10] == labels[40 + 15 + 2]
+
+
+def test_shuffled_batches_span_wells(store):
+    dataset = WindowDataset(store, window=32, batch_size=64, seed=7)
+    batches = list(dataset)
+
+    assert len(batches) == len(dataset)
+    assert sum(len(y) for _, y in batches) == dataset.n_windows
+    X, _ = batches[0]
+    sources = {well for row in X for well in store.wells
+               if (dataset.window_view(well) == row).all(axis=(1, 2)).any()}
+    assert len(sources) > 1
+
+    with pytest.raises(ValueError):
+        WindowDataset(store, window=0)
+    with pytest.raises(ValueError):
+        TensorStore(store.root_dir / 'missing')
+    with pytest.raises(ValueError):
+        TensorStore.build(pd.DataFrame(columns=['API_Well_ID', 'Type_Damage'] + FEATURES),
+                          store.root_dir.parent / 'empty', features=FEATURES)